@@ -0,0 +1,180 @@
+-- ============================================================================
+-- Migration: Set-based maintenance functions for unusual options signals
+-- Source of truth: db/schema/05_unusual_options.sql.
+-- ============================================================================
+
+-- Count occurrences of each value as a JSON object ({"value": count})
+CREATE OR REPLACE FUNCTION uo_count_values(p_values TEXT[])
+RETURNS JSONB AS $$
+  SELECT COALESCE(jsonb_object_agg(value, n), '{}'::JSONB)
+  FROM (
+    SELECT value, COUNT(*) AS n
+    FROM unnest(p_values) AS value
+    WHERE value IS NOT NULL
+    GROUP BY value
+  ) counts;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Active / inactive signal counts for maintenance reports
+CREATE OR REPLACE FUNCTION uo_signal_activity_counts(
+  p_as_of DATE DEFAULT CURRENT_DATE
+) RETURNS JSONB AS $$
+  SELECT jsonb_build_object(
+    'active', COUNT(*) FILTER (WHERE is_active),
+    'inactive_expired', COUNT(*) FILTER (WHERE NOT is_active AND expiry < p_as_of),
+    'inactive_not_expired', COUNT(*) FILTER (WHERE NOT is_active AND expiry >= p_as_of)
+  )
+  FROM unusual_options_signals;
+$$ LANGUAGE sql STABLE;
+
+-- Expire active signals whose contracts expired on or before p_as_of.
+-- Returns aggregated counts only; p_dry_run reports without updating.
+CREATE OR REPLACE FUNCTION expire_uo_signals(
+  p_as_of DATE DEFAULT CURRENT_DATE,
+  p_dry_run BOOLEAN DEFAULT FALSE
+) RETURNS JSONB AS $$
+DECLARE
+  v_summary JSONB;
+  v_count INTEGER := 0;
+BEGIN
+  SELECT jsonb_build_object(
+    'signals_found', COUNT(*),
+    'by_expiry', uo_count_values(array_agg(expiry::TEXT)),
+    'by_grade', uo_count_values(array_agg(grade)),
+    'by_ticker', uo_count_values(array_agg(ticker))
+  )
+  INTO v_summary
+  FROM unusual_options_signals
+  WHERE is_active = TRUE
+    AND expiry <= p_as_of;
+
+  IF NOT p_dry_run THEN
+    UPDATE unusual_options_signals
+    SET is_active = FALSE, updated_at = NOW()
+    WHERE is_active = TRUE
+      AND expiry <= p_as_of;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+  END IF;
+
+  RETURN v_summary || jsonb_build_object(
+    'signals_expired', v_count,
+    'dry_run', p_dry_run,
+    'date', p_as_of
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+-- Deactivate (or delete) active signals below the noise thresholds:
+-- DTE under p_min_dte, or premium under the threshold for the ticker's
+-- volume tier. Each noisy signal is counted under its first failing rule.
+CREATE OR REPLACE FUNCTION cleanup_uo_noise(
+  p_high_volume_tickers TEXT[],
+  p_min_dte INTEGER DEFAULT 7,
+  p_min_premium NUMERIC DEFAULT 500000,
+  p_min_premium_high_volume NUMERIC DEFAULT 3000000,
+  p_hard_delete BOOLEAN DEFAULT FALSE,
+  p_dry_run BOOLEAN DEFAULT FALSE
+) RETURNS JSONB AS $$
+DECLARE
+  v_summary JSONB;
+  v_count INTEGER := 0;
+BEGIN
+  SELECT jsonb_build_object(
+    'total_active', COUNT(*),
+    'signals_found', COUNT(reason),
+    'breakdown', jsonb_build_object(
+      'short_dte', COUNT(*) FILTER (WHERE reason = 'short_dte'),
+      'low_premium_high_vol', COUNT(*) FILTER (WHERE reason = 'low_premium_high_vol'),
+      'low_premium_normal', COUNT(*) FILTER (WHERE reason = 'low_premium_normal')
+    )
+  )
+  INTO v_summary
+  FROM (
+    SELECT CASE
+      WHEN COALESCE(days_to_expiry, 0) < p_min_dte THEN 'short_dte'
+      WHEN ticker = ANY(p_high_volume_tickers) THEN
+        CASE
+          WHEN COALESCE(premium_flow, 0) < p_min_premium_high_volume
+            THEN 'low_premium_high_vol'
+        END
+      WHEN COALESCE(premium_flow, 0) < p_min_premium THEN 'low_premium_normal'
+    END AS reason
+    FROM unusual_options_signals
+    WHERE is_active = TRUE
+  ) classified;
+
+  IF NOT p_dry_run THEN
+    IF p_hard_delete THEN
+      DELETE FROM unusual_options_signals
+      WHERE is_active = TRUE
+        AND (
+          COALESCE(days_to_expiry, 0) < p_min_dte
+          OR COALESCE(premium_flow, 0) < CASE
+            WHEN ticker = ANY(p_high_volume_tickers) THEN p_min_premium_high_volume
+            ELSE p_min_premium
+          END
+        );
+    ELSE
+      UPDATE unusual_options_signals
+      SET is_active = FALSE, updated_at = NOW()
+      WHERE is_active = TRUE
+        AND (
+          COALESCE(days_to_expiry, 0) < p_min_dte
+          OR COALESCE(premium_flow, 0) < CASE
+            WHEN ticker = ANY(p_high_volume_tickers) THEN p_min_premium_high_volume
+            ELSE p_min_premium
+          END
+        );
+    END IF;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+  END IF;
+
+  RETURN v_summary || jsonb_build_object(
+    'signals_cleaned', v_count,
+    'dry_run', p_dry_run,
+    'hard_delete', p_hard_delete
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+-- Reactivate inactive signals whose contracts have not expired and that
+-- were detected since p_detected_since (undoes premature deactivation).
+CREATE OR REPLACE FUNCTION reactivate_uo_signals(
+  p_detected_since TIMESTAMPTZ,
+  p_as_of DATE DEFAULT CURRENT_DATE,
+  p_dry_run BOOLEAN DEFAULT FALSE
+) RETURNS JSONB AS $$
+DECLARE
+  v_summary JSONB;
+  v_count INTEGER := 0;
+BEGIN
+  SELECT jsonb_build_object(
+    'signals_found', COUNT(*),
+    'by_grade', uo_count_values(array_agg(grade)),
+    'by_ticker', uo_count_values(array_agg(ticker)),
+    'by_expiry', uo_count_values(array_agg(expiry::TEXT))
+  )
+  INTO v_summary
+  FROM unusual_options_signals
+  WHERE is_active = FALSE
+    AND expiry >= p_as_of
+    AND last_detected_at >= p_detected_since;
+
+  IF NOT p_dry_run THEN
+    UPDATE unusual_options_signals
+    SET is_active = TRUE, updated_at = NOW()
+    WHERE is_active = FALSE
+      AND expiry >= p_as_of
+      AND last_detected_at >= p_detected_since;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+  END IF;
+
+  RETURN v_summary || jsonb_build_object(
+    'signals_reactivated', v_count,
+    'dry_run', p_dry_run
+  );
+END;
+$$ LANGUAGE plpgsql;
@@ -32,17 +32,17 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 
-import yfinance as yf
+import numpy as np
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from unusual_options.config import load_config
+from unusual_options.data.prices import PriceHistory, directional_wins
 from unusual_options.storage.database import get_storage
 from unusual_options.storage.models import (
     CLASSIFICATION_WIN_RATES,
@@ -56,9 +56,6 @@ console = Console()
 WIN_THRESHOLD_1D = 0.01  # 1% for 1-day
 WIN_THRESHOLD_5D = 0.02  # 2% for 5-day
 
-# Cache for price data
-PRICE_CACHE: dict[str, dict[str, float]] = {}
-
 
 @dataclass
 class SignalOutcome:
@@ -105,115 +102,13 @@ class ClassificationStats:
     prediction_accuracy: float | None  # How close predicted vs actual
 
 
-def get_historical_prices(
-    ticker: str, start_date: date, end_date: date
-) -> dict[str, float]:
-    """Get historical prices for a ticker."""
-    cache_key = f"{ticker}_{start_date}_{end_date}"
-    if cache_key in PRICE_CACHE:
-        return PRICE_CACHE[cache_key]
-
-    try:
-        yf_ticker = yf.Ticker(ticker)
-        hist = yf_ticker.history(
-            start=start_date, end=end_date + timedelta(days=1), interval="1d"
-        )
-
-        if hist.empty:
-            return {}
-
-        prices = {}
-        for idx, row in hist.iterrows():
-            date_str = idx.strftime("%Y-%m-%d")
-            prices[date_str] = row["Close"]
-
-        PRICE_CACHE[cache_key] = prices
-        return prices
-
-    except Exception as e:
-        console.print(f"[dim]Error fetching {ticker}: {e}[/dim]")
-        return {}
-
-
-def get_trading_day_offset(
-    base_date: date, offset_days: int, prices: dict[str, float]
-) -> str | None:
-    """Find the trading day that is approximately offset_days after."""
-    target_date = base_date + timedelta(days=offset_days)
-
-    date_str = target_date.strftime("%Y-%m-%d")
-    if date_str in prices:
-        return date_str
-
-    for i in range(1, 6):
-        check_date = target_date + timedelta(days=i)
-        date_str = check_date.strftime("%Y-%m-%d")
-        if date_str in prices:
-            return date_str
-
-    return None
-
-
-def calculate_signal_outcome(
-    signal: UnusualOptionsSignal, prices: dict[str, float]
-) -> SignalOutcome:
-    """Calculate outcome metrics for a single signal."""
-
-    outcome = SignalOutcome(signal=signal)
-    detection_date = signal.detection_timestamp.date()
-    outcome.days_since_detection = (date.today() - detection_date).days
-
-    # Get price at detection
-    detection_str = detection_date.strftime("%Y-%m-%d")
-    if detection_str in prices:
-        outcome.price_at_detection = prices[detection_str]
-    else:
-        next_day = get_trading_day_offset(detection_date, 1, prices)
-        if next_day:
-            outcome.price_at_detection = prices[next_day]
-
-    if not outcome.price_at_detection:
-        outcome.data_available = False
-        outcome.error_message = "No price at detection"
-        return outcome
-
-    # Get 1-day later price
-    day_1 = get_trading_day_offset(detection_date, 1, prices)
-    if day_1 and day_1 in prices:
-        outcome.price_1d_later = prices[day_1]
-        outcome.return_1d = (
-            outcome.price_1d_later - outcome.price_at_detection
-        ) / outcome.price_at_detection
-
-        # Classify win/loss for 1d
-        if signal.option_type == "call":
-            outcome.win_1d = outcome.return_1d >= WIN_THRESHOLD_1D
-        else:  # put
-            outcome.win_1d = outcome.return_1d <= -WIN_THRESHOLD_1D
-
-    # Get 5-day later price
-    day_5 = get_trading_day_offset(detection_date, 5, prices)
-    if day_5 and day_5 in prices:
-        outcome.price_5d_later = prices[day_5]
-        outcome.return_5d = (
-            outcome.price_5d_later - outcome.price_at_detection
-        ) / outcome.price_at_detection
-
-        # Classify win/loss for 5d
-        if signal.option_type == "call":
-            outcome.win_5d = outcome.return_5d >= WIN_THRESHOLD_5D
-        else:  # put
-            outcome.win_5d = outcome.return_5d <= -WIN_THRESHOLD_5D
-
-    return outcome
-
-
 class ClassificationValidator:
     """Validate classification system against actual outcomes."""
 
     def __init__(self):
         self.config = load_config()
         self.storage = get_storage(self.config)
+        self.price_history = PriceHistory(self.config)
         self.signals: list[UnusualOptionsSignal] = []
         self.outcomes: list[SignalOutcome] = []
 
@@ -247,41 +142,47 @@ class ClassificationValidator:
             console.print(f"  [dim]{cls}: {count}[/dim]")
 
     def calculate_all_outcomes(self) -> None:
-        """Calculate outcomes for all signals."""
+        """Calculate outcomes for all signals in one vectorized pass."""
+        if not self.signals:
+            return
 
-        by_ticker = defaultdict(list)
-        for signal in self.signals:
-            by_ticker[signal.ticker].append(signal)
+        tickers = [s.ticker for s in self.signals]
+        dates = [s.detection_timestamp.date() for s in self.signals]
 
         console.print(
-            f"[blue]Calculating outcomes for {len(by_ticker)} tickers...[/blue]"
+            f"[blue]Calculating outcomes for {len(set(tickers))} tickers...[/blue]"
         )
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Processing...", total=len(by_ticker))
-
-            for ticker, ticker_signals in by_ticker.items():
-                progress.update(task, description=f"Processing {ticker}...")
-
-                # Get date range
-                dates = [s.detection_timestamp.date() for s in ticker_signals]
-                min_date = min(dates) - timedelta(days=1)
-                max_date = max(dates) + timedelta(days=10)
-
-                if max_date > date.today():
-                    max_date = date.today()
+        # One bulk download (or cache read) covers every ticker
+        with console.status("Loading price history..."):
+            self.price_history.load(
+                tickers, min(dates) - timedelta(days=1), date.today()
+            )
 
-                prices = get_historical_prices(ticker, min_date, max_date)
+        fr = self.price_history.forward_returns(tickers, dates, horizons=(1, 5))
+        is_call = np.array([s.option_type == "call" for s in self.signals])
+        win_1d = directional_wins(fr.returns[1], is_call, WIN_THRESHOLD_1D)
+        win_5d = directional_wins(fr.returns[5], is_call, WIN_THRESHOLD_5D)
 
-                for signal in ticker_signals:
-                    outcome = calculate_signal_outcome(signal, prices)
-                    self.outcomes.append(outcome)
+        today = date.today()
+        for i, signal in enumerate(self.signals):
+            outcome = SignalOutcome(
+                signal=signal, days_since_detection=(today - dates[i]).days
+            )
 
-                progress.advance(task)
+            if not fr.has_base[i]:
+                outcome.data_available = False
+                outcome.error_message = "No price at detection"
+            else:
+                outcome.price_at_detection = fr.value(fr.base_price, i)
+                outcome.price_1d_later = fr.value(fr.prices[1], i)
+                outcome.price_5d_later = fr.value(fr.prices[5], i)
+                outcome.return_1d = fr.value(fr.returns[1], i)
+                outcome.return_5d = fr.value(fr.returns[5], i)
+                outcome.win_1d = win_1d[i]
+                outcome.win_5d = win_5d[i]
+
+            self.outcomes.append(outcome)
 
     def get_stats_by_classification(self) -> dict[str, ClassificationStats]:
         """Calculate performance statistics by classification."""
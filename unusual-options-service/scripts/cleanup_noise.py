@@ -7,7 +7,8 @@ This script marks low-quality signals as inactive based on:
 3. Low premium for high-volume tickers (< $3M)
 
 Should be run once to clean historical data, then new scans will
-apply these filters automatically.
+apply these filters automatically. Requires the cleanup_uo_noise()
+function from db/migrations/004_create_uo_maintenance_functions.sql.
 """
 
 import os
@@ -103,6 +104,9 @@ def cleanup_noise(dry_run: bool = False, hard_delete: bool = False) -> dict:
     """
     Clean up noisy signals that don't meet quality thresholds.
 
+    Classification and the update (or delete) run server-side in one
+    cleanup_uo_noise() call that returns only aggregated counts.
+
     Args:
         dry_run: If True, only report what would be cleaned
         hard_delete: If True, permanently delete instead of soft delete
@@ -112,71 +116,45 @@ def cleanup_noise(dry_run: bool = False, hard_delete: bool = False) -> dict:
     """
     client = get_client()
 
-    logger.info("Fetching all active signals...")
-
-    # Fetch all signals in batches
-    all_signals = []
-    batch_size = 1000
-    offset = 0
-
-    while True:
-        result = (
-            client.table("unusual_options_signals")
-            .select("signal_id, ticker, days_to_expiry, premium_flow, grade")
-            .eq("is_active", True)
-            .range(offset, offset + batch_size - 1)
-            .execute()
-        )
-
-        if not result.data:
-            break
-        all_signals.extend(result.data)
-        offset += batch_size
-
-        if len(result.data) < batch_size:
-            break
-
-    logger.info(f"Found {len(all_signals):,} active signals")
-
-    # Identify noisy signals
-    noise_dte = []  # Short DTE
-    noise_premium_high_vol = []  # Low premium on high-vol tickers
-    noise_premium_normal = []  # Low premium on normal tickers
-
-    for signal in all_signals:
-        signal_id = signal["signal_id"]
-        ticker = signal.get("ticker", "")
-        dte = signal.get("days_to_expiry") or 0
-        premium = signal.get("premium_flow") or 0
-        is_high_vol = ticker in HIGH_VOLUME_TICKERS
-
-        # Check DTE
-        if dte < MIN_DTE:
-            noise_dte.append(signal_id)
-            continue
-
-        # Check premium threshold
-        if is_high_vol and premium < PREMIUM_THRESHOLD_HIGH_VOL:
-            noise_premium_high_vol.append(signal_id)
-        elif not is_high_vol and premium < PREMIUM_THRESHOLD_NORMAL:
-            noise_premium_normal.append(signal_id)
-
-    # Combine all noise signal IDs
-    all_noise = set(noise_dte + noise_premium_high_vol + noise_premium_normal)
+    logger.info("Classifying active signals...")
+
+    result = client.rpc(
+        "cleanup_uo_noise",
+        {
+            "p_high_volume_tickers": sorted(HIGH_VOLUME_TICKERS),
+            "p_min_dte": MIN_DTE,
+            "p_min_premium": PREMIUM_THRESHOLD_NORMAL,
+            "p_min_premium_high_volume": PREMIUM_THRESHOLD_HIGH_VOL,
+            "p_hard_delete": hard_delete,
+            "p_dry_run": dry_run,
+        },
+    ).execute()
+    summary = result.data or {}
+
+    total_active = summary.get("total_active", 0)
+    signals_found = summary.get("signals_found", 0)
+    breakdown = summary.get("breakdown") or {}
 
     logger.info("\n" + "=" * 60)
     logger.info("NOISE CLEANUP SUMMARY")
     logger.info("=" * 60)
-    logger.info(f"\nTotal active signals:     {len(all_signals):,}")
-    logger.info(f"Signals to clean up:      {len(all_noise):,}")
-    logger.info(f"Signals to keep:          {len(all_signals) - len(all_noise):,}")
+    logger.info(f"\nTotal active signals:     {total_active:,}")
+    logger.info(f"Signals to clean up:      {signals_found:,}")
+    logger.info(f"Signals to keep:          {total_active - signals_found:,}")
     logger.info("\nBreakdown:")
-    logger.info(f"  - Short DTE (<{MIN_DTE} days):           {len(noise_dte):,}")
-    logger.info(f"  - Low premium high-vol (<$3M):   {len(noise_premium_high_vol):,}")
-    logger.info(f"  - Low premium normal (<$500K):   {len(noise_premium_normal):,}")
+    logger.info(
+        f"  - Short DTE (<{MIN_DTE} days):           {breakdown.get('short_dte', 0):,}"
+    )
+    logger.info(
+        f"  - Low premium high-vol (<$3M):   "
+        f"{breakdown.get('low_premium_high_vol', 0):,}"
+    )
+    logger.info(
+        f"  - Low premium normal (<$500K):   {breakdown.get('low_premium_normal', 0):,}"
+    )
     logger.info("=" * 60)
 
-    if not all_noise:
+    if not signals_found:
         logger.info("No noisy signals found - database is clean!")
         return {
             "success": True,
@@ -185,68 +163,23 @@ def cleanup_noise(dry_run: bool = False, hard_delete: bool = False) -> dict:
             "dry_run": dry_run,
         }
 
-    # Perform cleanup
-    if not dry_run:
-        action = "Deleting" if hard_delete else "Marking as inactive"
-        logger.info(f"\n{action} {len(all_noise):,} noisy signals...")
-
-        signal_ids = list(all_noise)
-        batch_size = 500
-        total_cleaned = 0
-
-        for i in range(0, len(signal_ids), batch_size):
-            batch = signal_ids[i : i + batch_size]
-
-            if hard_delete:
-                result = (
-                    client.table("unusual_options_signals")
-                    .delete()
-                    .in_("signal_id", batch)
-                    .execute()
-                )
-            else:
-                result = (
-                    client.table("unusual_options_signals")
-                    .update({"is_active": False})
-                    .in_("signal_id", batch)
-                    .execute()
-                )
-
-            if result.data:
-                total_cleaned += len(result.data)
-
-            # Progress update
-            progress = min(i + batch_size, len(signal_ids))
-            logger.debug(f"Progress: {progress:,}/{len(signal_ids):,}")
-
-        action_past = "deleted" if hard_delete else "marked inactive"
-        logger.success(f"\n✓ Successfully {action_past} {total_cleaned:,} signals")
-
-        return {
-            "success": True,
-            "signals_found": len(all_noise),
-            "signals_cleaned": total_cleaned,
-            "breakdown": {
-                "short_dte": len(noise_dte),
-                "low_premium_high_vol": len(noise_premium_high_vol),
-                "low_premium_normal": len(noise_premium_normal),
-            },
-            "dry_run": False,
-            "hard_delete": hard_delete,
-        }
+    signals_cleaned = summary.get("signals_cleaned", 0)
+    if dry_run:
+        logger.info(f"\n[DRY RUN] Would clean up {signals_found:,} signals")
     else:
-        logger.info(f"\n[DRY RUN] Would clean up {len(all_noise):,} signals")
-        return {
-            "success": True,
-            "signals_found": len(all_noise),
-            "signals_cleaned": 0,
-            "breakdown": {
-                "short_dte": len(noise_dte),
-                "low_premium_high_vol": len(noise_premium_high_vol),
-                "low_premium_normal": len(noise_premium_normal),
-            },
-            "dry_run": True,
-        }
+        action_past = "deleted" if hard_delete else "marked inactive"
+        logger.success(f"\n✓ Successfully {action_past} {signals_cleaned:,} signals")
+
+    stats = {
+        "success": True,
+        "signals_found": signals_found,
+        "signals_cleaned": signals_cleaned,
+        "breakdown": breakdown,
+        "dry_run": dry_run,
+    }
+    if not dry_run:
+        stats["hard_delete"] = hard_delete
+    return stats
 
 
 def main():
@@ -3,6 +3,9 @@ Expire signals that have reached their expiration date.
 
 This script marks options signals as inactive when their expiry date
 has passed. Should be run daily after market close (4:30 PM ET).
+
+Requires the expire_uo_signals() function from
+db/migrations/004_create_uo_maintenance_functions.sql.
 """
 
 import os
@@ -31,6 +34,7 @@ except ImportError:
     logger.debug("python-dotenv not installed, using system env vars")
 
 from unusual_options.storage.database import SupabaseStorage
+from unusual_options.storage.models import GRADE_ORDER
 
 
 def setup_logging():
@@ -82,6 +86,10 @@ def expire_signals(dry_run: bool = False) -> dict:
     """
     Expire signals that have passed their expiration date.
 
+    The update runs server-side in one expire_uo_signals() call, which
+    returns only aggregated counts, so the job costs one round trip no
+    matter how many signals it touches.
+
     Args:
         dry_run: If True, only report what would be expired
                  without making changes
@@ -96,18 +104,15 @@ def expire_signals(dry_run: bool = False) -> dict:
     today = date.today()
     logger.info(f"Checking for expired signals as of {today}")
 
-    # Query signals that are active but have expired
     try:
-        # Get all active signals with expiry <= today
-        result = (
-            client.table("unusual_options_signals")
-            .select("signal_id, ticker, option_symbol, expiry, grade, overall_score")
-            .eq("is_active", True)
-            .lte("expiry", today.isoformat())
-            .execute()
-        )
-
-        if not result.data:
+        result = client.rpc(
+            "expire_uo_signals",
+            {"p_as_of": today.isoformat(), "p_dry_run": dry_run},
+        ).execute()
+        summary = result.data or {}
+
+        signals_found = summary.get("signals_found", 0)
+        if not signals_found:
             logger.info("No expired signals found")
             return {
                 "success": True,
@@ -117,22 +122,11 @@ def expire_signals(dry_run: bool = False) -> dict:
                 "date": today.isoformat(),
             }
 
-        expired_signals = result.data
-        logger.info(f"Found {len(expired_signals)} expired signals")
-
-        # Group by expiry date for reporting
-        by_expiry = {}
-        by_ticker = {}
-        by_grade = {}
-
-        for signal in expired_signals:
-            expiry = signal["expiry"]
-            ticker = signal["ticker"]
-            grade = signal["grade"]
+        by_expiry = summary.get("by_expiry") or {}
+        by_ticker = summary.get("by_ticker") or {}
+        by_grade = summary.get("by_grade") or {}
 
-            by_expiry[expiry] = by_expiry.get(expiry, 0) + 1
-            by_ticker[ticker] = by_ticker.get(ticker, 0) + 1
-            by_grade[grade] = by_grade.get(grade, 0) + 1
+        logger.info(f"Found {signals_found:,} expired signals")
 
         # Report statistics
         logger.info("\n" + "=" * 60)
@@ -147,7 +141,7 @@ def expire_signals(dry_run: bool = False) -> dict:
         logger.info("\nBy Grade:")
         for grade in sorted(
             by_grade.keys(),
-            key=lambda x: {"S": 6, "A": 5, "B": 4, "C": 3, "D": 2, "F": 1}.get(x, 0),
+            key=lambda x: GRADE_ORDER.get(x, 0),
             reverse=True,
         ):
             count = by_grade[grade]
@@ -160,59 +154,22 @@ def expire_signals(dry_run: bool = False) -> dict:
 
         logger.info("=" * 60)
 
-        # Expire the signals
-        if not dry_run:
-            logger.info(f"\nMarking {len(expired_signals)} signals as inactive...")
-
-            # Update in batches
-            batch_size = 500
-            total_updated = 0
-
-            signal_ids = [s["signal_id"] for s in expired_signals]
-
-            for i in range(0, len(signal_ids), batch_size):
-                batch = signal_ids[i : i + batch_size]
-
-                update_result = (
-                    client.table("unusual_options_signals")
-                    .update({"is_active": False})
-                    .in_("signal_id", batch)
-                    .execute()
-                )
-
-                if update_result.data:
-                    batch_count = len(update_result.data)
-                    total_updated += batch_count
-                    logger.debug(
-                        f"Updated batch {i // batch_size + 1}: {batch_count} signals"
-                    )
-
-            logger.success(f"✓ Successfully expired {total_updated:,} signals")
-
-            return {
-                "success": True,
-                "signals_found": len(expired_signals),
-                "signals_expired": total_updated,
-                "by_expiry": by_expiry,
-                "by_ticker": by_ticker,
-                "by_grade": by_grade,
-                "dry_run": False,
-                "date": today.isoformat(),
-            }
+        signals_expired = summary.get("signals_expired", 0)
+        if dry_run:
+            logger.info(f"\n[DRY RUN] Would have expired {signals_found:,} signals")
         else:
-            logger.info(
-                f"\n[DRY RUN] Would have expired {len(expired_signals):,} signals"
-            )
-            return {
-                "success": True,
-                "signals_found": len(expired_signals),
-                "signals_expired": 0,
-                "by_expiry": by_expiry,
-                "by_ticker": by_ticker,
-                "by_grade": by_grade,
-                "dry_run": True,
-                "date": today.isoformat(),
-            }
+            logger.success(f"✓ Successfully expired {signals_expired:,} signals")
+
+        return {
+            "success": True,
+            "signals_found": signals_found,
+            "signals_expired": signals_expired,
+            "by_expiry": by_expiry,
+            "by_ticker": by_ticker,
+            "by_grade": by_grade,
+            "dry_run": dry_run,
+            "date": today.isoformat(),
+        }
 
     except Exception as e:
         logger.error(f"Error expiring signals: {e}")
@@ -31,11 +31,28 @@ from rich.panel import Panel
 from rich.table import Table
 
 from unusual_options.config import load_config
-from unusual_options.storage.database import get_storage
 from unusual_options.storage.models import UnusualOptionsSignal
+from unusual_options.storage.signal_store import SignalQuery, get_signal_store
 
 console = Console()
 
+# Signal columns this report reads
+REPORT_COLUMNS = (
+    "ticker",
+    "option_symbol",
+    "strike",
+    "expiry",
+    "option_type",
+    "days_to_expiry",
+    "moneyness",
+    "underlying_price",
+    "premium_flow",
+    "aggressive_order_pct",
+    "overall_score",
+    "grade",
+    "detection_timestamp",
+)
+
 # Known hedge targets
 MEGA_CAPS = {
     "AAPL",
@@ -120,7 +137,7 @@ class HedgeAnalyzer:
 
     def __init__(self):
         self.config = load_config()
-        self.storage = get_storage(self.config)
+        self.signal_store = get_signal_store(self.config)
         self.signals: list[UnusualOptionsSignal] = []
         self.analyses: dict[str, HedgeAnalysis] = {}
 
@@ -133,8 +150,13 @@ class HedgeAnalyzer:
         end_date = datetime.now().date() + timedelta(days=1)
         start_date = end_date - timedelta(days=days + 1)
 
-        self.signals = await self.storage.get_signals(
-            min_grade=min_grade, start_date=start_date, end_date=end_date, limit=10000
+        self.signals = await self.signal_store.fetch_signals(
+            SignalQuery(
+                min_grade=min_grade,
+                start_date=start_date,
+                end_date=end_date,
+                columns=REPORT_COLUMNS,
+            )
         )
 
         console.print(f"[green]✓ Loaded {len(self.signals)} signals[/green]")
@@ -14,70 +14,45 @@ Goal: Find these plays BEFORE the news drops, so we can follow the smart money
 
 import asyncio
 import os
-import statistics
 import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import date, datetime, timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
-import yfinance as yf
-
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+import numpy as np
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from unusual_options.config import load_config
-from unusual_options.storage.database import get_storage
+from unusual_options.data.earnings import get_earnings_calendar
+from unusual_options.storage.batch import SignalBatch
 from unusual_options.storage.models import UnusualOptionsSignal
+from unusual_options.storage.signal_store import SignalQuery, get_signal_store
 
 console = Console()
 
-# Cache for earnings dates to avoid repeated API calls
-EARNINGS_CACHE: dict[str, date | None] = {}
-
-
-def get_earnings_date(ticker: str) -> date | None:
-    """Get next earnings date for a ticker using yfinance (with caching)"""
-    if ticker in EARNINGS_CACHE:
-        return EARNINGS_CACHE[ticker]
-
-    try:
-        yf_ticker = yf.Ticker(ticker)
-        calendar = yf_ticker.calendar
-
-        if calendar and "Earnings Date" in calendar:
-            earnings_dates = calendar["Earnings Date"]
-            if isinstance(earnings_dates, list) and len(earnings_dates) > 0:
-                # Get the first (next) earnings date
-                next_earnings = earnings_dates[0]
-                EARNINGS_CACHE[ticker] = next_earnings
-                return next_earnings
-            elif isinstance(earnings_dates, date):
-                EARNINGS_CACHE[ticker] = earnings_dates
-                return earnings_dates
-    except Exception:
-        # Silently fail - not all tickers have earnings data
-        pass
-
-    EARNINGS_CACHE[ticker] = None
-    return None
-
-
-def days_to_earnings(ticker: str, reference_date: date = None) -> int | None:
-    """Calculate days until next earnings date"""
-    if reference_date is None:
-        reference_date = date.today()
-
-    earnings_date = get_earnings_date(ticker)
-    if earnings_date:
-        delta = (earnings_date - reference_date).days
-        return delta if delta >= 0 else None
-    return None
-
+# Signal columns this report reads
+REPORT_COLUMNS = (
+    "ticker",
+    "option_symbol",
+    "strike",
+    "option_type",
+    "days_to_expiry",
+    "moneyness",
+    "underlying_price",
+    "current_volume",
+    "current_oi",
+    "premium_flow",
+    "aggressive_order_pct",
+    "overall_score",
+    "grade",
+    "detection_timestamp",
+)
 
 # Mega-cap tickers that always have huge options flow (exclude from scaling detection)
 MEGA_CAPS = {
@@ -187,12 +162,63 @@ class InsiderPlay:
         self.why_interesting.append(reason)
 
 
+@dataclass
+class SignalFrame:
+    """
+    Columns the detectors read, derived once per run from the signal batch.
+
+    Missing premium / aggressive % are NaN (they never pass a threshold),
+    and tickers carry integer group codes for bincount aggregations.
+    """
+
+    ticker: np.ndarray
+    ticker_code: np.ndarray
+    option_type: np.ndarray
+    moneyness: np.ndarray
+    grade: np.ndarray
+    strike: np.ndarray
+    premium: np.ndarray
+    dte: np.ndarray
+    volume: np.ndarray
+    oi: np.ndarray
+    aggressive: np.ndarray
+    is_mega: np.ndarray
+    surprise: np.ndarray
+
+    @classmethod
+    def from_batch(cls, batch: SignalBatch) -> "SignalFrame":
+        ticker = batch.column("ticker").astype(str)
+        _, ticker_code = np.unique(ticker, return_inverse=True)
+        return cls(
+            ticker=ticker,
+            ticker_code=ticker_code,
+            option_type=batch.column("option_type").astype(str),
+            moneyness=batch.column("moneyness").astype(str),
+            grade=batch.column("grade").astype(str),
+            strike=batch.column("strike"),
+            premium=batch.column("premium_flow"),
+            dte=batch.column("days_to_expiry"),
+            volume=batch.column("current_volume"),
+            oi=batch.column("current_oi"),
+            aggressive=batch.column("aggressive_order_pct"),
+            is_mega=np.isin(ticker, list(MEGA_CAPS)),
+            surprise=np.zeros(len(batch)),
+        )
+
+
+def _bonus(suspicion: np.ndarray, mask: np.ndarray, factor: float) -> np.ndarray:
+    """Apply a capped multiplier where mask is set"""
+    return np.where(mask, np.minimum(suspicion * factor, 100), suspicion)
+
+
 class InsiderPlayDetector:
     def __init__(self):
         self.config = load_config()
-        self.storage = get_storage(self.config)
-        self.signals: list[UnusualOptionsSignal] = []
-        self.plays_by_signal_id: dict[str, InsiderPlay] = {}  # Deduplicated plays
+        self.signal_store = get_signal_store(self.config)
+        self.earnings_calendar = get_earnings_calendar(self.config)
+        self.signals: SignalBatch = SignalBatch.from_rows([])
+        self.frame: SignalFrame = SignalFrame.from_batch(self.signals)
+        self.plays_by_row: dict[int, InsiderPlay] = {}  # Deduplicated plays
         self.exclude_hedges: bool = False
 
     def _is_likely_hedge(self, signal: UnusualOptionsSignal) -> bool:
@@ -248,8 +274,13 @@ class InsiderPlayDetector:
         end_date = datetime.now().date() + timedelta(days=1)
         start_date = end_date - timedelta(days=days + 1)
 
-        self.signals = await self.storage.get_signals(
-            min_grade=min_grade, start_date=start_date, end_date=end_date, limit=10000
+        self.signals = await self.signal_store.fetch_batch(
+            SignalQuery(
+                min_grade=min_grade,
+                start_date=start_date,
+                end_date=end_date,
+                columns=REPORT_COLUMNS,
+            )
         )
 
         console.print(f"[green]✓ Loaded {len(self.signals)} raw signals[/green]")
@@ -259,13 +290,16 @@ class InsiderPlayDetector:
         else:
             # Just filter 0-2 DTE
             original_count = len(self.signals)
-            self.signals = [
-                s for s in self.signals if s.days_to_expiry and s.days_to_expiry >= 3
-            ]
+            self.signals = self.signals.filter(
+                self.signals.column("days_to_expiry") >= 3
+            )
             filtered = original_count - len(self.signals)
             if filtered > 0:
                 console.print(f"[dim]Filtered {filtered} 0-2 DTE signals[/dim]")
 
+        # Every detector reads the same derived columns
+        self.frame = SignalFrame.from_batch(self.signals)
+
         # Calculate surprise factor for each signal
         self._calculate_surprise_factors()
 
@@ -273,80 +307,58 @@ class InsiderPlayDetector:
         """
         Apply strict quality filters tuned for insider-type plays.
 
-        Filters:
-        1. DTE 7-45 days (insider sweet spot)
-        2. Premium $2M+ (non-mega-cap) or $10M+ (mega-cap)
-        3. Aggressive order % > 65% (confirmed buying)
-        4. Max 15% OTM (no lottery tickets)
-        5. Exclude index/sector ETFs (mostly hedging)
+        Filters (each signal is counted under the first one it fails):
+        1. Exclude index/sector ETFs (mostly hedging)
+        2. DTE 7-45 days (insider sweet spot)
+        3. Premium $2M+ (non-mega-cap) or $10M+ (mega-cap)
+        4. Aggressive order % > 65% (confirmed buying)
+        5. Max 15% OTM (no lottery tickets)
         """
         original_count = len(self.signals)
-        filter_stats = {
-            "dte_filtered": 0,
-            "premium_filtered": 0,
-            "aggressive_filtered": 0,
-            "otm_filtered": 0,
-            "etf_filtered": 0,
-            "mega_cap_filtered": 0,
-        }
-
-        filtered_signals = []
-
-        for signal in self.signals:
-            # Skip index/sector ETFs (mostly hedging)
-            if signal.ticker in INDEX_ETFS or signal.ticker in SECTOR_ETFS:
-                filter_stats["etf_filtered"] += 1
-                continue
-
-            # DTE filter: 7-45 days (insider sweet spot)
-            if not signal.days_to_expiry:
-                filter_stats["dte_filtered"] += 1
-                continue
-            if signal.days_to_expiry < MIN_DTE_INSIDER:
-                filter_stats["dte_filtered"] += 1
-                continue
-            if signal.days_to_expiry > MAX_DTE_INSIDER:
-                filter_stats["dte_filtered"] += 1
-                continue
-
-            # Premium filter: tiered by market cap
-            min_premium = (
-                MIN_PREMIUM_MEGA_CAP
-                if signal.ticker in MEGA_CAPS
-                else MIN_PREMIUM_DEFAULT
+        frame = SignalFrame.from_batch(self.signals)
+
+        is_etf = np.isin(frame.ticker, list(INDEX_ETFS | SECTOR_ETFS))
+        bad_dte = (
+            (frame.dte == 0)
+            | (frame.dte < MIN_DTE_INSIDER)
+            | (frame.dte > MAX_DTE_INSIDER)
+        )
+
+        # Premium filter: tiered by market cap (NaN premium never passes)
+        min_premium = np.where(frame.is_mega, MIN_PREMIUM_MEGA_CAP, MIN_PREMIUM_DEFAULT)
+        low_premium = ~(frame.premium >= min_premium)
+
+        # Unknown aggressive % (NaN) is not held against the signal
+        low_aggressive = frame.aggressive < MIN_AGGRESSIVE_PCT
+
+        # OTM distance from the underlying, signed by direction
+        underlying = self.signals.column("underlying_price")
+        is_call = frame.option_type == "call"
+        with np.errstate(divide="ignore", invalid="ignore"):
+            otm_pct = (
+                np.where(is_call, frame.strike - underlying, underlying - frame.strike)
+                / underlying
             )
-            if not signal.premium_flow or signal.premium_flow < min_premium:
-                if signal.ticker in MEGA_CAPS:
-                    filter_stats["mega_cap_filtered"] += 1
-                else:
-                    filter_stats["premium_filtered"] += 1
-                continue
-
-            # Aggressive order % filter (confirm buying)
-            if signal.aggressive_order_pct is not None:
-                if signal.aggressive_order_pct < MIN_AGGRESSIVE_PCT:
-                    filter_stats["aggressive_filtered"] += 1
-                    continue
-
-            # OTM filter: max 15% OTM (no lottery tickets)
-            if signal.moneyness == "OTM" and signal.underlying_price > 0:
-                if signal.option_type == "call":
-                    otm_pct = (
-                        signal.strike - signal.underlying_price
-                    ) / signal.underlying_price
-                else:  # put
-                    otm_pct = (
-                        signal.underlying_price - signal.strike
-                    ) / signal.underlying_price
-
-                if otm_pct > MAX_OTM_PCT:
-                    filter_stats["otm_filtered"] += 1
-                    continue
-
-            # Passed all filters
-            filtered_signals.append(signal)
-
-        self.signals = filtered_signals
+        far_otm = (
+            (frame.moneyness == "OTM") & (underlying > 0) & (otm_pct > MAX_OTM_PCT)
+        )
+
+        rejections = (
+            ("etf_filtered", is_etf),
+            ("dte_filtered", bad_dte),
+            ("mega_cap_filtered", low_premium & frame.is_mega),
+            ("premium_filtered", low_premium & ~frame.is_mega),
+            ("aggressive_filtered", low_aggressive),
+            ("otm_filtered", far_otm),
+        )
+
+        keep = np.ones(original_count, dtype=bool)
+        filter_stats = {}
+        for name, rejected in rejections:
+            filter_stats[name] = int(np.count_nonzero(keep & rejected))
+            keep &= ~rejected
+
+        self.signals = self.signals.filter(keep)
 
         # Report filtering stats
         total_filtered = original_count - len(self.signals)
@@ -380,45 +392,43 @@ class InsiderPlayDetector:
 
     def _calculate_surprise_factors(self):
         """Calculate how surprising each signal is relative to ticker's normal volume"""
-        # Group signals by ticker to calculate ticker-specific stats
-        ticker_volumes = defaultdict(list)
-
-        for signal in self.signals:
-            if signal.current_volume:
-                ticker_volumes[signal.ticker].append(signal.current_volume)
-
-        # Calculate surprise factor for each signal
-        for signal in self.signals:
-            if not signal.current_volume:
-                signal.surprise_factor = 0.0
-                continue
-
-            ticker_vols = ticker_volumes.get(signal.ticker, [])
-
-            if len(ticker_vols) < 2:
-                # Not enough data, use absolute volume
-                signal.surprise_factor = min(signal.current_volume / 10000, 10.0)
-            else:
-                # Calculate how many std deviations above mean
-                mean_vol = statistics.mean(ticker_vols)
-                try:
-                    stdev_vol = statistics.stdev(ticker_vols)
-                    if stdev_vol > 0:
-                        z_score = (signal.current_volume - mean_vol) / stdev_vol
-                        signal.surprise_factor = max(0, min(z_score, 10.0))
-                    else:
-                        signal.surprise_factor = 1.0
-                except Exception:
-                    signal.surprise_factor = 1.0
-
-    def _get_or_create_play(self, signal: UnusualOptionsSignal) -> InsiderPlay:
-        """Get existing play for this signal or create new one"""
-        if signal.signal_id not in self.plays_by_signal_id:
-            play = InsiderPlay(
-                signal=signal, surprise_factor=getattr(signal, "surprise_factor", 0.0)
+        frame = self.frame
+        volume = frame.volume.astype(np.float64)
+        has_volume = volume != 0
+        groups = int(frame.ticker_code.max()) + 1 if len(volume) else 0
+
+        # Per-ticker volume stats over signals that have volume
+        codes = frame.ticker_code[has_volume]
+        vols = volume[has_volume]
+        counts = np.bincount(codes, minlength=groups)
+        means = np.bincount(codes, weights=vols, minlength=groups) / np.maximum(
+            counts, 1
+        )
+        squares = np.bincount(
+            codes, weights=(vols - means[codes]) ** 2, minlength=groups
+        )
+        stdevs = np.sqrt(squares / np.maximum(counts - 1, 1))
+
+        count = counts[frame.ticker_code]
+        mean = means[frame.ticker_code]
+        stdev = stdevs[frame.ticker_code]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # How many std deviations above the ticker's mean
+            z_score = np.clip((volume - mean) / stdev, 0, 10.0)
+        surprise = np.where(stdev > 0, z_score, 1.0)
+        # Not enough data, use absolute volume
+        surprise = np.where(count < 2, np.minimum(volume / 10000, 10.0), surprise)
+        frame.surprise = np.where(has_volume, surprise, 0.0)
+
+    def _get_or_create_play(self, row: int) -> InsiderPlay:
+        """Get existing play for this signal row or create new one"""
+        if row not in self.plays_by_row:
+            self.plays_by_row[row] = InsiderPlay(
+                signal=self.signals.signal(row),
+                surprise_factor=float(self.frame.surprise[row]),
             )
-            self.plays_by_signal_id[signal.signal_id] = play
-        return self.plays_by_signal_id[signal.signal_id]
+        return self.plays_by_row[row]
 
     def detect_large_concentrated_bets(self) -> list[InsiderPlay]:
         """
@@ -430,45 +440,36 @@ class InsiderPlayDetector:
         # Minimum premium for "large" bet
         LARGE_BET_THRESHOLD = 3_000_000  # $3M+
 
-        for signal in self.signals:
-            if not signal.premium_flow or signal.premium_flow < LARGE_BET_THRESHOLD:
-                continue
-
-            # Check if this is ITM or near-ATM (not a lottery ticket)
-            if signal.moneyness in ["ITM", "ATM"]:
-                # Calculate suspicion score
-                suspicion = min(
-                    signal.premium_flow / 10_000_000 * 100, 100
-                )  # Scale to 100
-
-                # Bonus for very short time to expiry (urgency = knows something is coming)
-                if signal.days_to_expiry and signal.days_to_expiry <= 14:
-                    suspicion = min(suspicion * 1.3, 100)
-
-                # Bonus for S-grade signals
-                if signal.grade == "S":
-                    suspicion = min(suspicion * 1.2, 100)
-
-                # Bonus for surprise factor
-                if signal.surprise_factor and signal.surprise_factor > 2.0:
-                    suspicion = min(suspicion * 1.1, 100)
-
-                play = self._get_or_create_play(signal)
-                play.add_pattern(
-                    "LARGE_BET",
-                    suspicion,
-                    f"${signal.premium_flow / 1_000_000:.1f}M premium in single strike",
-                )
-                play.key_metrics.update(
-                    {
-                        "premium": signal.premium_flow,
-                        "strike": signal.strike,
-                        "dte": signal.days_to_expiry,
-                        "moneyness": signal.moneyness,
-                    }
-                )
+        f = self.frame
+        # ITM or near-ATM only (not a lottery ticket)
+        hits = (f.premium >= LARGE_BET_THRESHOLD) & np.isin(f.moneyness, ["ITM", "ATM"])
+
+        suspicion = np.minimum(f.premium / 10_000_000 * 100, 100)  # Scale to 100
+        # Bonus for very short time to expiry (urgency = knows something is coming)
+        suspicion = _bonus(suspicion, (f.dte != 0) & (f.dte <= 14), 1.3)
+        # Bonus for S-grade signals
+        suspicion = _bonus(suspicion, f.grade == "S", 1.2)
+        # Bonus for surprise factor
+        suspicion = _bonus(suspicion, f.surprise > 2.0, 1.1)
+
+        for i in np.flatnonzero(hits).tolist():
+            premium = float(f.premium[i])
+            play = self._get_or_create_play(i)
+            play.add_pattern(
+                "LARGE_BET",
+                float(suspicion[i]),
+                f"${premium / 1_000_000:.1f}M premium in single strike",
+            )
+            play.key_metrics.update(
+                {
+                    "premium": premium,
+                    "strike": float(f.strike[i]),
+                    "dte": int(f.dte[i]),
+                    "moneyness": str(f.moneyness[i]),
+                }
+            )
 
-        return list(self.plays_by_signal_id.values())
+        return list(self.plays_by_row.values())
 
     def detect_unusual_dte_premium_combo(self) -> list[InsiderPlay]:
         """
@@ -477,40 +478,36 @@ class InsiderPlayDetector:
         Example: $4M in calls expiring in 7 days (not months out)
         Why suspicious: Short-dated + large size = knows catalyst timing
         """
-        for signal in self.signals:
-            if not signal.premium_flow or not signal.days_to_expiry:
-                continue
-
-            # Short DTE (3-14 days) + Large premium
-            if 3 <= signal.days_to_expiry <= 14 and signal.premium_flow >= 2_000_000:
-                # Calculate urgency score
-                urgency = (15 - signal.days_to_expiry) / 12  # Shorter = more urgent
-                size_score = min(signal.premium_flow / 5_000_000, 1.0)
-                suspicion = (urgency * 0.5 + size_score * 0.5) * 100
-
-                # Bonus for near-the-money (easier to profit = more confident)
-                if signal.moneyness in ["ATM", "ITM"]:
-                    suspicion = min(suspicion * 1.3, 100)
-
-                # Bonus for surprise factor
-                if signal.surprise_factor and signal.surprise_factor > 2.0:
-                    suspicion = min(suspicion * 1.1, 100)
-
-                play = self._get_or_create_play(signal)
-                play.add_pattern(
-                    "URGENT_SHORT_DTE",
-                    suspicion,
-                    f"${signal.premium_flow / 1_000_000:.1f}M bet expiring in {signal.days_to_expiry} days",
-                )
-                play.key_metrics.update(
-                    {
-                        "premium": signal.premium_flow,
-                        "dte": signal.days_to_expiry,
-                        "option_type": signal.option_type,
-                    }
-                )
+        f = self.frame
+        # Short DTE (3-14 days) + Large premium
+        hits = (f.dte >= 3) & (f.dte <= 14) & (f.premium >= 2_000_000)
+
+        urgency = (15 - f.dte) / 12  # Shorter = more urgent
+        size_score = np.minimum(f.premium / 5_000_000, 1.0)
+        suspicion = (urgency * 0.5 + size_score * 0.5) * 100
+        # Bonus for near-the-money (easier to profit = more confident)
+        suspicion = _bonus(suspicion, np.isin(f.moneyness, ["ATM", "ITM"]), 1.3)
+        # Bonus for surprise factor
+        suspicion = _bonus(suspicion, f.surprise > 2.0, 1.1)
+
+        for i in np.flatnonzero(hits).tolist():
+            premium = float(f.premium[i])
+            dte = int(f.dte[i])
+            play = self._get_or_create_play(i)
+            play.add_pattern(
+                "URGENT_SHORT_DTE",
+                float(suspicion[i]),
+                f"${premium / 1_000_000:.1f}M bet expiring in {dte} days",
+            )
+            play.key_metrics.update(
+                {
+                    "premium": premium,
+                    "dte": dte,
+                    "option_type": str(f.option_type[i]),
+                }
+            )
 
-        return list(self.plays_by_signal_id.values())
+        return list(self.plays_by_row.values())
 
     def detect_volume_to_oi_anomalies(self) -> list[InsiderPlay]:
         """
@@ -519,46 +516,41 @@ class InsiderPlayDetector:
         Example: Option has 500 OI but 5,000 volume today
         Why suspicious: Sudden NEW interest, not existing holders trading
         """
-        for signal in self.signals:
-            if not signal.current_oi or signal.current_oi == 0:
-                continue
-
-            if not signal.current_volume:
-                continue
-
-            volume_to_oi = signal.current_volume / signal.current_oi
-
-            # Volume is 5x+ the open interest = lots of new positioning
-            if (
-                volume_to_oi >= 5.0
-                and signal.premium_flow
-                and signal.premium_flow >= 1_000_000
-            ):
-                suspicion = min((volume_to_oi / 10) * 100, 100)
-
-                # Bonus for ITM options (real positioning, not speculation)
-                if signal.moneyness == "ITM":
-                    suspicion = min(suspicion * 1.2, 100)
-
-                # Bonus for surprise factor
-                if signal.surprise_factor and signal.surprise_factor > 2.0:
-                    suspicion = min(suspicion * 1.1, 100)
-
-                play = self._get_or_create_play(signal)
-                play.add_pattern(
-                    "FRESH_POSITIONING",
-                    suspicion,
-                    f"{volume_to_oi:.1f}x volume vs OI - major NEW positioning",
-                )
-                play.key_metrics.update(
-                    {
-                        "volume": signal.current_volume,
-                        "oi": signal.current_oi,
-                        "volume_to_oi": volume_to_oi,
-                    }
-                )
+        f = self.frame
+        with np.errstate(divide="ignore", invalid="ignore"):
+            volume_to_oi = f.volume / f.oi
+
+        # Volume is 5x+ the open interest = lots of new positioning
+        hits = (
+            (f.oi != 0)
+            & (f.volume != 0)
+            & (volume_to_oi >= 5.0)
+            & (f.premium >= 1_000_000)
+        )
 
-        return list(self.plays_by_signal_id.values())
+        suspicion = np.minimum((volume_to_oi / 10) * 100, 100)
+        # Bonus for ITM options (real positioning, not speculation)
+        suspicion = _bonus(suspicion, f.moneyness == "ITM", 1.2)
+        # Bonus for surprise factor
+        suspicion = _bonus(suspicion, f.surprise > 2.0, 1.1)
+
+        for i in np.flatnonzero(hits).tolist():
+            ratio = float(volume_to_oi[i])
+            play = self._get_or_create_play(i)
+            play.add_pattern(
+                "FRESH_POSITIONING",
+                float(suspicion[i]),
+                f"{ratio:.1f}x volume vs OI - major NEW positioning",
+            )
+            play.key_metrics.update(
+                {
+                    "volume": int(f.volume[i]),
+                    "oi": int(f.oi[i]),
+                    "volume_to_oi": ratio,
+                }
+            )
+
+        return list(self.plays_by_row.values())
 
     def detect_aggressive_buyer_patterns(self) -> list[InsiderPlay]:
         """
@@ -567,41 +559,35 @@ class InsiderPlayDetector:
         Example: 85% aggressive orders = buyer is DESPERATE to get in
         Why suspicious: Urgency suggests they know something
         """
-        for signal in self.signals:
-            # FIX: aggressive_order_pct is stored as decimal (0.70 = 70%), not percentage
-            if not signal.aggressive_order_pct or signal.aggressive_order_pct < 0.70:
-                continue
-
-            if not signal.premium_flow or signal.premium_flow < 1_000_000:
-                continue
-
-            # High aggression + large size = urgent positioning
-            # Convert to 0-100 scale (0.70 = 70 points)
-            suspicion = min(signal.aggressive_order_pct * 100, 100)
-
-            # Bonus for very high aggression (>80%)
-            if signal.aggressive_order_pct > 0.80:
-                suspicion = min(suspicion * 1.2, 100)
-
-            # Bonus for surprise factor
-            if signal.surprise_factor and signal.surprise_factor > 2.0:
-                suspicion = min(suspicion * 1.1, 100)
-
-            play = self._get_or_create_play(signal)
+        f = self.frame
+        # FIX: aggressive_order_pct is stored as decimal (0.70 = 70%), not percentage
+        # High aggression + large size = urgent positioning
+        hits = (f.aggressive >= 0.70) & (f.premium >= 1_000_000)
+
+        # Convert to 0-100 scale (0.70 = 70 points)
+        suspicion = np.minimum(f.aggressive * 100, 100)
+        # Bonus for very high aggression (>80%)
+        suspicion = _bonus(suspicion, f.aggressive > 0.80, 1.2)
+        # Bonus for surprise factor
+        suspicion = _bonus(suspicion, f.surprise > 2.0, 1.1)
+
+        for i in np.flatnonzero(hits).tolist():
+            aggressive = float(f.aggressive[i])
+            play = self._get_or_create_play(i)
             play.add_pattern(
                 "AGGRESSIVE_BUYER",
-                suspicion,
-                f"{signal.aggressive_order_pct * 100:.0f}% aggressive orders - buyer paying up",
+                float(suspicion[i]),
+                f"{aggressive * 100:.0f}% aggressive orders - buyer paying up",
             )
             play.key_metrics.update(
                 {
-                    "aggressive_pct": signal.aggressive_order_pct,
-                    "premium": signal.premium_flow,
-                    "option_type": signal.option_type,
+                    "aggressive_pct": aggressive,
+                    "premium": float(f.premium[i]),
+                    "option_type": str(f.option_type[i]),
                 }
             )
 
-        return list(self.plays_by_signal_id.values())
+        return list(self.plays_by_row.values())
 
     def detect_multi_strike_building(self) -> list[InsiderPlay]:
         """
@@ -611,61 +597,61 @@ class InsiderPlayDetector:
         Example: $5M in ROKU $90 calls + $3M in ROKU $95 calls same day
         Why suspicious: Scaling into conviction (institutional-style positioning)
         """
-        # Group signals by ticker and option type
-        ticker_positions = defaultdict(lambda: {"calls": [], "puts": []})
-
-        for signal in self.signals:
-            if not signal.premium_flow or signal.premium_flow < 1_000_000:
-                continue
-
-            # FILTER: Skip mega-caps - they always have multi-strike flow
-            if signal.ticker in MEGA_CAPS:
-                continue
+        f = self.frame
+        # FILTER: Skip mega-caps - they always have multi-strike flow
+        rows = np.flatnonzero((f.premium >= 1_000_000) & ~f.is_mega)
+        if not len(rows):
+            return list(self.plays_by_row.values())
+
+        # Group by (ticker, calls vs puts), in order of each ticker's first row
+        _, first_row, ticker_rank = np.unique(
+            f.ticker_code[rows], return_index=True, return_inverse=True
+        )
+        ticker_order = np.argsort(np.argsort(first_row, kind="stable"))
+        is_put = (f.option_type[rows] != "call").astype(np.int64)
+        group = ticker_order[ticker_rank] * 2 + is_put
+        n_groups = int(group.max()) + 1
+
+        counts = np.bincount(group, minlength=n_groups)
+        total_premium = np.bincount(group, weights=f.premium[rows], minlength=n_groups)
+        strikes = f.strike[rows]
+        min_strike = np.full(n_groups, np.inf)
+        max_strike = np.full(n_groups, -np.inf)
+        np.minimum.at(min_strike, group, strikes)
+        np.maximum.at(max_strike, group, strikes)
+
+        # Need at least 2 positions and $5M+ total
+        qualifies = (counts >= 2) & (total_premium >= 5_000_000)
+
+        suspicion = np.minimum((total_premium / 10_000_000) * 100, 100)
+        # Bonus if positions are within 10% strike range (concentrated conviction)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            strike_range = (max_strike - min_strike) / min_strike
+        suspicion = _bonus(suspicion, strike_range < 0.10, 1.3)
+        # Bonus for smaller cap names (more unusual; mega-caps are excluded above)
+        suspicion = np.minimum(suspicion * 1.2, 100)
+
+        # Add pattern to EACH signal involved in the scaling
+        order = np.argsort(group, kind="stable")
+        for pos in order[qualifies[group[order]]].tolist():
+            i, g = int(rows[pos]), int(group[pos])
+            total = float(total_premium[g])
+            low, high = float(min_strike[g]), float(max_strike[g])
+            play = self._get_or_create_play(i)
+            play.add_pattern(
+                "MULTI_STRIKE_SCALING",
+                float(suspicion[g]),
+                f"${total / 1_000_000:.1f}M across {counts[g]} strikes (${low:.0f}-${high:.0f})",
+            )
+            play.key_metrics.update(
+                {
+                    "total_premium": total,
+                    "num_strikes": int(counts[g]),
+                    "strike_range": f"${low:.0f}-${high:.0f}",
+                }
+            )
 
-            if signal.option_type == "call":
-                ticker_positions[signal.ticker]["calls"].append(signal)
-            else:
-                ticker_positions[signal.ticker]["puts"].append(signal)
-
-        # Look for tickers with multiple large positions
-        for ticker, positions in ticker_positions.items():
-            for _option_type, signals in positions.items():
-                if len(signals) < 2:  # Need at least 2 positions
-                    continue
-
-                total_premium = sum([s.premium_flow for s in signals if s.premium_flow])
-
-                if total_premium >= 5_000_000:  # $5M+ total
-                    # Calculate suspicion
-                    suspicion = min((total_premium / 10_000_000) * 100, 100)
-
-                    # Bonus if positions are within 10% strike range (concentrated conviction)
-                    strikes = [s.strike for s in signals]
-                    strike_range = (max(strikes) - min(strikes)) / min(strikes)
-                    if strike_range < 0.10:  # Within 10%
-                        suspicion = min(suspicion * 1.3, 100)
-
-                    # Bonus for smaller cap names (more unusual)
-                    if ticker not in MEGA_CAPS:
-                        suspicion = min(suspicion * 1.2, 100)
-
-                    # Add pattern to EACH signal involved in the scaling
-                    for signal in signals:
-                        play = self._get_or_create_play(signal)
-                        play.add_pattern(
-                            "MULTI_STRIKE_SCALING",
-                            suspicion,
-                            f"${total_premium / 1_000_000:.1f}M across {len(signals)} strikes (${min(strikes):.0f}-${max(strikes):.0f})",
-                        )
-                        play.key_metrics.update(
-                            {
-                                "total_premium": total_premium,
-                                "num_strikes": len(signals),
-                                "strike_range": f"${min(strikes):.0f}-${max(strikes):.0f}",
-                            }
-                        )
-
-        return list(self.plays_by_signal_id.values())
+        return list(self.plays_by_row.values())
 
     def detect_earnings_plays(self) -> list[InsiderPlay]:
         """
@@ -674,46 +660,52 @@ class InsiderPlayDetector:
         Example: $5M in options 3 days before earnings
         Why suspicious: Someone expects big earnings move
         """
-        for signal in self.signals:
-            if not signal.premium_flow or signal.premium_flow < 2_000_000:
-                continue
-
-            days_until_earnings_date = days_to_earnings(signal.ticker)
-
-            # Check if earnings is within next 14 days
-            if (
-                days_until_earnings_date is not None
-                and 0 <= days_until_earnings_date <= 14
-            ):
-                # Large bet before earnings = expecting big move
-                suspicion = min((signal.premium_flow / 5_000_000) * 100, 100)
-
-                # Bonus for very close to earnings (3-7 days)
-                if 3 <= days_until_earnings_date <= 7:
-                    suspicion = min(suspicion * 1.3, 100)
-
-                # Bonus if earnings is very soon (0-2 days)
-                if days_until_earnings_date <= 2:
-                    suspicion = min(suspicion * 1.5, 100)
-
-                # Bonus for surprise factor
-                if signal.surprise_factor and signal.surprise_factor > 2.0:
-                    suspicion = min(suspicion * 1.1, 100)
-
-                play = self._get_or_create_play(signal)
-                play.add_pattern(
-                    "EARNINGS_PLAY",
-                    suspicion,
-                    f"${signal.premium_flow / 1_000_000:.1f}M bet {days_until_earnings_date}d before earnings",
-                )
-                play.key_metrics.update(
-                    {
-                        "days_to_earnings": days_until_earnings_date,
-                        "premium": signal.premium_flow,
-                    }
-                )
+        f = self.frame
+        large = f.premium >= 2_000_000
+        if not large.any():
+            return list(self.plays_by_row.values())
+
+        # One calendar lookup per ticker (NaN = no known earnings date)
+        days_by_code = np.full(int(f.ticker_code.max()) + 1, np.nan)
+        codes, first = np.unique(f.ticker_code[large], return_index=True)
+        tickers = f.ticker[large][first]
+        for code, ticker in zip(codes.tolist(), tickers.tolist(), strict=True):
+            days = self.earnings_calendar.days_to_earnings(ticker)
+            if days is not None:
+                days_by_code[code] = days
+        days_to_earnings = days_by_code[f.ticker_code]
+
+        # Check if earnings is within next 14 days
+        hits = large & (days_to_earnings >= 0) & (days_to_earnings <= 14)
+
+        # Large bet before earnings = expecting big move
+        suspicion = np.minimum((f.premium / 5_000_000) * 100, 100)
+        # Bonus for very close to earnings (3-7 days)
+        suspicion = _bonus(
+            suspicion, (days_to_earnings >= 3) & (days_to_earnings <= 7), 1.3
+        )
+        # Bonus if earnings is very soon (0-2 days)
+        suspicion = _bonus(suspicion, days_to_earnings <= 2, 1.5)
+        # Bonus for surprise factor
+        suspicion = _bonus(suspicion, f.surprise > 2.0, 1.1)
+
+        for i in np.flatnonzero(hits).tolist():
+            premium = float(f.premium[i])
+            days = int(days_to_earnings[i])
+            play = self._get_or_create_play(i)
+            play.add_pattern(
+                "EARNINGS_PLAY",
+                float(suspicion[i]),
+                f"${premium / 1_000_000:.1f}M bet {days}d before earnings",
+            )
+            play.key_metrics.update(
+                {
+                    "days_to_earnings": days,
+                    "premium": premium,
+                }
+            )
 
-        return list(self.plays_by_signal_id.values())
+        return list(self.plays_by_row.values())
 
     def _generate_recommendation(self, play: InsiderPlay) -> str:
         """Generate action recommendation based on play"""
@@ -740,7 +732,7 @@ class InsiderPlayDetector:
 
     def get_filtered_plays(self) -> list[InsiderPlay]:
         """Get all plays, filtered and sorted by suspicion + surprise factor"""
-        plays = list(self.plays_by_signal_id.values())
+        plays = list(self.plays_by_row.values())
 
         # Filter out likely hedges if requested
         if self.exclude_hedges:
@@ -821,7 +813,9 @@ class InsiderPlayDetector:
                 metrics_items.append(f"DTE: {play.key_metrics['dte']}d")
 
             # Add earnings proximity if within 30 days
-            days_until_earnings = days_to_earnings(play.signal.ticker)
+            days_until_earnings = self.earnings_calendar.days_to_earnings(
+                play.signal.ticker
+            )
             if days_until_earnings is not None and 0 <= days_until_earnings <= 30:
                 if days_until_earnings == 0:
                     metrics_items.append("📊 Earnings: TODAY")
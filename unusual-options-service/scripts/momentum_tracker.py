@@ -28,11 +28,22 @@ from rich.panel import Panel
 from rich.table import Table
 
 from unusual_options.config import load_config
-from unusual_options.storage.database import get_storage
 from unusual_options.storage.models import UnusualOptionsSignal
+from unusual_options.storage.signal_store import SignalQuery, get_signal_store
 
 console = Console()
 
+# Signal columns this report reads
+REPORT_COLUMNS = (
+    "ticker",
+    "option_type",
+    "premium_flow",
+    "overall_score",
+    "confidence",
+    "grade",
+    "detection_timestamp",
+)
+
 
 @dataclass
 class MomentumPattern:
@@ -52,7 +63,7 @@ class MomentumPattern:
 class MomentumTracker:
     def __init__(self):
         self.config = load_config()
-        self.storage = get_storage(self.config)
+        self.signal_store = get_signal_store(self.config)
         self.signals_by_day: dict[date, list[UnusualOptionsSignal]] = {}
 
     async def fetch_multi_day_signals(
@@ -64,8 +75,13 @@ class MomentumTracker:
         end_date = datetime.now().date() + timedelta(days=1)
         start_date = end_date - timedelta(days=days + 1)
 
-        all_signals = await self.storage.get_signals(
-            min_grade=min_grade, start_date=start_date, end_date=end_date, limit=10000
+        all_signals = await self.signal_store.fetch_signals(
+            SignalQuery(
+                min_grade=min_grade,
+                start_date=start_date,
+                end_date=end_date,
+                columns=REPORT_COLUMNS,
+            )
         )
 
         # Group by day
@@ -30,29 +30,36 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Any
 
-import yfinance as yf
+import numpy as np
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from unusual_options.config import load_config
-from unusual_options.storage.database import get_storage
+from unusual_options.data.prices import PriceHistory, directional_wins
 from unusual_options.storage.models import UnusualOptionsSignal
+from unusual_options.storage.signal_store import SignalQuery, get_signal_store
 
 console = Console()
 
+# Signal columns this report reads
+REPORT_COLUMNS = (
+    "ticker",
+    "option_type",
+    "premium_flow",
+    "overall_score",
+    "grade",
+    "detection_timestamp",
+)
+
 # Win threshold: stock must move X% in predicted direction
 WIN_THRESHOLD_1D = 0.01  # 1% for 1-day
 WIN_THRESHOLD_5D = 0.02  # 2% for 5-day
 
-# Cache for price data to avoid repeated API calls
-PRICE_CACHE: dict[str, dict[str, float]] = {}
-
 
 @dataclass
 class SignalPerformance:
@@ -81,135 +88,13 @@ class SignalPerformance:
     error_message: str | None = None
 
 
-def get_historical_prices(
-    ticker: str, start_date: date, end_date: date
-) -> dict[str, float]:
-    """
-    Get historical prices for a ticker.
-
-    Returns dict mapping date string to close price.
-    """
-    cache_key = f"{ticker}_{start_date}_{end_date}"
-    if cache_key in PRICE_CACHE:
-        return PRICE_CACHE[cache_key]
-
-    try:
-        yf_ticker = yf.Ticker(ticker)
-        hist = yf_ticker.history(
-            start=start_date, end=end_date + timedelta(days=1), interval="1d"
-        )
-
-        if hist.empty:
-            return {}
-
-        prices = {}
-        for idx, row in hist.iterrows():
-            date_str = idx.strftime("%Y-%m-%d")
-            prices[date_str] = row["Close"]
-
-        PRICE_CACHE[cache_key] = prices
-        return prices
-
-    except Exception as e:
-        console.print(f"[dim]Error fetching {ticker}: {e}[/dim]")
-        return {}
-
-
-def get_trading_day_offset(
-    base_date: date, offset_days: int, prices: dict[str, float]
-) -> str | None:
-    """
-    Find the trading day that is approximately offset_days after base_date.
-
-    Handles weekends/holidays by finding nearest available date.
-    """
-    target_date = base_date + timedelta(days=offset_days)
-
-    # Try exact date first
-    date_str = target_date.strftime("%Y-%m-%d")
-    if date_str in prices:
-        return date_str
-
-    # Look forward up to 5 days for next trading day
-    for i in range(1, 6):
-        check_date = target_date + timedelta(days=i)
-        date_str = check_date.strftime("%Y-%m-%d")
-        if date_str in prices:
-            return date_str
-
-    return None
-
-
-def calculate_signal_performance(
-    signal: UnusualOptionsSignal, prices: dict[str, float]
-) -> SignalPerformance:
-    """Calculate performance metrics for a single signal."""
-
-    perf = SignalPerformance(signal=signal)
-
-    detection_date = signal.detection_timestamp.date()
-    perf.days_since_detection = (date.today() - detection_date).days
-
-    # Get price at detection
-    detection_str = detection_date.strftime("%Y-%m-%d")
-    if detection_str in prices:
-        perf.price_at_detection = prices[detection_str]
-    else:
-        # Try next trading day
-        next_day = get_trading_day_offset(detection_date, 1, prices)
-        if next_day:
-            perf.price_at_detection = prices[next_day]
-
-    if not perf.price_at_detection:
-        perf.data_available = False
-        perf.error_message = "No price at detection"
-        return perf
-
-    # Get 1-day later price (if available)
-    day_1 = get_trading_day_offset(detection_date, 1, prices)
-    if day_1 and day_1 in prices:
-        perf.price_1d_later = prices[day_1]
-        perf.return_1d = (
-            perf.price_1d_later - perf.price_at_detection
-        ) / perf.price_at_detection
-
-        # Classify win/loss for 1d
-        if signal.option_type == "call":
-            perf.win_1d = perf.return_1d >= WIN_THRESHOLD_1D
-        else:  # put
-            perf.win_1d = perf.return_1d <= -WIN_THRESHOLD_1D
-
-    # Get 5-day later price (if available)
-    day_5 = get_trading_day_offset(detection_date, 5, prices)
-    if day_5 and day_5 in prices:
-        perf.price_5d_later = prices[day_5]
-        perf.return_5d = (
-            perf.price_5d_later - perf.price_at_detection
-        ) / perf.price_at_detection
-
-        # Classify win/loss for 5d
-        if signal.option_type == "call":
-            perf.win_5d = perf.return_5d >= WIN_THRESHOLD_5D
-        else:  # put
-            perf.win_5d = perf.return_5d <= -WIN_THRESHOLD_5D
-
-    # Get current price (most recent in prices dict)
-    if prices:
-        latest_date = max(prices.keys())
-        perf.current_price = prices[latest_date]
-        perf.return_current = (
-            perf.current_price - perf.price_at_detection
-        ) / perf.price_at_detection
-
-    return perf
-
-
 class PerformanceTracker:
     """Track and analyze signal performance."""
 
     def __init__(self):
         self.config = load_config()
-        self.storage = get_storage(self.config)
+        self.signal_store = get_signal_store(self.config)
+        self.price_history = PriceHistory(self.config)
         self.signals: list[UnusualOptionsSignal] = []
         self.performances: list[SignalPerformance] = []
 
@@ -224,52 +109,62 @@ class PerformanceTracker:
         end_date = datetime.now().date() - timedelta(days=1)  # Exclude today
         start_date = end_date - timedelta(days=days)
 
-        self.signals = await self.storage.get_signals(
-            min_grade=min_grade, start_date=start_date, end_date=end_date, limit=10000
+        self.signals = await self.signal_store.fetch_signals(
+            SignalQuery(
+                min_grade=min_grade,
+                start_date=start_date,
+                end_date=end_date,
+                columns=REPORT_COLUMNS,
+            )
         )
 
         console.print(f"[green]✓ Loaded {len(self.signals)} signals[/green]")
 
     def calculate_all_performance(self) -> None:
-        """Calculate performance for all signals."""
+        """Calculate performance for all signals in one vectorized pass."""
+        if not self.signals:
+            return
 
-        # Group signals by ticker for efficient API calls
-        by_ticker = defaultdict(list)
-        for signal in self.signals:
-            by_ticker[signal.ticker].append(signal)
+        tickers = [s.ticker for s in self.signals]
+        dates = [s.detection_timestamp.date() for s in self.signals]
 
         console.print(
-            f"[blue]Calculating performance for {len(by_ticker)} tickers...[/blue]"
+            f"[blue]Calculating performance for {len(set(tickers))} tickers...[/blue]"
         )
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Processing...", total=len(by_ticker))
-
-            for ticker, ticker_signals in by_ticker.items():
-                progress.update(task, description=f"Processing {ticker}...")
-
-                # Get date range for this ticker
-                dates = [s.detection_timestamp.date() for s in ticker_signals]
-                min_date = min(dates) - timedelta(days=1)
-                max_date = max(dates) + timedelta(days=10)  # Buffer for forward returns
-
-                # Don't go beyond today
-                if max_date > date.today():
-                    max_date = date.today()
+        # One bulk download (or cache read) covers every ticker
+        with console.status("Loading price history..."):
+            self.price_history.load(
+                tickers, min(dates) - timedelta(days=1), date.today()
+            )
 
-                # Fetch prices
-                prices = get_historical_prices(ticker, min_date, max_date)
+        fr = self.price_history.forward_returns(tickers, dates, horizons=(1, 5))
+        is_call = np.array([s.option_type == "call" for s in self.signals])
+        win_1d = directional_wins(fr.returns[1], is_call, WIN_THRESHOLD_1D)
+        win_5d = directional_wins(fr.returns[5], is_call, WIN_THRESHOLD_5D)
+        return_current = (fr.latest_price - fr.base_price) / fr.base_price
 
-                # Calculate performance for each signal
-                for signal in ticker_signals:
-                    perf = calculate_signal_performance(signal, prices)
-                    self.performances.append(perf)
+        today = date.today()
+        for i, signal in enumerate(self.signals):
+            perf = SignalPerformance(
+                signal=signal, days_since_detection=(today - dates[i]).days
+            )
 
-                progress.advance(task)
+            if not fr.has_base[i]:
+                perf.data_available = False
+                perf.error_message = "No price at detection"
+            else:
+                perf.price_at_detection = fr.value(fr.base_price, i)
+                perf.price_1d_later = fr.value(fr.prices[1], i)
+                perf.price_5d_later = fr.value(fr.prices[5], i)
+                perf.current_price = fr.value(fr.latest_price, i)
+                perf.return_1d = fr.value(fr.returns[1], i)
+                perf.return_5d = fr.value(fr.returns[5], i)
+                perf.return_current = fr.value(return_current, i)
+                perf.win_1d = win_1d[i]
+                perf.win_5d = win_5d[i]
+
+            self.performances.append(perf)
 
     def get_stats_by_grade(self) -> dict[str, dict[str, Any]]:
         """Calculate performance statistics by grade."""
@@ -10,6 +10,9 @@ A signal should be reactivated if:
 2. Option hasn't expired yet (expiry >= today)
 3. Was detected recently (within last 7 days)
 
+Counting and reactivation run server-side in reactivate_uo_signals()
+(db/migrations/004_create_uo_maintenance_functions.sql).
+
 Usage:
     python scripts/reactivate_valid_signals.py [--dry-run] [--days 7]
 
@@ -34,6 +37,8 @@ from rich.panel import Panel
 from rich.table import Table
 from supabase import Client, create_client
 
+from unusual_options.storage.models import GRADE_ORDER
+
 console = Console()
 
 
@@ -53,182 +58,133 @@ def load_config() -> dict[str, Any]:
     return config
 
 
-def get_falsely_inactive_signals(
-    client: Client, days_back: int = 7
-) -> list[dict[str, Any]]:
+def find_falsely_inactive_signals(
+    client: Client, days_back: int = 7, dry_run: bool = True
+) -> dict[str, Any]:
     """
-    Find signals that were incorrectly marked inactive.
+    Count (and unless dry_run, reactivate) incorrectly inactive signals.
 
     Criteria:
     - is_active = false (marked inactive)
     - expiry >= CURRENT_DATE (option not expired)
     - last_detected_at within days_back (recently seen)
+
+    Runs server-side in one reactivate_uo_signals() call.
+
+    Returns:
+        Aggregated counts: signals_found, signals_reactivated and
+        by_grade / by_ticker / by_expiry breakdowns
     """
     cutoff_date = datetime.now(UTC) - timedelta(days=days_back)
     today = date.today()
 
-    console.print("\n[cyan]Searching for falsely inactive signals...[/cyan]")
-    console.print(f"  • Option expiry: >= {today}")
-    console.print(f"  • Last detected: >= {cutoff_date.strftime('%Y-%m-%d')}")
-
-    result = (
-        client.table("unusual_options_signals")
-        .select("*")
-        .eq("is_active", False)
-        .gte("expiry", today.isoformat())
-        .gte("last_detected_at", cutoff_date.isoformat())
-        .order("last_detected_at", desc=True)
-        .execute()
-    )
+    if dry_run:
+        console.print("\n[cyan]Searching for falsely inactive signals...[/cyan]")
+        console.print(f"  • Option expiry: >= {today}")
+        console.print(f"  • Last detected: >= {cutoff_date.strftime('%Y-%m-%d')}")
+
+    result = client.rpc(
+        "reactivate_uo_signals",
+        {
+            "p_detected_since": cutoff_date.isoformat(),
+            "p_as_of": today.isoformat(),
+            "p_dry_run": dry_run,
+        },
+    ).execute()
 
-    return result.data if result.data else []
+    return result.data or {}
 
 
-def display_signal_summary(signals: list[dict[str, Any]]) -> None:
+def display_signal_summary(summary: dict[str, Any]) -> None:
     """Display summary table of signals to reactivate."""
-    if not signals:
+    signals_found = summary.get("signals_found", 0)
+    if not signals_found:
         console.print("[green]✓ No falsely inactive signals found![/green]")
         console.print("All signals are correctly marked.")
         return
 
-    table = Table(title=f"Falsely Inactive Signals ({len(signals)} found)")
-    table.add_column("Ticker", style="cyan")
-    table.add_column("Contract", style="magenta")
-    table.add_column("Grade", style="bold")
+    table = Table(title=f"Falsely Inactive Signals ({signals_found} found)")
     table.add_column("Expiry", style="yellow")
-    table.add_column("Last Detected", style="dim")
     table.add_column("Days to Expiry", justify="right")
+    table.add_column("Signals", justify="right", style="bold")
 
-    for signal in signals:
-        expiry = datetime.fromisoformat(signal["expiry"].replace("Z", "+00:00"))
-        last_detected = datetime.fromisoformat(
-            signal["last_detected_at"].replace("Z", "+00:00")
-        )
-        days_to_expiry = (expiry.date() - date.today()).days
-
-        grade_style = {
-            "S": "bold red",
-            "A": "bold yellow",
-            "B": "bold blue",
-            "C": "bold green",
-            "D": "dim",
-            "F": "dim red",
-        }.get(signal["grade"], "white")
-
-        table.add_row(
-            signal["ticker"],
-            signal["option_symbol"][-15:],  # Last 15 chars
-            f"[{grade_style}]{signal['grade']}[/{grade_style}]",
-            expiry.strftime("%Y-%m-%d"),
-            last_detected.strftime("%Y-%m-%d %H:%M"),
-            str(days_to_expiry),
-        )
+    for expiry, count in sorted((summary.get("by_expiry") or {}).items()):
+        days_to_expiry = (date.fromisoformat(expiry) - date.today()).days
+        table.add_row(expiry, str(days_to_expiry), str(count))
 
     console.print("\n")
     console.print(table)
 
+    grade_style = {
+        "S": "bold red",
+        "A": "bold yellow",
+        "B": "bold blue",
+        "C": "bold green",
+        "D": "dim",
+        "F": "dim red",
+    }
+    by_grade = summary.get("by_grade") or {}
+    grades = "  ".join(
+        f"[{grade_style.get(grade, 'white')}]{grade}[/]: {by_grade[grade]}"
+        for grade in sorted(by_grade, key=lambda g: -GRADE_ORDER.get(g, 0))
+    )
+    console.print(f"[bold]By grade:[/bold] {grades}")
+
 
-def display_detailed_info(signals: list[dict[str, Any]]) -> None:
+def display_detailed_info(summary: dict[str, Any]) -> None:
     """Display detailed information about signals."""
-    by_ticker = {}
-    for signal in signals:
-        ticker = signal["ticker"]
-        if ticker not in by_ticker:
-            by_ticker[ticker] = []
-        by_ticker[ticker].append(signal)
+    by_ticker = summary.get("by_ticker") or {}
 
     console.print("\n[bold]Breakdown by Ticker:[/bold]")
-    for ticker, ticker_signals in sorted(
-        by_ticker.items(), key=lambda x: len(x[1]), reverse=True
-    )[:10]:  # Top 10
-        console.print(f"  • {ticker}: {len(ticker_signals)} signals")
+    top_tickers = sorted(by_ticker.items(), key=lambda x: x[1], reverse=True)[:10]
+    for ticker, count in top_tickers:
+        console.print(f"  • {ticker}: {count} signals")
 
 
-def reactivate_signals(
-    client: Client, signals: list[dict[str, Any]], dry_run: bool = False
-) -> int:
+def reactivate_signals(client: Client, days_back: int = 7) -> int:
     """
     Reactivate the falsely inactive signals.
 
     Returns:
         Number of signals successfully reactivated
     """
-    if not signals:
-        return 0
-
-    if dry_run:
-        console.print("\n[yellow]DRY RUN: Would reactivate these signals[/yellow]")
-        return len(signals)
+    console.print("\n[cyan]Reactivating signals...[/cyan]")
 
-    console.print(f"\n[cyan]Reactivating {len(signals)} signals...[/cyan]")
-
-    # Get signal IDs
-    signal_ids = [s["signal_id"] for s in signals]
-
-    # Batch update
-    result = (
-        client.table("unusual_options_signals")
-        .update({"is_active": True, "updated_at": datetime.now(UTC).isoformat()})
-        .in_("signal_id", signal_ids)
-        .execute()
-    )
+    summary = find_falsely_inactive_signals(client, days_back, dry_run=False)
+    count = summary.get("signals_reactivated", 0)
 
-    if result.data:
-        count = len(result.data)
+    if count:
         console.print(f"[green]✓ Successfully reactivated {count} signals[/green]")
-        return count
     else:
         console.print("[red]✗ Failed to reactivate signals[/red]")
-        return 0
+    return count
 
 
 def verify_reactivation(client: Client, days_back: int = 7) -> None:
     """Verify no more falsely inactive signals exist."""
-    signals = get_falsely_inactive_signals(client, days_back)
+    remaining = find_falsely_inactive_signals(client, days_back).get("signals_found", 0)
 
-    if not signals:
+    if not remaining:
         console.print("\n[green bold]✓ Verification passed![/green bold]")
         console.print("No falsely inactive signals remaining.")
     else:
         console.print(
-            f"\n[yellow]⚠ Warning: Still {len(signals)} "
+            f"\n[yellow]⚠ Warning: Still {remaining} "
             f"falsely inactive signals found[/yellow]"
         )
 
 
 def get_stats(client: Client) -> dict[str, int]:
     """Get current signal statistics."""
-    # Active signals
-    active_result = (
-        client.table("unusual_options_signals")
-        .select("signal_id", count="exact")
-        .eq("is_active", True)
-        .execute()
-    )
-
-    # Inactive signals (expired)
-    today = date.today()
-    inactive_expired = (
-        client.table("unusual_options_signals")
-        .select("signal_id", count="exact")
-        .eq("is_active", False)
-        .lt("expiry", today.isoformat())
-        .execute()
-    )
-
-    # Inactive signals (not expired - should be 0 after fix)
-    inactive_not_expired = (
-        client.table("unusual_options_signals")
-        .select("signal_id", count="exact")
-        .eq("is_active", False)
-        .gte("expiry", today.isoformat())
-        .execute()
-    )
+    result = client.rpc(
+        "uo_signal_activity_counts", {"p_as_of": date.today().isoformat()}
+    ).execute()
+    counts = result.data or {}
 
     return {
-        "active": active_result.count or 0,
-        "inactive_expired": inactive_expired.count or 0,
-        "inactive_not_expired": inactive_not_expired.count or 0,
+        "active": counts.get("active", 0),
+        "inactive_expired": counts.get("inactive_expired", 0),
+        "inactive_not_expired": counts.get("inactive_not_expired", 0),
     }
 
 
@@ -283,27 +239,28 @@ def main():
             console.print("No action needed.")
             return
 
-        # Find falsely inactive signals
-        signals = get_falsely_inactive_signals(client, args.days)
+        # Count falsely inactive signals (dry run)
+        summary = find_falsely_inactive_signals(client, args.days)
+        signals_found = summary.get("signals_found", 0)
 
-        if not signals:
+        if not signals_found:
             console.print("\n[green]✓ No falsely inactive signals found![/green]")
             return
 
         # Display summary
-        display_signal_summary(signals)
+        display_signal_summary(summary)
 
         if args.verbose:
-            display_detailed_info(signals)
+            display_detailed_info(summary)
 
         # Reactivate
         if args.dry_run:
             console.print("\n[yellow]DRY RUN MODE[/yellow]")
-            console.print(f"Would reactivate {len(signals)} signals")
+            console.print(f"Would reactivate {signals_found} signals")
         else:
             # Confirm
             console.print(
-                f"\n[yellow]About to reactivate {len(signals)} signals. "
+                f"\n[yellow]About to reactivate {signals_found} signals. "
                 f"Continue?[/yellow]"
             )
             response = input("Type 'yes' to confirm: ")
@@ -313,7 +270,7 @@ def main():
                 return
 
             # Do it
-            count = reactivate_signals(client, signals, dry_run=False)
+            count = reactivate_signals(client, args.days)
 
             if count > 0:
                 # Verify
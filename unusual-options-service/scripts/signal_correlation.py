@@ -11,15 +11,17 @@ This script helps identify:
 """
 
 import asyncio
-import math
 import os
 import statistics
 import sys
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
@@ -31,11 +33,27 @@ from rich.panel import Panel
 from rich.table import Table
 
 from unusual_options.config import load_config
-from unusual_options.storage.database import get_storage
-from unusual_options.storage.models import UnusualOptionsSignal
+from unusual_options.storage.batch import SignalBatch, SignalRow
+from unusual_options.storage.signal_store import SignalQuery, get_signal_store
 
 console = Console()
 
+# Signal columns this report reads
+REPORT_COLUMNS = (
+    "ticker",
+    "option_type",
+    "days_to_expiry",
+    "moneyness",
+    "premium_flow",
+    "sentiment",
+    "overall_score",
+    "grade",
+    "confidence",
+    "risk_level",
+    "risk_factors",
+    "detection_timestamp",
+)
+
 
 @dataclass
 class CorrelationPair:
@@ -54,7 +72,7 @@ class SignalCluster:
     """Cluster of similar signals"""
 
     cluster_id: int
-    signals: list[UnusualOptionsSignal]
+    signals: list[SignalRow]
     center_characteristics: dict[str, Any]
     cluster_type: str  # SECTOR, PREMIUM_FLOW, EXPIRY, etc.
     risk_level: str
@@ -64,8 +82,10 @@ class SignalCluster:
 class SignalCorrelationAnalyzer:
     def __init__(self):
         self.config = load_config()
-        self.storage = get_storage(self.config)
-        self.signals: list[UnusualOptionsSignal] = []
+        self.signal_store = get_signal_store(self.config)
+        self.signals: SignalBatch = SignalBatch.from_rows([])
+        self.correlation_pair_count = 0
+        self.strong_correlation_count = 0
 
         # Sector mappings (simplified - in production use proper sector data)
         self.sector_map = {
@@ -143,120 +163,143 @@ class SignalCorrelationAnalyzer:
         end_date = datetime.now().date() + timedelta(days=1)
         start_date = end_date - timedelta(days=days + 1)
 
-        self.signals = await self.storage.get_signals(
-            min_grade=min_grade, start_date=start_date, end_date=end_date, limit=10000
+        self.signals = await self.signal_store.fetch_batch(
+            SignalQuery(
+                min_grade=min_grade,
+                start_date=start_date,
+                end_date=end_date,
+                columns=REPORT_COLUMNS,
+            )
         )
 
         console.print(f"[green]✓ Loaded {len(self.signals)} signals[/green]")
 
-    def calculate_ticker_correlations(self) -> list[CorrelationPair]:
-        """Calculate correlations between tickers based on signal patterns"""
+    def build_intensity_matrix(
+        self, min_signals: int = 3
+    ) -> tuple[list[str], np.ndarray]:
+        """
+        Pivot signals into a (tickers x hourly buckets) intensity matrix.
+
+        Each cell is the summed overall_score of a ticker's signals in that
+        hour. Buckets are the hours in which any active ticker had a signal.
+
+        Args:
+            min_signals: Minimum signals for a ticker to be included
+
+        Returns:
+            Tuple of (ticker labels, intensity matrix)
+        """
+        if not self.signals:
+            return [], np.zeros((0, 0))
+
+        tickers = self.signals.column("ticker").astype(str)
+        hours = (
+            self.signals.column("detection_timestamp")
+            .astype("datetime64[h]")
+            .astype(np.int64)
+        )
+        scores = np.nan_to_num(self.signals.column("overall_score"))
+
+        # Only analyze tickers with sufficient signals
+        labels, ticker_idx, counts = np.unique(
+            tickers, return_inverse=True, return_counts=True
+        )
+        active = counts[ticker_idx] >= min_signals
+        if not active.any():
+            return [], np.zeros((0, 0))
+
+        labels, ticker_idx = np.unique(tickers[active], return_inverse=True)
+        _, bucket_idx = np.unique(hours[active], return_inverse=True)
+
+        n_tickers = len(labels)
+        n_buckets = int(bucket_idx.max()) + 1
+        flat = np.bincount(
+            ticker_idx * n_buckets + bucket_idx,
+            weights=scores[active],
+            minlength=n_tickers * n_buckets,
+        )
+
+        return labels.tolist(), flat.reshape(n_tickers, n_buckets)
+
+    def calculate_correlation_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Pearson correlation between all rows of an intensity matrix.
+
+        Rows with no variance (or fewer than 3 buckets) get NaN.
+        """
+        n_tickers, n_buckets = matrix.shape
+        if n_buckets < 3:
+            return np.full((n_tickers, n_tickers), np.nan)
+
+        centered = matrix - matrix.mean(axis=1, keepdims=True)
+        norms = np.sqrt((centered * centered).sum(axis=1))
+        valid = norms > 0
+        centered[valid] /= norms[valid, None]
+        centered[~valid] = np.nan
+
+        corr = centered @ centered.T
+        return np.clip(corr, -1.0, 1.0, out=corr)
+
+    def calculate_ticker_correlations(
+        self, top_k: int | None = None, min_abs_correlation: float = 0.0
+    ) -> list[CorrelationPair]:
+        """
+        Calculate correlations between tickers based on signal patterns.
+
+        Args:
+            top_k: Only return the k strongest pairs (None = all pairs)
+            min_abs_correlation: Drop pairs weaker than this
+
+        Returns:
+            Pairs sorted by absolute correlation, strongest first
+        """
+        labels, matrix = self.build_intensity_matrix()
+        if len(labels) < 2:
+            return []
+
+        corr = self.calculate_correlation_matrix(matrix)
+
+        # Unique pairs from the upper triangle
+        rows, cols = np.triu_indices(len(labels), k=1)
+        values = corr[rows, cols]
+        keep = np.isfinite(values) & (np.abs(values) >= min_abs_correlation)
+        rows, cols, values = rows[keep], cols[keep], values[keep]
+
+        self.correlation_pair_count = len(values)
+        self.strong_correlation_count = int((np.abs(values) > 0.5).sum())
+
+        # Sparse top-k extraction without sorting every pair
+        if top_k is not None and len(values) > top_k:
+            top = np.argpartition(-np.abs(values), top_k - 1)[:top_k]
+            rows, cols, values = rows[top], cols[top], values[top]
+
+        order = np.argsort(-np.abs(values), kind="stable")
 
-        # Group signals by ticker and time windows
         ticker_signals = defaultdict(list)
         for signal in self.signals:
             ticker_signals[signal.ticker].append(signal)
-
-        # Only analyze tickers with sufficient signals
-        active_tickers = {
-            ticker: signals
-            for ticker, signals in ticker_signals.items()
-            if len(signals) >= 3
-        }
+        for signals in ticker_signals.values():
+            signals.sort(key=lambda s: s.detection_timestamp)
 
         correlations = []
-        tickers = list(active_tickers.keys())
-
-        for i, ticker1 in enumerate(tickers):
-            for ticker2 in tickers[i + 1 :]:
-                correlation = self._calculate_pair_correlation(
-                    active_tickers[ticker1], active_tickers[ticker2], ticker1, ticker2
+        for i in order:
+            ticker1, ticker2 = labels[rows[i]], labels[cols[i]]
+            signals1, signals2 = ticker_signals[ticker1], ticker_signals[ticker2]
+
+            correlations.append(
+                CorrelationPair(
+                    ticker1=ticker1,
+                    ticker2=ticker2,
+                    correlation=float(values[i]),
+                    shared_signals=self._count_shared_characteristics(
+                        signals1, signals2
+                    ),
+                    total_signals=len(signals1) + len(signals2),
+                    correlation_type=self._determine_correlation_type(ticker1, ticker2),
                 )
-                if correlation:
-                    correlations.append(correlation)
-
-        return sorted(correlations, key=lambda x: abs(x.correlation), reverse=True)
-
-    def _calculate_pair_correlation(
-        self,
-        signals1: list[UnusualOptionsSignal],
-        signals2: list[UnusualOptionsSignal],
-        ticker1: str,
-        ticker2: str,
-    ) -> CorrelationPair | None:
-        """Calculate correlation between two tickers' signal patterns"""
-
-        # Create time-based signal intensity vectors
-        time_buckets = defaultdict(lambda: {"ticker1": 0, "ticker2": 0})
-
-        # Bucket signals by hour
-        for signal in signals1:
-            bucket = signal.detection_timestamp.replace(
-                minute=0, second=0, microsecond=0
             )
-            time_buckets[bucket]["ticker1"] += signal.overall_score
 
-        for signal in signals2:
-            bucket = signal.detection_timestamp.replace(
-                minute=0, second=0, microsecond=0
-            )
-            time_buckets[bucket]["ticker2"] += signal.overall_score
-
-        if len(time_buckets) < 3:
-            return None
-
-        # Calculate correlation
-        values1 = [bucket["ticker1"] for bucket in time_buckets.values()]
-        values2 = [bucket["ticker2"] for bucket in time_buckets.values()]
-
-        if (
-            len(values1) < 3
-            or all(v == 0 for v in values1)
-            or all(v == 0 for v in values2)
-        ):
-            return None
-
-        try:
-            correlation = self._pearson_correlation(values1, values2)
-        except Exception:
-            return None
-
-        # Determine correlation type
-        correlation_type = self._determine_correlation_type(ticker1, ticker2)
-
-        # Count shared signal characteristics
-        shared_signals = self._count_shared_characteristics(signals1, signals2)
-
-        return CorrelationPair(
-            ticker1=ticker1,
-            ticker2=ticker2,
-            correlation=correlation,
-            shared_signals=shared_signals,
-            total_signals=len(signals1) + len(signals2),
-            correlation_type=correlation_type,
-        )
-
-    def _pearson_correlation(self, x: list[float], y: list[float]) -> float:
-        """Calculate Pearson correlation coefficient"""
-        n = len(x)
-        if n < 2:
-            return 0
-
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_x2 = sum(xi * xi for xi in x)
-        sum_y2 = sum(yi * yi for yi in y)
-        sum_xy = sum(xi * yi for xi, yi in zip(x, y, strict=False))
-
-        numerator = n * sum_xy - sum_x * sum_y
-        denominator = math.sqrt(
-            (n * sum_x2 - sum_x * sum_x) * (n * sum_y2 - sum_y * sum_y)
-        )
-
-        if denominator == 0:
-            return 0
-
-        return numerator / denominator
+        return correlations
 
     def _determine_correlation_type(self, ticker1: str, ticker2: str) -> str:
         """Determine the type of correlation between two tickers"""
@@ -275,26 +318,27 @@ class SignalCorrelationAnalyzer:
         return "GENERAL_MARKET"
 
     def _count_shared_characteristics(
-        self, signals1: list[UnusualOptionsSignal], signals2: list[UnusualOptionsSignal]
+        self, signals1: list[SignalRow], signals2: list[SignalRow]
     ) -> int:
-        """Count signals with shared characteristics"""
+        """Count signals with shared characteristics (signals2 sorted by time)"""
         shared = 0
+        times2 = [s.detection_timestamp.timestamp() for s in signals2]
 
         for s1 in signals1:
-            for s2 in signals2:
-                # Check if signals occurred within similar timeframe
-                time_diff = abs(
-                    (s1.detection_timestamp - s2.detection_timestamp).total_seconds()
-                )
-                if time_diff < 3600:  # Within 1 hour
-                    # Check for shared characteristics
-                    if (
-                        s1.option_type == s2.option_type
-                        and s1.sentiment == s2.sentiment
-                        and abs(s1.overall_score - s2.overall_score) < 0.2
-                    ):
-                        shared += 1
-                        break
+            # Only signals that occurred within 1 hour
+            t1 = s1.detection_timestamp.timestamp()
+            lo = bisect_right(times2, t1 - 3600)
+            hi = bisect_left(times2, t1 + 3600)
+
+            for s2 in signals2[lo:hi]:
+                # Check for shared characteristics
+                if (
+                    s1.option_type == s2.option_type
+                    and s1.sentiment == s2.sentiment
+                    and abs(s1.overall_score - s2.overall_score) < 0.2
+                ):
+                    shared += 1
+                    break
 
         return shared
 
@@ -510,8 +554,9 @@ class SignalCorrelationAnalyzer:
             return {"regime": "UNKNOWN", "confidence": 0}
 
         # Sentiment analysis
-        bullish_signals = len([s for s in self.signals if s.sentiment == "BULLISH"])
-        bearish_signals = len([s for s in self.signals if s.sentiment == "BEARISH"])
+        sentiment_counts = self.signals.count_by("sentiment")
+        bullish_signals = sentiment_counts.get("BULLISH", 0)
+        bearish_signals = sentiment_counts.get("BEARISH", 0)
 
         sentiment_ratio = (
             bullish_signals / (bullish_signals + bearish_signals)
@@ -520,15 +565,16 @@ class SignalCorrelationAnalyzer:
         )
 
         # Premium flow analysis
-        total_premium = sum([s.premium_flow for s in self.signals if s.premium_flow])
+        total_premium = float(np.nansum(self.signals.column("premium_flow")))
         avg_premium = total_premium / total_signals if total_signals > 0 else 0
 
         # Volatility analysis (based on signal grades and risk factors)
-        high_grade_signals = len([s for s in self.signals if s.grade in ["S", "A"]])
+        grade_counts = self.signals.count_by("grade")
+        high_grade_signals = grade_counts.get("S", 0) + grade_counts.get("A", 0)
         high_grade_ratio = high_grade_signals / total_signals
 
         # Risk analysis
-        high_risk_signals = len([s for s in self.signals if s.risk_level == "HIGH"])
+        high_risk_signals = self.signals.count_by("risk_level").get("HIGH", 0)
         risk_ratio = high_risk_signals / total_signals
 
         # Determine regime
@@ -717,7 +763,9 @@ class SignalCorrelationAnalyzer:
             )
         )
 
-    async def run_analysis(self, days: int = 14, min_grade: str = "C"):
+    async def run_analysis(
+        self, days: int = 14, min_grade: str = "C", top_k: int | None = 1000
+    ):
         """Run the complete correlation and clustering analysis"""
 
         console.print(
@@ -737,7 +785,7 @@ class SignalCorrelationAnalyzer:
 
         # Calculate correlations
         console.print("[blue]Calculating ticker correlations...[/blue]")
-        correlations = self.calculate_ticker_correlations()
+        correlations = self.calculate_ticker_correlations(top_k=top_k)
 
         # Identify clusters
         console.print("[blue]Identifying signal clusters...[/blue]")
@@ -763,10 +811,10 @@ class SignalCorrelationAnalyzer:
         console.print(
             Panel.fit(
                 f"[bold green]Analysis Complete[/bold green]\n"
-                f"• {len(correlations)} ticker correlations identified\n"
+                f"• {self.correlation_pair_count} ticker correlations identified\n"
                 f"• {len(clusters)} signal clusters found\n"
                 f"• Market regime: {regime_analysis['regime'].replace('_', ' ')}\n"
-                f"• {len([c for c in correlations if abs(c.correlation) > 0.5])} strong correlations detected",
+                f"• {self.strong_correlation_count} strong correlations detected",
                 title="📊 Summary",
                 border_style="green",
             )
@@ -787,10 +835,19 @@ async def main():
         "--min-grade", type=str, default="C", help="Minimum signal grade (default: C)"
     )
 
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=1000,
+        help="Strongest ticker pairs to keep (default: 1000, 0 = all)",
+    )
+
     args = parser.parse_args()
 
     analyzer = SignalCorrelationAnalyzer()
-    await analyzer.run_analysis(days=args.days, min_grade=args.min_grade)
+    await analyzer.run_analysis(
+        days=args.days, min_grade=args.min_grade, top_k=args.top_k or None
+    )
 
 
 if __name__ == "__main__":
@@ -13,13 +13,15 @@ based on:
 
 import asyncio
 import os
-import random
 import statistics
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
@@ -38,11 +40,23 @@ from rich.progress import (
 from rich.table import Table
 
 from unusual_options.config import load_config
-from unusual_options.storage.database import get_storage
 from unusual_options.storage.models import UnusualOptionsSignal
+from unusual_options.storage.signal_store import SignalQuery, get_signal_store
 
 console = Console()
 
+# Signal columns this report reads
+REPORT_COLUMNS = (
+    "ticker",
+    "days_to_expiry",
+    "moneyness",
+    "current_volume",
+    "premium_flow",
+    "overall_score",
+    "grade",
+    "detection_timestamp",
+)
+
 
 @dataclass
 class TradingParameters:
@@ -75,7 +89,7 @@ class PositionSizing:
 class TradeSizingCalculator:
     def __init__(self, trading_params: TradingParameters):
         self.config = load_config()
-        self.storage = get_storage(self.config)
+        self.signal_store = get_signal_store(self.config)
         self.params = trading_params
         self.signals: list[UnusualOptionsSignal] = []
 
@@ -128,24 +142,21 @@ class TradeSizingCalculator:
         end_date = datetime.now().date() + timedelta(days=1)
         start_date = end_date - timedelta(days=days + 1)
 
-        self.signals = await self.storage.get_signals(
-            min_grade=min_grade, start_date=start_date, end_date=end_date, limit=10000
+        # Tradeable signals only (sufficient liquidity, reasonable expiry),
+        # filtered server-side
+        self.signals = await self.signal_store.fetch_signals(
+            SignalQuery(
+                min_grade=min_grade,
+                start_date=start_date,
+                end_date=end_date,
+                min_volume=100,
+                min_dte=7,
+                max_dte=60,
+                min_premium=50000,
+                columns=REPORT_COLUMNS,
+            )
         )
 
-        # Filter for tradeable signals (sufficient liquidity, reasonable expiry)
-        tradeable_signals = []
-        for signal in self.signals:
-            if (
-                signal.current_volume
-                and signal.current_volume >= 100
-                and signal.days_to_expiry
-                and 7 <= signal.days_to_expiry <= 60
-                and signal.premium_flow
-                and signal.premium_flow >= 50000
-            ):
-                tradeable_signals.append(signal)
-
-        self.signals = tradeable_signals
         console.print(f"[green]✓ Loaded {len(self.signals)} tradeable signals[/green]")
 
     def calculate_kelly_fraction(
@@ -293,16 +304,65 @@ class TradeSizingCalculator:
             warnings=warnings,
         )
 
+    def _position_outcome_params(
+        self, positions: list[PositionSizing]
+    ) -> dict[str, np.ndarray]:
+        """Per-position win probability, return distributions and notional"""
+        fallback = self.historical_performance["C"]
+        perfs = [
+            self.historical_performance.get(p.signal.grade, fallback) for p in positions
+        ]
+
+        return {
+            "win_prob": np.array(
+                [
+                    perf["win_rate"] * p.confidence_score
+                    for perf, p in zip(perfs, positions, strict=True)
+                ]
+            ),
+            "win_mean": np.array([perf["avg_win"] for perf in perfs]),
+            "win_std": np.array([perf["volatility"] * 0.5 for perf in perfs]),
+            "loss_mean": np.array([perf["avg_loss"] for perf in perfs]),
+            "loss_std": np.array([perf["volatility"] * 0.3 for perf in perfs]),
+            # Dollar P&L per unit return, as a fraction of the account
+            "notional": np.array([p.recommended_size * 100 for p in positions])
+            / self.params.account_size,
+        }
+
     def run_monte_carlo_simulation(
-        self, positions: list[PositionSizing], num_simulations: int = 1000
+        self,
+        positions: list[PositionSizing],
+        num_simulations: int = 100_000,
+        seed: int | None = None,
+        workers: int = 1,
     ) -> dict[str, Any]:
-        """Run Monte Carlo simulation on portfolio of positions"""
-
+        """
+        Run Monte Carlo simulation on portfolio of positions.
+
+        All paths x positions outcomes are drawn as matrices (in chunks to
+        bound memory), so a million paths take seconds. Drawdown treats each
+        path's positions as trades taken in order.
+
+        Args:
+            positions: Positions to simulate
+            num_simulations: Number of simulated paths
+            seed: Seed for reproducible results
+            workers: Processes to split paths across (1 = in-process)
+        """
         console.print(
-            f"[blue]Running {num_simulations} Monte Carlo simulations...[/blue]"
+            f"[blue]Running {num_simulations:,} Monte Carlo simulations...[/blue]"
         )
 
-        results = []
+        params = self._position_outcome_params(positions)
+        chunk_sizes = [
+            min(MC_CHUNK_SIZE, num_simulations - start)
+            for start in range(0, num_simulations, MC_CHUNK_SIZE)
+        ]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+        jobs = list(zip(chunk_sizes, seeds, strict=True))
+
+        returns_parts = []
+        drawdown_parts = []
 
         with Progress(
             SpinnerColumn(),
@@ -313,53 +373,31 @@ class TradeSizingCalculator:
         ) as progress:
             task = progress.add_task("Simulating...", total=num_simulations)
 
-            for _i in range(num_simulations):
-                portfolio_return = 0
-
-                for position in positions:
-                    grade_perf = self.historical_performance.get(
-                        position.signal.grade, self.historical_performance["C"]
+            if workers > 1 and len(jobs) > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunks = executor.map(
+                        simulate_portfolio_paths,
+                        [params] * len(jobs),
+                        *zip(*jobs, strict=True),
                     )
-
-                    # Simulate trade outcome
-                    if (
-                        random.random()
-                        < grade_perf["win_rate"] * position.confidence_score
+                    for (returns, drawdowns), size in zip(
+                        chunks, chunk_sizes, strict=True
                     ):
-                        # Win
-                        return_pct = random.normalvariate(
-                            grade_perf["avg_win"], grade_perf["volatility"] * 0.5
-                        )
-                    else:
-                        # Loss
-                        return_pct = random.normalvariate(
-                            grade_perf["avg_loss"], grade_perf["volatility"] * 0.3
-                        )
-
-                    position_return = position.recommended_size * 100 * return_pct
-                    portfolio_return += position_return
-
-                results.append(
-                    portfolio_return / self.params.account_size
-                )  # As percentage of account
-                progress.update(task, advance=1)
-
-        # Calculate statistics
-        results.sort()
+                        returns_parts.append(returns)
+                        drawdown_parts.append(drawdowns)
+                        progress.update(task, advance=size)
+            else:
+                for size, chunk_seed in jobs:
+                    returns, drawdowns = simulate_portfolio_paths(
+                        params, size, chunk_seed
+                    )
+                    returns_parts.append(returns)
+                    drawdown_parts.append(drawdowns)
+                    progress.update(task, advance=size)
 
-        return {
-            "mean_return": statistics.mean(results),
-            "median_return": statistics.median(results),
-            "std_dev": statistics.stdev(results),
-            "var_95": results[int(0.05 * len(results))],  # 5th percentile (95% VaR)
-            "var_99": results[int(0.01 * len(results))],  # 1st percentile (99% VaR)
-            "max_loss": min(results),
-            "max_gain": max(results),
-            "prob_profit": len([r for r in results if r > 0]) / len(results),
-            "sharpe_ratio": statistics.mean(results) / statistics.stdev(results)
-            if statistics.stdev(results) > 0
-            else 0,
-        }
+        return summarize_simulation(
+            np.concatenate(returns_parts), np.concatenate(drawdown_parts)
+        )
 
     def display_position_recommendations(self, positions: list[PositionSizing]) -> None:
         """Display position sizing recommendations"""
@@ -452,6 +490,16 @@ class TradeSizingCalculator:
         table.add_row(
             "99% VaR", f"{mc_results['var_99']:.2%}", "1% chance of losing more"
         )
+        table.add_row(
+            "95% CVaR",
+            f"{mc_results['cvar_95']:.2%}",
+            "Average loss in the worst 5%",
+        )
+        table.add_row(
+            "99% CVaR",
+            f"{mc_results['cvar_99']:.2%}",
+            "Average loss in the worst 1%",
+        )
         table.add_row(
             "Maximum Loss", f"{mc_results['max_loss']:.2%}", "Worst case scenario"
         )
@@ -466,6 +514,16 @@ class TradeSizingCalculator:
         table.add_row(
             "Sharpe Ratio", f"{mc_results['sharpe_ratio']:.2f}", "Risk-adjusted return"
         )
+        table.add_row(
+            "Median Drawdown",
+            f"{mc_results['median_drawdown']:.2%}",
+            "Typical peak-to-trough dip",
+        )
+        table.add_row(
+            "95th pct Drawdown",
+            f"{mc_results['drawdown_95']:.2%}",
+            "5% chance of a deeper dip",
+        )
 
         console.print(table)
 
@@ -493,7 +551,14 @@ class TradeSizingCalculator:
             )
         )
 
-    async def run_analysis(self, days: int = 7, min_grade: str = "B"):
+    async def run_analysis(
+        self,
+        days: int = 7,
+        min_grade: str = "B",
+        num_simulations: int = 100_000,
+        seed: int | None = None,
+        workers: int = 1,
+    ):
         """Run the complete trade sizing analysis"""
 
         console.print(
@@ -539,7 +604,9 @@ class TradeSizingCalculator:
 
         if len(top_positions) >= 3:
             console.print()
-            mc_results = self.run_monte_carlo_simulation(top_positions)
+            mc_results = self.run_monte_carlo_simulation(
+                top_positions, num_simulations, seed=seed, workers=workers
+            )
             console.print()
             self.display_monte_carlo_results(mc_results)
 
@@ -558,6 +625,82 @@ class TradeSizingCalculator:
         )
 
 
+# Paths simulated per matrix draw (bounds memory at paths x positions floats)
+MC_CHUNK_SIZE = 250_000
+
+
+def simulate_portfolio_paths(
+    params: dict[str, np.ndarray],
+    num_paths: int,
+    seed: np.random.SeedSequence | int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate portfolio outcomes for a block of paths.
+
+    Each position wins with its own probability and draws a normal return
+    from its win or loss distribution.
+
+    Args:
+        params: Per-position arrays from _position_outcome_params
+        num_paths: Number of paths to draw
+        seed: Seed or SeedSequence for the generator
+
+    Returns:
+        Tuple of (portfolio return per path, max drawdown per path), both
+        as fractions of the account
+    """
+    rng = np.random.default_rng(seed)
+    shape = (num_paths, len(params["notional"]))
+
+    wins = rng.random(shape) < params["win_prob"]
+    noise = rng.standard_normal(shape)
+    return_pct = np.where(
+        wins,
+        params["win_mean"] + params["win_std"] * noise,
+        params["loss_mean"] + params["loss_std"] * noise,
+    )
+
+    # P&L per position as a fraction of account, then the equity curve
+    pnl = return_pct * params["notional"]
+    equity = np.cumsum(pnl, axis=1)
+
+    # Drawdown from the running peak (starting equity counts as a peak)
+    peaks = np.maximum.accumulate(np.maximum(equity, 0.0), axis=1)
+    max_drawdown = (peaks - equity).max(axis=1)
+
+    return equity[:, -1], max_drawdown
+
+
+def summarize_simulation(results: np.ndarray, drawdowns: np.ndarray) -> dict[str, Any]:
+    """Risk statistics from simulated portfolio returns and drawdowns"""
+    results = np.sort(results)
+    n = len(results)
+
+    var_95_idx = int(0.05 * n)
+    var_99_idx = int(0.01 * n)
+    mean = float(results.mean())
+    std = float(results.std(ddof=1)) if n > 1 else 0.0
+
+    return {
+        "num_simulations": n,
+        "mean_return": mean,
+        "median_return": float(np.median(results)),
+        "std_dev": std,
+        "var_95": float(results[var_95_idx]),  # 5th percentile (95% VaR)
+        "var_99": float(results[var_99_idx]),  # 1st percentile (99% VaR)
+        # Expected shortfall: average of the tail beyond VaR
+        "cvar_95": float(results[: var_95_idx + 1].mean()),
+        "cvar_99": float(results[: var_99_idx + 1].mean()),
+        "max_loss": float(results[0]),
+        "max_gain": float(results[-1]),
+        "prob_profit": float((results > 0).mean()),
+        "sharpe_ratio": mean / std if std > 0 else 0,
+        "median_drawdown": float(np.median(drawdowns)),
+        "drawdown_95": float(np.quantile(drawdowns, 0.95)),
+        "max_drawdown": float(drawdowns.max()),
+    }
+
+
 async def main():
     """Main function"""
     import argparse
@@ -584,6 +727,22 @@ async def main():
         "--min-grade", type=str, default="B", help="Minimum signal grade (default: B)"
     )
 
+    parser.add_argument(
+        "--simulations",
+        type=int,
+        default=100_000,
+        help="Number of Monte Carlo paths (default: 100000)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Random seed for reproducible runs"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes to split simulation paths across (default: 1)",
+    )
+
     args = parser.parse_args()
 
     trading_params = TradingParameters(
@@ -591,7 +750,13 @@ async def main():
     )
 
     calculator = TradeSizingCalculator(trading_params)
-    await calculator.run_analysis(days=args.days, min_grade=args.min_grade)
+    await calculator.run_analysis(
+        days=args.days,
+        min_grade=args.min_grade,
+        num_simulations=args.simulations,
+        seed=args.seed,
+        workers=args.workers,
+    )
 
 
 if __name__ == "__main__":
@@ -1,59 +1,16 @@
 """Command-line interface for unusual options scanner."""
 
 import asyncio
-from datetime import date
 
 import click
 from rich.console import Console
 from rich.table import Table
 
 from .config import load_config, setup_logging
+from .data.earnings import get_earnings_calendar
 
 console = Console()
 
-# Cache for earnings dates (shared across CLI invocations)
-_earnings_cache = {}
-
-
-def get_earnings_date(ticker: str) -> date | None:
-    """Get next earnings date for a ticker using yfinance (with caching)"""
-    if ticker in _earnings_cache:
-        return _earnings_cache[ticker]
-
-    try:
-        import yfinance as yf
-
-        yf_ticker = yf.Ticker(ticker)
-        calendar = yf_ticker.calendar
-
-        if calendar and "Earnings Date" in calendar:
-            earnings_dates = calendar["Earnings Date"]
-            if isinstance(earnings_dates, list) and len(earnings_dates) > 0:
-                next_earnings = earnings_dates[0]
-                _earnings_cache[ticker] = next_earnings
-                return next_earnings
-            elif isinstance(earnings_dates, date):
-                _earnings_cache[ticker] = earnings_dates
-                return earnings_dates
-    except Exception:
-        # Silently fail - not all tickers have earnings data
-        pass
-
-    _earnings_cache[ticker] = None
-    return None
-
-
-def days_to_earnings(ticker: str, reference_date: date = None) -> int | None:
-    """Calculate days until next earnings date"""
-    if reference_date is None:
-        reference_date = date.today()
-
-    earnings_date = get_earnings_date(ticker)
-    if earnings_date:
-        delta = (earnings_date - reference_date).days
-        return delta if delta >= 0 else None
-    return None
-
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -71,6 +28,9 @@ def cli(ctx: click.Context) -> None:
     ctx.obj["config"] = load_config()
     setup_logging(ctx.obj["config"])
 
+    # Shared earnings calendar (persisted under CACHE_DIR)
+    get_earnings_calendar(ctx.obj["config"])
+
 
 @cli.command()
 @click.argument("tickers", nargs=-1, required=True)
@@ -79,6 +39,13 @@ def cli(ctx: click.Context) -> None:
 @click.option("--min-grade", default="C", help="Minimum signal grade")
 @click.option("--output", type=click.Path(), help="Output file path")
 @click.option("--store", is_flag=True, help="Store signals in database")
+@click.option(
+    "--max-age",
+    default=None,
+    type=int,
+    help="Reuse cached scans up to this many seconds old, 0 to always fetch "
+    "(default: CACHE_TTL_SECONDS, or 0 with --watch)",
+)
 @click.pass_context
 def scan(
     ctx: click.Context,
@@ -88,6 +55,7 @@ def scan(
     min_grade: str,
     output: str,
     store: bool,
+    max_age: int | None,
 ) -> None:
     """Scan specific tickers for large, suspicious options bets
 
@@ -101,10 +69,14 @@ def scan(
       unusual-options scan ORCL              # Single ticker
       unusual-options scan AAPL MSFT NVDA    # Multiple tickers
       unusual-options scan TSLA --min-grade A --store  # High-grade only, save to DB
+      unusual-options scan NVDA --max-age 0  # Skip the scan cache
     """
     import asyncio
 
     config = ctx.obj["config"]
+    if max_age is None:
+        # Each watch pass should see fresh data, not replay the last one
+        max_age = 0 if watch else config.get("CACHE_TTL_SECONDS", 300)
 
     if watch:
         console.print(
@@ -116,12 +88,14 @@ def scan(
 
         try:
             while True:
-                asyncio.run(_run_scan(config, list(tickers), min_grade, output, store))
+                asyncio.run(
+                    _run_scan(config, list(tickers), min_grade, output, store, max_age)
+                )
                 time.sleep(interval)
         except KeyboardInterrupt:
             console.print("\n[yellow]Stopping monitor...[/yellow]")
     else:
-        asyncio.run(_run_scan(config, list(tickers), min_grade, output, store))
+        asyncio.run(_run_scan(config, list(tickers), min_grade, output, store, max_age))
 
 
 @cli.command(name="scan-all")
@@ -134,9 +108,35 @@ def scan(
 @click.option("--min-grade", default="B", help="Minimum signal grade to display")
 @click.option("--output", type=click.Path(), help="Output file path")
 @click.option("--store", is_flag=True, help="Store signals in database")
+@click.option(
+    "--schedule/--full",
+    "use_schedule",
+    default=None,
+    help="Scan only tickers due by liquidity tier, or the full universe "
+    "(default: SCAN_SCHEDULER_ENABLED)",
+)
+@click.option(
+    "--incremental/--no-incremental",
+    default=None,
+    help="Only re-grade contracts that changed since the last scan "
+    "(default: INCREMENTAL_SCAN_ENABLED)",
+)
+@click.option(
+    "--report-dir",
+    type=click.Path(file_okay=False),
+    help="Write scan_report.json and scan_metrics.prom (stage timings, "
+    "provider counters, slowest tickers) to this directory",
+)
 @click.pass_context
 def scan_all(
-    ctx: click.Context, limit: int | None, min_grade: str, output: str, store: bool
+    ctx: click.Context,
+    limit: int | None,
+    min_grade: str,
+    output: str,
+    store: bool,
+    use_schedule: bool | None,
+    incremental: bool | None,
+    report_dir: str | None,
 ) -> None:
     """Scan entire market for suspicious options activity
 
@@ -149,6 +149,9 @@ def scan_all(
       unusual-options scan-all                    # Scan all tickers
       unusual-options scan-all --min-grade A --store  # High-grade, save to DB
       unusual-options scan-all --limit 500        # Scan first 500 tickers (faster)
+      unusual-options scan-all --full             # Ignore tiers, scan everything
+      unusual-options scan-all --no-incremental   # Re-grade every contract
+      unusual-options scan-all --report-dir reports  # Write timing reports
     """
     import asyncio
 
@@ -159,7 +162,18 @@ def scan_all(
     )
     console.print("[dim]This may take several minutes...[/dim]\n")
 
-    asyncio.run(_run_scan_all(config, limit, min_grade, output, store))
+    asyncio.run(
+        _run_scan_all(
+            config,
+            limit,
+            min_grade,
+            output,
+            store,
+            use_schedule,
+            incremental,
+            report_dir,
+        )
+    )
 
 
 @cli.command()
@@ -184,6 +198,37 @@ def signals(ctx: click.Context, days: int, min_grade: str) -> None:
     asyncio.run(list_signals(config, days, min_grade))
 
 
+@cli.command(name="refresh-earnings")
+@click.option(
+    "--limit", default=None, type=int, help="Maximum number of tickers to refresh"
+)
+@click.option("--force", is_flag=True, help="Refresh entries that are still fresh")
+@click.pass_context
+def refresh_earnings(ctx: click.Context, limit: int | None, force: bool) -> None:
+    """Refresh the shared earnings calendar for the liquid universe
+
+    Fetches earnings dates concurrently for every stale ticker and persists
+    them under CACHE_DIR, so scans and scripts look them up offline.
+
+    Examples:
+
+      unusual-options refresh-earnings
+
+      unusual-options refresh-earnings --force
+    """
+    from .utils.tickers import get_liquid_tickers
+
+    tickers = get_liquid_tickers(limit=limit)
+    calendar = get_earnings_calendar()
+    stale = len(tickers) if force else len(calendar.stale_tickers(tickers))
+
+    console.print(
+        f"[yellow]Refreshing earnings dates for {stale} of {len(tickers)} tickers...[/yellow]"
+    )
+    refreshed = calendar.refresh(tickers, force=force)
+    console.print(f"[green]✓ Refreshed {refreshed} earnings dates[/green]")
+
+
 @cli.command()
 @click.pass_context
 def status(ctx: click.Context) -> None:
@@ -294,7 +339,12 @@ def init() -> None:
 
 
 async def _run_scan(
-    config: dict, tickers: list, min_grade: str, output: str, store: bool = False
+    config: dict,
+    tickers: list,
+    min_grade: str,
+    output: str,
+    store: bool = False,
+    max_age: int = 0,
 ) -> None:
     """Execute a scan operation."""
     from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -302,6 +352,7 @@ async def _run_scan(
     from .scanner.orchestrator import ScanOrchestrator
 
     orchestrator = ScanOrchestrator(config)
+    orchestrator.cache_max_age = max_age
 
     with Progress(
         SpinnerColumn(),
@@ -325,11 +376,27 @@ async def _run_scan(
             console.print(f"[red]Error during scan: {e}[/red]")
             return
 
-    # Store signals in database if requested
-    if store and signals:
+    if orchestrator.result_cache and max_age:
+        console.print(
+            f"[dim]Scan cache (max age {max_age}s): "
+            f"{orchestrator.result_cache.summary()}[/dim]"
+        )
+
+    # Refresh stale earnings dates in the background; display reads the cache
+    if signals:
+        get_earnings_calendar().refresh_in_background(s.ticker for s in signals)
+
+    # Store signals in database if requested; cached replays were stored
+    # by the scan that produced them
+    fresh = orchestrator.fresh_signals(signals)
+    if store and len(fresh) < len(signals):
+        console.print(
+            f"[dim]Not re-storing {len(signals) - len(fresh)} cached signals[/dim]"
+        )
+    if store and fresh:
         from .storage_helpers import store_signals
 
-        await store_signals(config, signals)
+        await store_signals(config, fresh)
 
     # Filter by minimum grade
     filtered_signals = _filter_signals_by_grade(signals, min_grade)
@@ -348,7 +415,14 @@ async def _run_scan(
 
 
 async def _run_scan_all(
-    config: dict, limit: int | None, min_grade: str, output: str, store: bool = False
+    config: dict,
+    limit: int | None,
+    min_grade: str,
+    output: str,
+    store: bool = False,
+    use_schedule: bool | None = None,
+    incremental: bool | None = None,
+    report_dir: str | None = None,
 ) -> None:
     """Execute a scan-all operation."""
     from rich.progress import (
@@ -374,20 +448,40 @@ async def _run_scan_all(
 
         try:
             signals = await orchestrator.scan_all_tickers(
-                min_grade=min_grade, limit=limit
+                min_grade=min_grade,
+                limit=limit,
+                use_schedule=use_schedule,
+                incremental=incremental,
             )
             progress.update(task, completed=100)
 
         except Exception as e:
             progress.stop()
             console.print(f"[red]Error during scan-all: {e}[/red]")
+            _report_scan_metrics(orchestrator.metrics, report_dir)
             return
 
+    # Refresh stale earnings dates in the background; display reads the cache
+    if signals:
+        get_earnings_calendar().refresh_in_background(s.ticker for s in signals)
+
     # Store signals in database if requested
+    stored = True
     if store and signals:
         from .storage_helpers import store_signals
 
-        await store_signals(config, signals)
+        stored = await store_signals(config, signals, metrics=orchestrator.metrics)
+
+    # Incremental baselines only move forward once their signals are stored
+    if stored:
+        orchestrator.commit_snapshots()
+    elif orchestrator.pending_snapshots:
+        console.print(
+            "[yellow]Signals not stored; keeping previous snapshots so the "
+            "next scan re-evaluates these changes[/yellow]"
+        )
+
+    _report_scan_metrics(orchestrator.metrics, report_dir)
 
     # Display results
     if signals:
@@ -402,6 +496,22 @@ async def _run_scan_all(
         )
 
 
+def _report_scan_metrics(metrics, report_dir: str | None) -> None:
+    """Print where scan time went and optionally write report files."""
+    console.print(f"[dim]Scan timing: {metrics.summary()}[/dim]")
+
+    slowest = metrics.slowest_tickers(5)
+    if slowest:
+        console.print(
+            "[dim]Slowest tickers: "
+            + ", ".join(f"{t['ticker']} {t['seconds']:.1f}s" for t in slowest)
+            + "[/dim]"
+        )
+
+    if report_dir:
+        metrics.write_reports(report_dir)
+
+
 def _filter_signals_by_grade(signals: list, min_grade: str) -> list:
     """Filter signals by minimum grade."""
     grade_order = {"S": 6, "A": 5, "B": 4, "C": 3, "D": 2, "F": 1}
@@ -418,6 +528,9 @@ def _display_results_table(signals: list) -> None:
         signals, key=lambda s: s.premium_flow if s.premium_flow else 0, reverse=True
     )
 
+    # Earnings lookups below read the local cache only
+    earnings_calendar = get_earnings_calendar()
+
     table = Table(
         title="🕵️ Unusual Options Activity (Sorted by Premium Flow)",
         show_lines=True,
@@ -492,7 +605,7 @@ def _display_results_table(signals: list) -> None:
             suspicion_score += 10
 
         # Earnings proximity (very important for insider plays)
-        days_until_earnings = days_to_earnings(signal.ticker)
+        days_until_earnings = earnings_calendar.days_to_earnings(signal.ticker)
         if days_until_earnings is not None and 0 <= days_until_earnings <= 14:
             if days_until_earnings == 0:
                 suspicion_factors.append("📊 EARNINGS TODAY")
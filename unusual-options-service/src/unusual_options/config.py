@@ -73,6 +73,15 @@ def load_config() -> dict[str, Any]:
         "MAX_SIGNALS_PER_TICKER": int(
             os.getenv("MAX_SIGNALS_PER_TICKER", "3")
         ),  # Reduced from 5
+        # Options chain fetching (YFinance): expiries by days to expiry
+        "CHAIN_MIN_DTE": int(os.getenv("CHAIN_MIN_DTE", "7")),
+        "CHAIN_MAX_DTE": int(os.getenv("CHAIN_MAX_DTE", "120")),
+        # Optional cap, spread across the DTE range (0 = every expiry in range)
+        "CHAIN_MAX_EXPIRIES": int(os.getenv("CHAIN_MAX_EXPIRIES", "0")),
+        "CHAIN_EXPIRY_CONCURRENCY": int(os.getenv("CHAIN_EXPIRY_CONCURRENCY", "4")),
+        "YFINANCE_REQUEST_INTERVAL": float(
+            os.getenv("YFINANCE_REQUEST_INTERVAL", "0.5")
+        ),
         # Alerts
         "DISCORD_WEBHOOK_URL": os.getenv(
             "DISCORD_UOS_WEBHOOK_URL", os.getenv("DISCORD_WEBHOOK_URL", "")
@@ -85,6 +94,47 @@ def load_config() -> dict[str, Any]:
         # Cache
         "REDIS_URL": os.getenv("REDIS_URL", ""),
         "CACHE_TTL_SECONDS": int(os.getenv("CACHE_TTL_SECONDS", "300")),
+        "CACHE_DIR": os.getenv("CACHE_DIR", "cache"),  # Local on-disk caches
+        "SIGNAL_CACHE_ENABLED": os.getenv("SIGNAL_CACHE_ENABLED", "true").lower()
+        == "true",
+        # Full re-fetch of a cached signal scope after this long (drops deletes)
+        "SIGNAL_CACHE_MAX_AGE_HOURS": int(
+            os.getenv("SIGNAL_CACHE_MAX_AGE_HOURS", "24")
+        ),
+        # Recent scan results per ticker, reused by ad-hoc scans for
+        # CACHE_TTL_SECONDS (override with scan --max-age)
+        "SCAN_RESULT_CACHE_ENABLED": os.getenv(
+            "SCAN_RESULT_CACHE_ENABLED", "true"
+        ).lower()
+        == "true",
+        "EARNINGS_CACHE_TTL_HOURS": int(os.getenv("EARNINGS_CACHE_TTL_HOURS", "24")),
+        "EARNINGS_REFRESH_WORKERS": int(os.getenv("EARNINGS_REFRESH_WORKERS", "8")),
+        # Tiered scan scheduling for scan-all
+        "SCAN_SCHEDULER_ENABLED": os.getenv("SCAN_SCHEDULER_ENABLED", "true").lower()
+        == "true",
+        "SCAN_TIER_SIZES": os.getenv("SCAN_TIER_SIZES", "150,500"),
+        "SCAN_TIER_INTERVALS_HOURS": os.getenv("SCAN_TIER_INTERVALS_HOURS", "1,4,24"),
+        "SCAN_DORMANT_INTERVAL_HOURS": int(
+            os.getenv("SCAN_DORMANT_INTERVAL_HOURS", "168")
+        ),
+        "SCAN_DORMANT_AFTER_EMPTY": int(os.getenv("SCAN_DORMANT_AFTER_EMPTY", "3")),
+        "SCAN_BUDGET_PER_RUN": int(os.getenv("SCAN_BUDGET_PER_RUN", "600")),
+        "SCAN_YIELD_WEIGHT": float(os.getenv("SCAN_YIELD_WEIGHT", "2.0")),
+        "SCAN_SIGNAL_LOOKBACK_DAYS": int(os.getenv("SCAN_SIGNAL_LOOKBACK_DAYS", "14")),
+        # Incremental scans: only re-grade contracts that moved since last snapshot
+        "INCREMENTAL_SCAN_ENABLED": os.getenv(
+            "INCREMENTAL_SCAN_ENABLED", "true"
+        ).lower()
+        == "true",
+        "INCREMENTAL_VOLUME_TOLERANCE": float(
+            os.getenv("INCREMENTAL_VOLUME_TOLERANCE", "0.05")
+        ),
+        "INCREMENTAL_OI_TOLERANCE": float(
+            os.getenv("INCREMENTAL_OI_TOLERANCE", "0.02")
+        ),
+        "INCREMENTAL_PRICE_TOLERANCE": float(
+            os.getenv("INCREMENTAL_PRICE_TOLERANCE", "0.05")
+        ),
         # AI Analysis
         "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", ""),
     }
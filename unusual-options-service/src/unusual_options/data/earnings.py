@@ -0,0 +1,201 @@
+"""
+Shared, persistent earnings-calendar store.
+
+One store for the CLI and the analysis scripts, persisted as JSON under
+CACHE_DIR with a TTL. Lookups never touch the network; stale or missing
+tickers are refreshed in bulk (concurrent yfinance calendar requests) by
+the refresh-earnings command or in a background thread that saves its
+progress as it goes.
+"""
+
+import json
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+CACHE_FILENAME = "earnings_calendar.json"
+
+# Fetched tickers between saves, so an interrupted refresh keeps its progress
+SAVE_EVERY = 25
+
+
+def fetch_earnings_date(ticker: str) -> date | None:
+    """Fetch next earnings date for a ticker from yfinance (network)."""
+    try:
+        import yfinance as yf
+
+        calendar = yf.Ticker(ticker).calendar
+
+        if calendar and "Earnings Date" in calendar:
+            earnings_dates = calendar["Earnings Date"]
+            if isinstance(earnings_dates, list) and len(earnings_dates) > 0:
+                # Get the first (next) earnings date
+                earnings_dates = earnings_dates[0]
+            if isinstance(earnings_dates, datetime):
+                return earnings_dates.date()
+            if isinstance(earnings_dates, date):
+                return earnings_dates
+    except Exception:
+        # Silently fail - not all tickers have earnings data
+        pass
+
+    return None
+
+
+class EarningsCalendar:
+    """
+    Earnings dates for the whole universe, persisted locally.
+
+    Entries are ``ticker -> {"date": ISO date | None, "fetched_at": ISO}``.
+    A ticker with no earnings data is cached as None so it is not
+    re-requested until its entry expires.
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        config = config or {}
+        self.path = Path(config.get("CACHE_DIR", "cache")) / CACHE_FILENAME
+        self.ttl = timedelta(hours=config.get("EARNINGS_CACHE_TTL_HOURS", 24))
+        self.max_workers = config.get("EARNINGS_REFRESH_WORKERS", 8)
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, str | None]] = self._load()
+        self._refresh_thread: threading.Thread | None = None
+
+    def _load(self) -> dict[str, dict[str, str | None]]:
+        """Load persisted entries."""
+        if not self.path.exists():
+            return {}
+
+        try:
+            with self.path.open() as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable earnings cache {self.path}: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Atomically persist entries."""
+        with self._lock:
+            snapshot = dict(self._entries)
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with tmp_path.open("w") as f:
+                json.dump(snapshot, f)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Could not write earnings cache {self.path}: {e}")
+
+    def is_fresh(self, ticker: str, now: datetime | None = None) -> bool:
+        """Check whether a ticker has an unexpired entry."""
+        entry = self._entries.get(ticker.upper())
+        if not entry or not entry.get("fetched_at"):
+            return False
+
+        now = now or datetime.now(UTC)
+        return now - datetime.fromisoformat(entry["fetched_at"]) < self.ttl
+
+    def stale_tickers(self, tickers: Iterable[str]) -> list[str]:
+        """Tickers that are missing or past their TTL."""
+        now = datetime.now(UTC)
+        return sorted({t.upper() for t in tickers if not self.is_fresh(t.upper(), now)})
+
+    def get_earnings_date(self, ticker: str) -> date | None:
+        """Get cached next earnings date (no network)."""
+        entry = self._entries.get(ticker.upper())
+        if not entry or not entry.get("date"):
+            return None
+        return date.fromisoformat(entry["date"])
+
+    def days_to_earnings(
+        self, ticker: str, reference_date: date | None = None
+    ) -> int | None:
+        """Calculate days until next earnings date (no network)."""
+        if reference_date is None:
+            reference_date = date.today()
+
+        earnings_date = self.get_earnings_date(ticker)
+        if earnings_date:
+            delta = (earnings_date - reference_date).days
+            return delta if delta >= 0 else None
+        return None
+
+    def refresh(self, tickers: Iterable[str], force: bool = False) -> int:
+        """
+        Refresh earnings dates in bulk with concurrent requests.
+
+        Args:
+            tickers: Tickers to refresh
+            force: Refresh even if entries are still fresh
+
+        Returns:
+            Number of tickers fetched
+        """
+        if force:
+            targets = sorted({t.upper() for t in tickers})
+        else:
+            targets = self.stale_tickers(tickers)
+
+        if not targets:
+            return 0
+
+        logger.info(f"Refreshing earnings dates for {len(targets)} tickers")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(fetch_earnings_date, targets)
+            fetched_at = datetime.now(UTC).isoformat()
+
+            for i, (ticker, earnings_date) in enumerate(
+                zip(targets, results, strict=True), start=1
+            ):
+                with self._lock:
+                    self._entries[ticker] = {
+                        "date": earnings_date.isoformat() if earnings_date else None,
+                        "fetched_at": fetched_at,
+                    }
+                if i % SAVE_EVERY == 0:
+                    self.save()
+
+        self.save()
+        return len(targets)
+
+    def refresh_in_background(self, tickers: Iterable[str]) -> threading.Thread:
+        """
+        Start a bulk refresh in a daemon thread.
+
+        Lookups keep answering from the current entries while it runs, and
+        fetched dates are saved in batches, so callers need not wait for it.
+        """
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return self._refresh_thread
+
+        self._refresh_thread = threading.Thread(
+            target=self.refresh,
+            args=(list(tickers),),
+            name="earnings-refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+        return self._refresh_thread
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for a background refresh to finish."""
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout)
+
+
+_calendar: EarningsCalendar | None = None
+
+
+def get_earnings_calendar(config: dict[str, Any] | None = None) -> EarningsCalendar:
+    """Get the process-wide earnings calendar (created on first call)."""
+    global _calendar
+    if _calendar is None:
+        _calendar = EarningsCalendar(config)
+    return _calendar
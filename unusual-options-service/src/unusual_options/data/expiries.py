@@ -0,0 +1,111 @@
+"""
+Option expiry selection and a per-ticker, per-day expiry list cache.
+
+Expiries are chosen by days to expiry (CHAIN_MIN_DTE..CHAIN_MAX_DTE)
+rather than list position. By default every expiry in that range is
+fetched, so further-dated flow inside the horizon is covered however many
+weeklies a ticker lists. An optional CHAIN_MAX_EXPIRIES cap keeps expiries
+spread evenly across the range (nearest and furthest included), not the
+nearest N.
+
+Listing a ticker's expiries costs a request of its own. The list only
+changes between sessions, so it is cached as
+CACHE_DIR/expiries/<TICKER>.json (expiry date -> Yahoo's expiration
+timestamp) and reused for the rest of the UTC day.
+"""
+
+import json
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+
+def select_expiries(
+    expiries: list[str],
+    today: date,
+    min_dte: int,
+    max_dte: int,
+    max_count: int = 0,
+) -> list[str]:
+    """
+    Pick expiries whose days to expiry fall in [min_dte, max_dte].
+
+    Args:
+        expiries: Expiry dates as YYYY-MM-DD strings
+        today: Reference date for days to expiry
+        min_dte: Minimum days to expiry (inclusive)
+        max_dte: Maximum days to expiry (inclusive)
+        max_count: Keep at most this many, spread evenly across the range
+            (0 = no cap)
+
+    Returns:
+        Selected expiry strings, nearest first
+    """
+    selected = []
+    for expiry in sorted(expiries):
+        try:
+            dte = (date.fromisoformat(expiry) - today).days
+        except ValueError:
+            continue
+        if min_dte <= dte <= max_dte:
+            selected.append(expiry)
+
+    if max_count <= 0 or len(selected) <= max_count:
+        return selected
+    if max_count == 1:
+        return selected[:1]
+
+    # Evenly spaced picks; the step is above 1, so indices never repeat
+    step = (len(selected) - 1) / (max_count - 1)
+    return [selected[round(i * step)] for i in range(max_count)]
+
+
+class ExpiryCache:
+    """Expiry lists per ticker, valid for the UTC day they were fetched."""
+
+    def __init__(self, config: dict[str, Any]):
+        self.dir = Path(config.get("CACHE_DIR", "cache")) / "expiries"
+        self._memory: dict[str, tuple[date, dict[str, int]]] = {}
+
+    def _path(self, ticker: str) -> Path:
+        return self.dir / f"{ticker.upper()}.json"
+
+    def get(self, ticker: str, today: date | None = None) -> dict[str, int] | None:
+        """Get today's expiry -> timestamp mapping for a ticker, if cached."""
+        today = today or datetime.now(UTC).date()
+
+        entry = self._memory.get(ticker)
+        if entry is None:
+            path = self._path(ticker)
+            if not path.exists():
+                return None
+            try:
+                with path.open() as f:
+                    data = json.load(f)
+                entry = (date.fromisoformat(data["date"]), data["expirations"])
+            except (OSError, KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable expiry cache {path}: {e}")
+                return None
+            self._memory[ticker] = entry
+
+        fetched_on, expirations = entry
+        return expirations if fetched_on == today else None
+
+    def put(
+        self, ticker: str, expirations: dict[str, int], today: date | None = None
+    ) -> None:
+        """Store a ticker's expiry list for today."""
+        today = today or datetime.now(UTC).date()
+        self._memory[ticker] = (today, expirations)
+
+        path = self._path(ticker)
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with tmp_path.open("w") as f:
+                json.dump({"date": today.isoformat(), "expirations": expirations}, f)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write expiry cache {path}: {e}")
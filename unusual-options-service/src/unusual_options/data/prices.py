@@ -0,0 +1,279 @@
+"""
+Daily close history and forward returns for signal outcome analysis.
+
+Closes for every ticker are bulk-downloaded in one multi-ticker yfinance
+request (only for tickers the local bar cache does not already cover) and
+laid out as one array sorted by (ticker, trading day). Forward returns for
+all signals are then computed with a single searchsorted lookup: the base
+bar is the first session on or after the detection date, and the N-day bar
+is N sessions after it in that ticker's own trading calendar.
+"""
+
+import json
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+CACHE_FILENAME = "daily_closes.json"
+
+EPOCH = np.datetime64("1970-01-01", "D")
+
+
+def _day_number(d: date) -> int:
+    return int((np.datetime64(d, "D") - EPOCH).astype(np.int64))
+
+
+def download_closes(
+    tickers: Sequence[str], start: date, end: date
+) -> dict[str, dict[str, float]]:
+    """
+    Download daily closes for many tickers in one request.
+
+    Returns:
+        ticker -> {ISO date: close}; tickers without data are omitted
+    """
+    if not tickers:
+        return {}
+
+    import pandas as pd
+    import yfinance as yf
+
+    try:
+        data = yf.download(
+            list(tickers),
+            start=start,
+            end=end + timedelta(days=1),
+            interval="1d",
+            auto_adjust=True,
+            progress=False,
+            threads=True,
+        )
+    except Exception as e:
+        logger.warning(f"Bulk price download failed: {e}")
+        return {}
+
+    if data is None or data.empty:
+        return {}
+
+    closes = data["Close"]
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(name=tickers[0])
+
+    dates = [idx.strftime("%Y-%m-%d") for idx in closes.index]
+    result = {}
+    for ticker in closes.columns:
+        values = closes[ticker].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        if valid.any():
+            result[str(ticker)] = {
+                d: float(v) for d, v, ok in zip(dates, values, valid, strict=True) if ok
+            }
+    return result
+
+
+@dataclass
+class ForwardReturns:
+    """Per-signal prices and returns, aligned with the input order (NaN = n/a)."""
+
+    base_price: np.ndarray
+    latest_price: np.ndarray
+    prices: dict[int, np.ndarray]
+    returns: dict[int, np.ndarray]
+
+    @property
+    def has_base(self) -> np.ndarray:
+        return ~np.isnan(self.base_price)
+
+    def value(self, array: np.ndarray, i: int) -> float | None:
+        """Element i as a float, or None when unavailable."""
+        v = array[i]
+        return None if np.isnan(v) else float(v)
+
+
+class PriceHistory:
+    """Daily closes for a set of tickers, backed by a local bar cache."""
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        config = config or {}
+        self.path = Path(config.get("CACHE_DIR", "cache")) / CACHE_FILENAME
+        self._bars: dict[str, dict[str, Any]] = self._load()
+
+        # Flattened (ticker, day) layout built by _build_index()
+        self._codes: dict[str, int] = {}
+        self._keys = np.empty(0, dtype=np.int64)
+        self._closes = np.empty(0, dtype=np.float64)
+        self._ends = np.empty(0, dtype=np.int64)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with self.path.open() as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable price cache {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with tmp_path.open("w") as f:
+                json.dump(self._bars, f)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Could not write price cache {self.path}: {e}")
+
+    def _is_covered(self, ticker: str, start: date, end: date) -> bool:
+        entry = self._bars.get(ticker)
+        if not entry:
+            return False
+        # Bars before the fetch day are final; the fetch day itself may be partial
+        return entry["start"] <= start.isoformat() and entry["final_through"] >= (
+            end.isoformat()
+        )
+
+    def load(self, tickers: Iterable[str], start: date, end: date) -> None:
+        """
+        Make closes for [start, end] available for all tickers.
+
+        Tickers missing from the cache (or not covering the range) are
+        fetched together in one multi-ticker download.
+        """
+        tickers = sorted(set(tickers))
+        missing = [t for t in tickers if not self._is_covered(t, start, end)]
+
+        if missing:
+            # Tickers already cached from start on only need the tail
+            fetch_start = min(
+                date.fromisoformat(self._bars[t]["final_through"])
+                if t in self._bars and self._bars[t]["start"] <= start.isoformat()
+                else start
+                for t in missing
+            )
+            logger.info(
+                f"Downloading closes for {len(missing)} tickers from {fetch_start}"
+            )
+            today = date.today()
+            downloaded = download_closes(missing, fetch_start, end)
+            last_final = min(end, today - timedelta(days=1)).isoformat()
+
+            for ticker in missing:
+                closes = downloaded.get(ticker)
+                if not closes:
+                    # Failed or empty download: leave the entry (if any) as it
+                    # was so the gap is fetched again next time
+                    continue
+
+                # Only bars that actually came back count as covered
+                final_through = min(max(closes), last_final)
+                entry = self._bars.get(ticker)
+                if entry and entry["start"] <= start.isoformat():
+                    # Extend the cached range rather than replacing it
+                    merged = {**entry["closes"], **closes}
+                    merged_start = entry["start"]
+                    final_through = max(final_through, entry["final_through"])
+                else:
+                    merged = closes
+                    merged_start = start.isoformat()
+                self._bars[ticker] = {
+                    "start": merged_start,
+                    "final_through": final_through,
+                    "closes": merged,
+                }
+            self._save()
+
+        self._build_index(tickers)
+
+    def _build_index(self, tickers: list[str]) -> None:
+        """Flatten closes into one array sorted by (ticker code, day)."""
+        self._codes = {t: i for i, t in enumerate(tickers)}
+        keys, closes, counts = [], [], []
+
+        for ticker, code in self._codes.items():
+            bars = self._bars.get(ticker, {}).get("closes", {})
+            ordered = sorted(bars)
+            days = np.array(ordered, dtype="datetime64[D]")
+            keys.append((code << 32) + (days - EPOCH).astype(np.int64))
+            closes.append(np.array([bars[d] for d in ordered], dtype=np.float64))
+            counts.append(len(ordered))
+
+        self._keys = np.concatenate(keys) if keys else np.empty(0, np.int64)
+        self._closes = np.concatenate(closes) if closes else np.empty(0)
+        # Exclusive end of each ticker's run of bars
+        self._ends = np.cumsum(np.array(counts, dtype=np.int64))
+
+    def forward_returns(
+        self,
+        tickers: Sequence[str],
+        dates: Sequence[date],
+        horizons: Sequence[int] = (1, 5),
+    ) -> ForwardReturns:
+        """
+        Compute forward returns for many (ticker, detection date) pairs.
+
+        Args:
+            tickers: Ticker per signal (must have been passed to load())
+            dates: Detection date per signal
+            horizons: Trading-day horizons
+
+        Returns:
+            ForwardReturns aligned with the inputs
+        """
+        n = len(tickers)
+        nan = np.full(n, np.nan)
+
+        codes = np.array([self._codes.get(t, -1) for t in tickers], dtype=np.int64)
+        known = codes >= 0
+        safe_codes = np.where(known, codes, 0)
+        days = np.array([_day_number(d) for d in dates], dtype=np.int64)
+
+        if len(self._ends):
+            ends = self._ends[safe_codes]
+        else:
+            ends = np.zeros(n, dtype=np.int64)
+
+        # First bar on or after the detection day, within the ticker's run
+        base_pos = np.searchsorted(self._keys, (safe_codes << 32) + days, side="left")
+        has_base = known & (base_pos < ends)
+
+        def take(pos: np.ndarray, valid: np.ndarray) -> np.ndarray:
+            out = nan.copy()
+            out[valid] = self._closes[pos[valid]]
+            return out
+
+        base_price = take(base_pos, has_base)
+        latest_price = take(ends - 1, has_base)
+
+        prices, returns = {}, {}
+        for horizon in horizons:
+            pos = base_pos + horizon
+            price = take(pos, has_base & (pos < ends))
+            prices[horizon] = price
+            returns[horizon] = (price - base_price) / base_price
+
+        return ForwardReturns(
+            base_price=base_price,
+            latest_price=latest_price,
+            prices=prices,
+            returns=returns,
+        )
+
+
+def directional_wins(
+    returns: np.ndarray, is_call: np.ndarray, threshold: float
+) -> np.ndarray:
+    """
+    Win flags for calls (return >= threshold) and puts (<= -threshold).
+
+    Returns an object array of True/False/None (None where the return is NaN).
+    """
+    wins = np.where(is_call, returns >= threshold, returns <= -threshold)
+    out = wins.astype(object)
+    out[np.isnan(returns)] = None
+    return out
@@ -12,6 +12,14 @@ class DataProvider(ABC):
     def __init__(self, config: dict[str, Any]):
         self.config = config
         self.name = self.__class__.__name__
+        # Optional ScanMetrics; set by the orchestrator to count requests,
+        # retries, rate limits and sleep time
+        self.metrics = None
+
+    def _count(self, counter: str, value: float = 1) -> None:
+        """Increment a scan metrics counter if metrics are attached."""
+        if self.metrics is not None:
+            self.metrics.incr(counter, value)
 
     @abstractmethod
     async def get_options_chain(self, ticker: str) -> OptionsChain | None:
@@ -9,6 +9,7 @@ import pandas as pd
 import yfinance as yf
 from loguru import logger
 
+from ..expiries import ExpiryCache, select_expiries
 from ..models import HistoricalData, OptionsChain, OptionsContract
 from .base import DataProvider, RateLimitError
 
@@ -21,7 +22,8 @@ class YFinanceProvider(DataProvider):
         self.name = "YFinance"
 
         # Rate limiting configuration
-        self.base_delay = 0.5  # Base delay between requests (seconds)
+        # Minimum spacing between request starts (seconds)
+        self.base_delay = config.get("YFINANCE_REQUEST_INTERVAL", 0.5)
         self.max_delay = 30.0  # Maximum delay for exponential backoff
         self.max_retries = 3  # Maximum number of retries
         self.backoff_factor = 2.0  # Exponential backoff multiplier
@@ -31,6 +33,12 @@ class YFinanceProvider(DataProvider):
         self.consecutive_errors = 0
         self.rate_limit_until = 0  # Timestamp until which we're rate limited
 
+        # Expiries of one ticker are fetched concurrently
+        self.expiry_concurrency = max(config.get("CHAIN_EXPIRY_CONCURRENCY", 4), 1)
+        self.expiry_cache = ExpiryCache(config)
+        # Chains fetched by get_options_chain, consumed by get_historical_options
+        self._recent_chains: dict[str, OptionsChain] = {}
+
     async def _wait_for_rate_limit(self) -> None:
         """Wait for rate limit to clear and apply base delay."""
         current_time = time.time()
@@ -39,15 +47,20 @@ class YFinanceProvider(DataProvider):
         if current_time < self.rate_limit_until:
             wait_time = self.rate_limit_until - current_time
             logger.info(f"Rate limited, waiting {wait_time:.1f} seconds")
-            await asyncio.sleep(wait_time)
+            await self._sleep(wait_time)
+            current_time = time.time()
 
-        # Apply base delay between requests
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.base_delay:
-            delay = self.base_delay - time_since_last
-            await asyncio.sleep(delay)
+        # Reserve the next request slot, so concurrent requests start at
+        # least base_delay apart while still overlapping in flight
+        slot = max(current_time, self.last_request_time + self.base_delay)
+        self.last_request_time = slot
+        if slot > current_time:
+            await self._sleep(slot - current_time)
 
-        self.last_request_time = time.time()
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep for rate limiting or backoff, counting the time spent."""
+        self._count("sleep_seconds", seconds)
+        await asyncio.sleep(seconds)
 
     def _handle_rate_limit_error(self, error_msg: str) -> None:
         """Handle rate limit error by setting backoff period."""
@@ -79,8 +92,9 @@ class YFinanceProvider(DataProvider):
                 # Wait for rate limit
                 await self._wait_for_rate_limit()
 
-                # Make the request
-                result = request_func(*args, **kwargs)
+                # Make the request in a worker thread so requests overlap
+                self._count("requests")
+                result = await asyncio.to_thread(request_func, *args, **kwargs)
 
                 # Success - reset error count
                 self._reset_error_count()
@@ -101,9 +115,11 @@ class YFinanceProvider(DataProvider):
                         "requests per second",
                     ]
                 ):
+                    self._count("rate_limited")
                     self._handle_rate_limit_error(error_msg)
 
                     if attempt < self.max_retries:
+                        self._count("retries")
                         logger.info(
                             f"Retrying request (attempt {attempt + 1}/{self.max_retries})"
                         )
@@ -124,7 +140,8 @@ class YFinanceProvider(DataProvider):
                         logger.warning(
                             f"Recoverable error, retrying in {wait_time}s: {e}"
                         )
-                        await asyncio.sleep(wait_time)
+                        self._count("retries")
+                        await self._sleep(wait_time)
                         continue
 
                 # Non-recoverable error or max retries exceeded
@@ -137,6 +154,10 @@ class YFinanceProvider(DataProvider):
         """
         Get current options chain from YFinance.
 
+        Expiries between CHAIN_MIN_DTE and CHAIN_MAX_DTE days out are
+        fetched concurrently (up to CHAIN_EXPIRY_CONCURRENCY at a time,
+        still spaced by the request interval).
+
         Args:
             ticker: Stock ticker symbol
 
@@ -151,75 +172,54 @@ class YFinanceProvider(DataProvider):
                 current_price = info.get("currentPrice") or info.get(
                     "regularMarketPrice"
                 )
-                expiry_dates = yf_ticker.options
-                return yf_ticker, current_price, expiry_dates
+                return yf_ticker, current_price
 
-            (
-                yf_ticker,
-                current_price,
-                expiry_dates,
-            ) = await self._make_request_with_retry(get_ticker_info)
+            yf_ticker, current_price = await self._make_request_with_retry(
+                get_ticker_info
+            )
 
             if not current_price:
                 logger.warning(f"Could not get current price for {ticker}")
                 return None
 
-            if not expiry_dates:
+            expirations = await self._get_expirations(ticker, yf_ticker)
+            if not expirations:
                 logger.warning(f"No options available for {ticker}")
                 return None
 
-            # Get options for all available expiries (limit to first 4 for performance)
-            all_contracts = []
-
-            for expiry_str in expiry_dates[:4]:  # Limit to avoid too many requests
-                try:
-                    expiry_date = datetime.strptime(expiry_str, "%Y-%m-%d").date()
-
-                    # Get calls and puts for this expiry with retry logic
-                    def get_option_chain(exp=expiry_str):
-                        return yf_ticker.option_chain(exp)
-
-                    option_chain = await self._make_request_with_retry(get_option_chain)
-
-                    # Process calls
-                    if hasattr(option_chain, "calls") and not option_chain.calls.empty:
-                        for _, row in option_chain.calls.iterrows():
-                            contract = self._create_contract_from_yf_row(
-                                row, expiry_date, "call", ticker
-                            )
-                            if contract:
-                                all_contracts.append(contract)
-
-                    # Process puts
-                    if hasattr(option_chain, "puts") and not option_chain.puts.empty:
-                        for _, row in option_chain.puts.iterrows():
-                            contract = self._create_contract_from_yf_row(
-                                row, expiry_date, "put", ticker
-                            )
-                            if contract:
-                                all_contracts.append(contract)
-
-                except RateLimitError:
-                    logger.warning(
-                        f"Rate limit hit while processing {expiry_str} for {ticker}, skipping"
-                    )
-                    continue
-                except Exception as e:
-                    logger.warning(
-                        f"Error processing expiry {expiry_str} for {ticker}: {e}"
-                    )
-                    continue
+            expiries = select_expiries(
+                list(expirations),
+                datetime.now(UTC).date(),
+                min_dte=self.config.get("CHAIN_MIN_DTE", 7),
+                max_dte=self.config.get("CHAIN_MAX_DTE", 120),
+                max_count=self.config.get("CHAIN_MAX_EXPIRIES", 0),
+            )
+            if not expiries:
+                logger.info(f"No expiries within the DTE range for {ticker}")
+                return None
+
+            semaphore = asyncio.Semaphore(self.expiry_concurrency)
+
+            async def fetch_expiry(expiry_str: str) -> list[OptionsContract]:
+                async with semaphore:
+                    return await self._fetch_expiry(yf_ticker, ticker, expiry_str)
+
+            results = await asyncio.gather(*(fetch_expiry(e) for e in expiries))
+            all_contracts = [c for contracts in results for c in contracts]
 
             if not all_contracts:
                 logger.warning(f"No valid options contracts found for {ticker}")
                 return None
 
-            return OptionsChain(
+            chain = OptionsChain(
                 ticker=ticker,
                 underlying_price=float(current_price),
                 contracts=all_contracts,
                 timestamp=datetime.now(UTC),
             )
+            # get_historical_options builds its baseline from this chain
+            self._recent_chains[ticker] = chain
+            return chain
 
         except RateLimitError as e:
             logger.error(f"Rate limit exceeded for {ticker}: {e}")
@@ -228,6 +228,70 @@ class YFinanceProvider(DataProvider):
             logger.error(f"Error fetching options chain for {ticker}: {e}")
             return None
 
+    async def _get_expirations(self, ticker: str, yf_ticker) -> dict[str, int]:
+        """
+        Get a ticker's expiry date -> Yahoo timestamp mapping.
+
+        Uses the day's cached list when available (seeding yfinance with it
+        so option_chain() skips its own listing request), otherwise fetches
+        and caches it.
+        """
+        expirations = self.expiry_cache.get(ticker)
+        if expirations is not None:
+            yf_ticker._expirations.update(expirations)
+            return expirations
+
+        def get_expirations():
+            if not yf_ticker.options:  # Downloads the expiry list
+                return {}
+            return dict(yf_ticker._expirations)
+
+        expirations = await self._make_request_with_retry(get_expirations)
+        if expirations:
+            self.expiry_cache.put(ticker, expirations)
+        return expirations
+
+    async def _fetch_expiry(
+        self, yf_ticker, ticker: str, expiry_str: str
+    ) -> list[OptionsContract]:
+        """Fetch and convert calls and puts for one expiry."""
+        contracts = []
+        try:
+            expiry_date = datetime.strptime(expiry_str, "%Y-%m-%d").date()
+
+            # Get calls and puts for this expiry with retry logic
+            def get_option_chain():
+                return yf_ticker.option_chain(expiry_str)
+
+            option_chain = await self._make_request_with_retry(get_option_chain)
+
+            # Process calls
+            if hasattr(option_chain, "calls") and not option_chain.calls.empty:
+                for _, row in option_chain.calls.iterrows():
+                    contract = self._create_contract_from_yf_row(
+                        row, expiry_date, "call", ticker
+                    )
+                    if contract:
+                        contracts.append(contract)
+
+            # Process puts
+            if hasattr(option_chain, "puts") and not option_chain.puts.empty:
+                for _, row in option_chain.puts.iterrows():
+                    contract = self._create_contract_from_yf_row(
+                        row, expiry_date, "put", ticker
+                    )
+                    if contract:
+                        contracts.append(contract)
+
+        except RateLimitError:
+            logger.warning(
+                f"Rate limit hit while processing {expiry_str} for {ticker}, skipping"
+            )
+        except Exception as e:
+            logger.warning(f"Error processing expiry {expiry_str} for {ticker}: {e}")
+
+        return contracts
+
     def _create_contract_from_yf_row(
         self, row: Any, expiry_date: date, option_type: str, ticker: str
     ) -> OptionsContract | None:
@@ -282,8 +346,11 @@ class YFinanceProvider(DataProvider):
         - This allows volume/OI anomaly detection to work
         """
         try:
-            # Get current options chain to build baseline
-            chain = await self.get_options_chain(ticker)
+            # Build the baseline from the chain just scanned, if any
+            chain = self._recent_chains.pop(ticker, None)
+            if chain is None:
+                chain = await self.get_options_chain(ticker)
+                self._recent_chains.pop(ticker, None)
 
             if not chain or not chain.contracts:
                 logger.warning(f"No options data for {ticker}, cannot create baseline")
@@ -360,7 +427,7 @@ class YFinanceProvider(DataProvider):
             "provider": "YFinance",
             "requests_per_hour": "~2000",  # Approximate
             "requests_per_second": 1,
-            "delay_between_requests": self.rate_limit_delay,
+            "delay_between_requests": self.base_delay,
             "notes": "Free tier with reasonable limits",
         }
 
@@ -0,0 +1,169 @@
+"""
+Per-ticker options chain snapshots for incremental scanning.
+
+Each scan compares the new chain against the last snapshot of the same
+ticker and only contracts whose volume, open interest or last price moved
+beyond a tolerance are re-run through detection and grading.
+
+Snapshots are stored as one .npz file per ticker under
+CACHE_DIR/snapshots, holding contract symbols (sorted) and the compared
+fields as parallel arrays, so the diff is a searchsorted join plus a few
+vectorized comparisons.
+"""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from .models import OptionsChain
+
+SNAPSHOT_FIELDS = ("volume", "open_interest", "last_price")
+
+
+class ChainSnapshot:
+    """Compared fields of one chain, sorted by contract symbol."""
+
+    def __init__(
+        self, symbols: np.ndarray, values: dict[str, np.ndarray], taken_at: datetime
+    ):
+        self.symbols = symbols
+        self.values = values
+        self.taken_at = taken_at
+
+    @classmethod
+    def from_chain(cls, chain: OptionsChain) -> "ChainSnapshot":
+        """Build a snapshot from a fetched chain."""
+        symbols = np.array([c.symbol for c in chain.contracts], dtype=str)
+        values = {
+            name: np.array(
+                [getattr(c, name) or 0 for c in chain.contracts], dtype=np.float64
+            )
+            for name in SNAPSHOT_FIELDS
+        }
+
+        order = np.argsort(symbols, kind="stable")
+        return cls(
+            symbols[order],
+            {name: arr[order] for name, arr in values.items()},
+            chain.timestamp,
+        )
+
+
+class ChainSnapshotStore:
+    """Loads, diffs and saves chain snapshots."""
+
+    def __init__(self, config: dict[str, Any]):
+        self.dir = Path(config.get("CACHE_DIR", "cache")) / "snapshots"
+        self.tolerances = {
+            "volume": config.get("INCREMENTAL_VOLUME_TOLERANCE", 0.05),
+            "open_interest": config.get("INCREMENTAL_OI_TOLERANCE", 0.02),
+            "last_price": config.get("INCREMENTAL_PRICE_TOLERANCE", 0.05),
+        }
+        self._cache: dict[str, ChainSnapshot | None] = {}
+
+    def _path(self, ticker: str) -> Path:
+        return self.dir / f"{ticker.upper()}.npz"
+
+    def load(self, ticker: str) -> ChainSnapshot | None:
+        """Get the last snapshot for a ticker, if any."""
+        if ticker in self._cache:
+            return self._cache[ticker]
+
+        snapshot = None
+        path = self._path(ticker)
+        if path.exists():
+            try:
+                with np.load(path) as data:
+                    snapshot = ChainSnapshot(
+                        data["symbols"],
+                        {name: data[name] for name in SNAPSHOT_FIELDS},
+                        datetime.fromisoformat(str(data["taken_at"])),
+                    )
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable snapshot {path}: {e}")
+
+        self._cache[ticker] = snapshot
+        return snapshot
+
+    def diff(self, chain: OptionsChain) -> np.ndarray:
+        """
+        Flag contracts whose inputs changed since the last snapshot.
+
+        New contracts, and every contract when the snapshot is from an
+        earlier session (volume resets daily), count as changed.
+
+        Returns:
+            Boolean mask aligned with chain.contracts
+        """
+        current = ChainSnapshot.from_chain(chain)
+        changed_sorted = np.ones(len(current.symbols), dtype=bool)
+
+        previous = self.load(chain.ticker)
+        if (
+            previous is not None
+            and len(previous.symbols)
+            and previous.taken_at.astimezone(UTC).date()
+            == current.taken_at.astimezone(UTC).date()
+        ):
+            pos = np.searchsorted(previous.symbols, current.symbols)
+            pos = np.minimum(pos, len(previous.symbols) - 1)
+            known = previous.symbols[pos] == current.symbols
+
+            moved = np.zeros(len(current.symbols), dtype=bool)
+            for name, tolerance in self.tolerances.items():
+                old = previous.values[name][pos]
+                new = current.values[name]
+                moved |= np.abs(new - old) > tolerance * np.maximum(np.abs(old), 1.0)
+
+            changed_sorted = ~known | moved
+
+        # Map back from symbol order to chain order
+        order = np.argsort(
+            np.array([c.symbol for c in chain.contracts], dtype=str), kind="stable"
+        )
+        changed = np.empty(len(order), dtype=bool)
+        changed[order] = changed_sorted
+        return changed
+
+    def commit(self, chain: OptionsChain, changed: np.ndarray) -> None:
+        """
+        Save the new baseline for a ticker after its changes were processed.
+
+        Unchanged contracts keep their previous baseline values so slow
+        drift below the tolerance still accumulates into a change.
+        """
+        current = ChainSnapshot.from_chain(chain)
+        previous = self.load(chain.ticker)
+
+        order = np.argsort(
+            np.array([c.symbol for c in chain.contracts], dtype=str), kind="stable"
+        )
+        changed_sorted = np.asarray(changed, dtype=bool)[order]
+
+        if previous is not None and len(previous.symbols) and not changed_sorted.all():
+            pos = np.searchsorted(previous.symbols, current.symbols)
+            pos = np.minimum(pos, len(previous.symbols) - 1)
+            keep_old = ~changed_sorted & (previous.symbols[pos] == current.symbols)
+            for name in SNAPSHOT_FIELDS:
+                current.values[name] = np.where(
+                    keep_old, previous.values[name][pos], current.values[name]
+                )
+
+        self._cache[chain.ticker] = current
+
+        path = self._path(chain.ticker)
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp.npz")
+            np.savez(
+                tmp_path,
+                symbols=current.symbols,
+                taken_at=np.array(current.taken_at.isoformat()),
+                **current.values,
+            )
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write snapshot {path}: {e}")
@@ -104,6 +104,7 @@ class AnomalyDetector:
         self,
         options_chain: OptionsChain,
         historical_data: HistoricalData | None = None,
+        changed_symbols: set[str] | None = None,
     ) -> list[Detection]:
         """
         Run all detection algorithms on options chain.
@@ -111,6 +112,9 @@ class AnomalyDetector:
         Args:
             options_chain: Current options chain data
             historical_data: Historical data for comparison (optional)
+            changed_symbols: Only run per-contract checks on these contracts
+                (incremental scans); chain-level checks still see the whole
+                chain
 
         Returns:
             List of detected anomalies
@@ -119,6 +123,10 @@ class AnomalyDetector:
         ticker = options_chain.ticker
 
         for contract in options_chain.contracts:
+            # Skip contracts unchanged since the last snapshot
+            if changed_symbols is not None and contract.symbol not in changed_symbols:
+                continue
+
             # Skip contracts with very low volume
             if contract.volume < self.min_option_volume:
                 continue
@@ -3,11 +3,15 @@
 import asyncio
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
 from ..data.providers.yfinance_provider import get_provider_with_fallback
+from ..data.models import OptionsChain
+from ..data.snapshots import ChainSnapshotStore
 from ..scoring.grader import SignalGrader
 from ..storage.models import UnusualOptionsSignal
+from ..utils.metrics import ScanMetrics
 from ..utils.tickers import (
     get_liquid_tickers,
     should_apply_strict_dte_filtering,
@@ -15,6 +19,8 @@ from ..utils.tickers import (
     validate_ticker_symbols,
 )
 from .detector import AnomalyDetector
+from .result_cache import ScanResultCache
+from .scheduler import ScanScheduler
 
 
 class ScanOrchestrator:
@@ -28,11 +34,31 @@ class ScanOrchestrator:
         self.detector = AnomalyDetector(config)
         self.grader = SignalGrader(config)
         self._provider = None
+        # Total options volume per ticker scanned (feeds the scan scheduler)
+        self._chain_volumes: dict[str, int] = {}
+        # Set for incremental scans: only changed contracts are re-graded
+        self.snapshots: ChainSnapshotStore | None = None
+        # Baselines to save once the run's signals are stored (commit_snapshots)
+        self.pending_snapshots: list[tuple[OptionsChain, np.ndarray]] = []
+        self.incremental_stats = {"contracts": 0, "changed": 0, "unchanged_tickers": 0}
+        # Completed scans are always recorded; they are only read back when
+        # cache_max_age is set (ad-hoc scans)
+        self.result_cache = (
+            ScanResultCache(config)
+            if config.get("SCAN_RESULT_CACHE_ENABLED", True)
+            else None
+        )
+        self.cache_max_age: float | None = None
+        # Tickers whose signals were replayed from the cache (already stored)
+        self.cached_tickers: set[str] = set()
+        # Per-ticker stage timings and provider counters for run reports
+        self.metrics = ScanMetrics()
 
     async def _get_provider(self):
         """Get or initialize the data provider."""
         if self._provider is None:
             self._provider = await get_provider_with_fallback(self.config)
+            self._provider.metrics = self.metrics
         return self._provider
 
     async def scan_ticker(
@@ -48,6 +74,12 @@ class ScanOrchestrator:
         Returns:
             List of detected signals
         """
+        with self.metrics.ticker(ticker):
+            return await self._scan_ticker(ticker, skip_blocking)
+
+    async def _scan_ticker(
+        self, ticker: str, skip_blocking: bool
+    ) -> list[UnusualOptionsSignal]:
         logger.info(f"Scanning {ticker}")
 
         # Early filter: Skip blocked tickers (meme stocks only)
@@ -61,12 +93,27 @@ class ScanOrchestrator:
             logger.debug(f"Skipping blocked ticker {ticker} (meme stock)")
             return []
 
+        if self.result_cache and self.cache_max_age:
+            cached = self.result_cache.get(ticker, self.cache_max_age)
+            if cached is not None:
+                if cached.chain is not None:
+                    self._chain_volumes[ticker] = sum(
+                        c.volume or 0 for c in cached.chain.contracts
+                    )
+                logger.info(
+                    f"Using cached scan of {ticker} "
+                    f"({cached.age_seconds():.0f}s old, {len(cached.signals)} signals)"
+                )
+                self.cached_tickers.add(ticker.upper())
+                return cached.signals
+
         try:
             provider = await self._get_provider()
 
             # 1. Fetch current options chain with rate limit handling
             try:
-                options_chain = await provider.get_options_chain(ticker)
+                with self.metrics.span("fetch_chain"):
+                    options_chain = await provider.get_options_chain(ticker)
             except Exception as e:
                 # Check if it's a rate limit error
                 error_msg = str(e).lower()
@@ -80,52 +127,104 @@ class ScanOrchestrator:
                     raise e
 
             if not options_chain or not options_chain.contracts:
+                self._chain_volumes[ticker] = 0
                 logger.warning(f"No options data available for {ticker}")
                 return []
 
             logger.debug(
                 f"Retrieved {len(options_chain.contracts)} contracts for {ticker}"
             )
+            self.metrics.incr("contracts", len(options_chain.contracts))
+            self._chain_volumes[ticker] = sum(
+                c.volume or 0 for c in options_chain.contracts
+            )
+
+            # Incremental scans: diff against the previous snapshot and only
+            # re-grade contracts whose volume, OI or price moved
+            changed_symbols = None
+            if self.snapshots:
+                changed = self.snapshots.diff(options_chain)
+                self.incremental_stats["contracts"] += len(changed)
+                self.incremental_stats["changed"] += int(changed.sum())
+
+                if not changed.any():
+                    self.incremental_stats["unchanged_tickers"] += 1
+                    logger.info(f"No contract changes for {ticker} since last scan")
+                    return []
+
+                changed_symbols = {
+                    c.symbol
+                    for c, is_changed in zip(
+                        options_chain.contracts, changed, strict=True
+                    )
+                    if is_changed
+                }
+                logger.debug(
+                    f"{len(changed_symbols)}/{len(changed)} contracts changed "
+                    f"for {ticker}"
+                )
 
             # 2. Fetch historical context (optional for now since YFinance is limited)
-            historical_data = await provider.get_historical_options(ticker, days=20)
+            with self.metrics.span("fetch_history"):
+                historical_data = await provider.get_historical_options(ticker, days=20)
 
             # 3. Run detection algorithms
-            detections = self.detector.detect_anomalies(options_chain, historical_data)
+            with self.metrics.span("detect"):
+                detections = self.detector.detect_anomalies(
+                    options_chain, historical_data, changed_symbols=changed_symbols
+                )
+
+            # Baseline moves forward only after the signals are stored, so a
+            # failed store re-detects these changes on the next scan
+            if self.snapshots:
+                self.pending_snapshots.append((options_chain, changed))
+
+            # Only a scan that evaluated every contract is a complete result
+            complete = changed_symbols is None or len(changed_symbols) == len(
+                options_chain.contracts
+            )
 
             if not detections:
                 logger.info(f"No anomalies detected for {ticker}")
+                if complete:
+                    self._cache_result(ticker, options_chain, [])
                 return []
 
             # 4. Group detections by contract and create signals
             signals = []
             detection_groups = self._group_detections_by_contract(detections)
 
-            for contract_symbol, contract_detections in detection_groups.items():
-                try:
-                    # Pre-filter detections before scoring
-                    if not self._should_process_detections(
-                        contract_detections, options_chain.underlying_price, ticker
-                    ):
+            with self.metrics.span("grade"):
+                for contract_symbol, contract_detections in detection_groups.items():
+                    try:
+                        # Pre-filter detections before scoring
+                        if not self._should_process_detections(
+                            contract_detections, options_chain.underlying_price, ticker
+                        ):
+                            continue
+
+                        signal = self.grader.create_signal_from_detections(
+                            ticker=ticker,
+                            underlying_price=options_chain.underlying_price,
+                            detections=contract_detections,
+                        )
+
+                        # Post-filter signals based on quality
+                        if self._should_keep_signal(signal):
+                            signals.append(signal)
+
+                    except Exception as e:
+                        logger.error(
+                            f"Error creating signal for {contract_symbol}: {e}"
+                        )
                         continue
 
-                    signal = self.grader.create_signal_from_detections(
-                        ticker=ticker,
-                        underlying_price=options_chain.underlying_price,
-                        detections=contract_detections,
-                    )
-
-                    # Post-filter signals based on quality
-                    if self._should_keep_signal(signal):
-                        signals.append(signal)
-
-                except Exception as e:
-                    logger.error(f"Error creating signal for {contract_symbol}: {e}")
-                    continue
-
             # 5. Sort by score (best first)
             signals.sort(key=lambda s: s.overall_score, reverse=True)
 
+            if complete:
+                self._cache_result(ticker, options_chain, signals)
+
             logger.info(f"Generated {len(signals)} signals for {ticker}")
             return signals
 
@@ -227,14 +326,24 @@ class ScanOrchestrator:
         return capped_signals
 
     async def scan_all_tickers(
-        self, min_grade: str = "C", limit: int | None = None
+        self,
+        min_grade: str = "C",
+        limit: int | None = None,
+        use_schedule: bool | None = None,
+        incremental: bool | None = None,
     ) -> list[UnusualOptionsSignal]:
         """
         Scan all liquid tickers from the database.
 
+        With the scan scheduler enabled (SCAN_SCHEDULER_ENABLED), only the
+        tickers due this run are scanned: hot tickers every run, the tail
+        every few hours or daily, and names with empty chains rarely.
+
         Args:
             min_grade: Minimum grade to return
             limit: Maximum number of tickers to scan
+            use_schedule: Override SCAN_SCHEDULER_ENABLED for this run
+            incremental: Override INCREMENTAL_SCAN_ENABLED for this run
 
         Returns:
             List of signals meeting grade criteria
@@ -243,15 +352,46 @@ class ScanOrchestrator:
             f"Starting scan-all with limit {limit or 'unlimited'}, min grade {min_grade}"
         )
 
+        if use_schedule is None:
+            use_schedule = self.config.get("SCAN_SCHEDULER_ENABLED", True)
+        if incremental is None:
+            incremental = self.config.get("INCREMENTAL_SCAN_ENABLED", True)
+        if incremental:
+            self.snapshots = ChainSnapshotStore(self.config)
+
         # Get liquid tickers from database
-        tickers = get_liquid_tickers(limit=limit)
+        tickers = get_liquid_tickers(
+            min_market_cap=self.config.get("MIN_MARKET_CAP", 1_000_000_000),
+            min_avg_volume=self.config.get("MIN_AVG_VOLUME", 1_000_000),
+            limit=None if use_schedule else limit,
+        )
         logger.info(f"Retrieved {len(tickers)} liquid tickers from database")
 
+        scheduler = None
+        if use_schedule:
+            scheduler = ScanScheduler(self.config)
+            await scheduler.load_signal_activity()
+            plan = scheduler.plan(tickers)
+            logger.info(plan.summary())
+            tickers = plan.tickers[:limit] if limit else plan.tickers
+
         # Scan all tickers
+        self._chain_volumes.clear()
         all_signals = await self.scan_multiple(
             tickers, max_concurrent=3
         )  # Lower concurrency for large scans
 
+        if scheduler:
+            scheduler.record_results(self._chain_volumes, all_signals)
+            scheduler.save()
+
+        if self.snapshots:
+            stats = self.incremental_stats
+            logger.info(
+                f"Incremental scan: re-graded {stats['changed']}/{stats['contracts']} "
+                f"contracts, {stats['unchanged_tickers']} tickers unchanged"
+            )
+
         # Filter by minimum grade
         grade_order = {"S": 6, "A": 5, "B": 4, "C": 3, "D": 2, "F": 1}
         min_grade_value = grade_order.get(min_grade, 3)
@@ -265,6 +405,29 @@ class ScanOrchestrator:
         )
         return filtered_signals
 
+    def _cache_result(
+        self,
+        ticker: str,
+        options_chain: OptionsChain,
+        signals: list[UnusualOptionsSignal],
+    ) -> None:
+        """Record a completed scan in the result cache."""
+        if self.result_cache:
+            self.result_cache.put(ticker, options_chain, signals)
+
+    def commit_snapshots(self) -> None:
+        """Save the baselines of this run's incremental scans."""
+        if self.snapshots:
+            for options_chain, changed in self.pending_snapshots:
+                self.snapshots.commit(options_chain, changed)
+        self.pending_snapshots.clear()
+
+    def fresh_signals(
+        self, signals: list[UnusualOptionsSignal]
+    ) -> list[UnusualOptionsSignal]:
+        """Signals detected by this run, leaving out ones replayed from the cache."""
+        return [s for s in signals if s.ticker.upper() not in self.cached_tickers]
+
     def _group_detections_by_contract(self, detections: list) -> dict[str, list]:
         """Group detections by contract symbol."""
         groups = {}
@@ -439,16 +602,23 @@ class ScanOrchestrator:
 
 
 # Convenience function for simple scans
-async def quick_scan(ticker: str, config: dict[str, Any]) -> list[UnusualOptionsSignal]:
+async def quick_scan(
+    ticker: str, config: dict[str, Any], max_age: float | None = None
+) -> list[UnusualOptionsSignal]:
     """
     Quick scan of a single ticker.
 
     Args:
         ticker: Stock ticker symbol
         config: Configuration dictionary
+        max_age: Reuse a cached scan up to this many seconds old
+            (default: CACHE_TTL_SECONDS; 0 always fetches)
 
     Returns:
         List of signals
     """
     orchestrator = ScanOrchestrator(config)
+    orchestrator.cache_max_age = (
+        config.get("CACHE_TTL_SECONDS", 300) if max_age is None else max_age
+    )
     return await orchestrator.scan_ticker(ticker)
@@ -0,0 +1,162 @@
+"""
+Ticker-level cache of recent scan results.
+
+Every completed scan stores the fetched options chain and the signals it
+produced as CACHE_DIR/scan_results/<TICKER>.json, stamped with the scan
+time. Ad-hoc scans (the scan command, quick_scan) reuse a ticker's entry
+while it is younger than the requested max age instead of fetching the
+chain again, so a ticker the hourly job scanned minutes ago comes back
+instantly.
+"""
+
+import json
+import typing
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import UTC, date, datetime
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from ..data.models import OptionsChain
+from ..storage.models import UnusualOptionsSignal
+
+
+def _encode(value: Any) -> Any:
+    """Convert dataclasses, dates and NumPy scalars to JSON values."""
+    if is_dataclass(value):
+        return {f.name: _encode(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, date):  # Includes datetime
+        return value.isoformat()
+    if isinstance(value, list | tuple):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _encode(v) for k, v in value.items()}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _decode_value(annotation: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(annotation, UnionType) or typing.get_origin(annotation) is (
+        typing.Union
+    ):
+        args = [a for a in typing.get_args(annotation) if a is not NoneType]
+        annotation = args[0] if len(args) == 1 else object
+
+    if annotation is datetime:
+        return datetime.fromisoformat(value)
+    if annotation is date:
+        return date.fromisoformat(value)
+    if typing.get_origin(annotation) is list:
+        (item_type,) = typing.get_args(annotation) or (object,)
+        if is_dataclass(item_type):
+            return [_decode(item_type, v) for v in value]
+    return value
+
+
+def _decode(cls: type, data: dict[str, Any]) -> Any:
+    """Rebuild a dataclass from _encode() output."""
+    hints = typing.get_type_hints(cls)
+    return cls(
+        **{
+            f.name: _decode_value(hints[f.name], data[f.name])
+            for f in fields(cls)
+            if f.name in data
+        }
+    )
+
+
+@dataclass
+class CachedScan:
+    """One ticker's most recent scan."""
+
+    ticker: str
+    scanned_at: datetime
+    chain: OptionsChain | None
+    signals: list[UnusualOptionsSignal]
+
+    def age_seconds(self, now: datetime | None = None) -> float:
+        return ((now or datetime.now(UTC)) - self.scanned_at).total_seconds()
+
+
+class ScanResultCache:
+    """Per-ticker scan results on local disk, with hit/miss counters."""
+
+    def __init__(self, config: dict[str, Any]):
+        self.dir = Path(config.get("CACHE_DIR", "cache")) / "scan_results"
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    def _path(self, ticker: str) -> Path:
+        return self.dir / f"{ticker.upper()}.json"
+
+    def get(
+        self, ticker: str, max_age: float, now: datetime | None = None
+    ) -> CachedScan | None:
+        """
+        Get a ticker's last scan if it is at most max_age seconds old.
+
+        Counts a hit or a miss.
+        """
+        entry = self._load(ticker)
+        if entry is not None and entry.age_seconds(now) <= max_age:
+            self.stats["hits"] += 1
+            return entry
+
+        self.stats["misses"] += 1
+        return None
+
+    def _load(self, ticker: str) -> CachedScan | None:
+        path = self._path(ticker)
+        if not path.exists():
+            return None
+        try:
+            with path.open() as f:
+                data = json.load(f)
+            return CachedScan(
+                ticker=data["ticker"],
+                scanned_at=datetime.fromisoformat(data["scanned_at"]),
+                chain=(_decode(OptionsChain, data["chain"]) if data["chain"] else None),
+                signals=[_decode(UnusualOptionsSignal, s) for s in data["signals"]],
+            )
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable scan cache {path}: {e}")
+            return None
+
+    def put(
+        self,
+        ticker: str,
+        chain: OptionsChain | None,
+        signals: list[UnusualOptionsSignal],
+        scanned_at: datetime | None = None,
+    ) -> None:
+        """Store a completed scan as the ticker's latest result."""
+        scanned_at = scanned_at or (chain.timestamp if chain else datetime.now(UTC))
+        payload = {
+            "ticker": ticker,
+            "scanned_at": scanned_at.isoformat(),
+            "chain": _encode(chain) if chain else None,
+            "signals": _encode(signals),
+        }
+
+        path = self._path(ticker)
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with tmp_path.open("w") as f:
+                json.dump(payload, f, default=str)
+            tmp_path.replace(path)
+            self.stats["stores"] += 1
+        except OSError as e:
+            logger.warning(f"Could not write scan cache {path}: {e}")
+
+    def summary(self) -> str:
+        """One-line hit/miss summary."""
+        return (
+            f"{self.stats['hits']} hit(s), {self.stats['misses']} miss(es), "
+            f"{self.stats['stores']} stored"
+        )
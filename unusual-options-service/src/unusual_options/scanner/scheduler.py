@@ -0,0 +1,307 @@
+"""
+Liquidity-ranked, tiered scan scheduler.
+
+Ranks the ticker universe by recent options volume and past signal yield,
+then assigns tiers that are rescanned at different intervals so each run's
+rate-limit budget goes where signals actually appear.
+
+Ranking inputs:
+- Options volume observed in our own scans (EWMA of total chain volume)
+- Recent signals from the database (count and volume per ticker)
+
+Tiers (configurable):
+- Tier 1: top SCAN_TIER_SIZES[0] tickers, every SCAN_TIER_INTERVALS_HOURS[0]
+- Tier 2: next SCAN_TIER_SIZES[1] tickers, every SCAN_TIER_INTERVALS_HOURS[1]
+- Tier 3: everything else, every SCAN_TIER_INTERVALS_HOURS[2]
+- Dormant: tickers whose chains keep coming back empty, every
+  SCAN_DORMANT_INTERVAL_HOURS
+
+State is persisted as JSON under CACHE_DIR so consecutive runs share it.
+"""
+
+import json
+import math
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from ..storage.models import UnusualOptionsSignal
+
+STATE_FILENAME = "scan_schedule.json"
+
+DORMANT_TIER = 0
+
+# Smoothing for per-ticker volume/yield averages (weight of the newest scan)
+EWMA_ALPHA = 0.3
+
+
+@dataclass
+class TickerScanStats:
+    """Scan history for one ticker."""
+
+    options_volume: float = 0.0  # EWMA of total chain volume
+    signal_yield: float = 0.0  # EWMA of signals per scan
+    scans: int = 0
+    empty_scans: int = 0  # Consecutive scans with no options volume
+    last_scanned: str | None = None  # ISO timestamp
+
+
+@dataclass
+class ScanPlan:
+    """Tickers due this run, best first, and the tier layout they came from."""
+
+    tickers: list[str]
+    tiers: dict[str, int]
+    due_by_tier: dict[int, int] = field(default_factory=dict)
+    deferred: int = 0  # Due but over this run's budget
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        tier_counts = defaultdict(int)
+        for tier in self.tiers.values():
+            tier_counts[tier] += 1
+        layout = ", ".join(
+            f"{_tier_name(t)}={tier_counts[t]} ({self.due_by_tier.get(t, 0)} due)"
+            for t in sorted(tier_counts, key=lambda t: (t == DORMANT_TIER, t))
+        )
+        return (
+            f"Scheduled {len(self.tickers)} tickers [{layout}], "
+            f"{self.deferred} deferred by budget"
+        )
+
+
+def _tier_name(tier: int) -> str:
+    return "dormant" if tier == DORMANT_TIER else f"tier{tier}"
+
+
+def _parse_int_list(value: Any, default: list[int]) -> list[int]:
+    """Parse "100,400" style config values."""
+    if value is None or value == "":
+        return default
+    if isinstance(value, str):
+        return [int(v) for v in value.split(",") if v.strip()]
+    return [int(v) for v in value]
+
+
+class ScanScheduler:
+    """Decides which tickers a scan-all run should cover."""
+
+    def __init__(self, config: dict[str, Any]):
+        self.config = config
+        self.path = Path(config.get("CACHE_DIR", "cache")) / STATE_FILENAME
+
+        self.tier_sizes = _parse_int_list(config.get("SCAN_TIER_SIZES"), [150, 500])
+        self.tier_intervals = [
+            timedelta(hours=h)
+            for h in _parse_int_list(
+                config.get("SCAN_TIER_INTERVALS_HOURS"), [1, 4, 24]
+            )
+        ]
+        if len(self.tier_intervals) != len(self.tier_sizes) + 1:
+            raise ValueError(
+                "SCAN_TIER_INTERVALS_HOURS needs one more entry than SCAN_TIER_SIZES"
+            )
+
+        self.dormant_interval = timedelta(
+            hours=config.get("SCAN_DORMANT_INTERVAL_HOURS", 168)
+        )
+        self.dormant_after = config.get("SCAN_DORMANT_AFTER_EMPTY", 3)
+        self.budget = config.get("SCAN_BUDGET_PER_RUN", 600)
+        self.yield_weight = config.get("SCAN_YIELD_WEIGHT", 2.0)
+
+        self.stats: dict[str, TickerScanStats] = self._load()
+        self.db_activity: dict[str, dict[str, float]] = {}
+
+    def _load(self) -> dict[str, TickerScanStats]:
+        """Load persisted scan stats."""
+        if not self.path.exists():
+            return {}
+
+        try:
+            with self.path.open() as f:
+                raw = json.load(f)
+            return {ticker: TickerScanStats(**s) for ticker, s in raw.items()}
+        except (OSError, json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable scan schedule {self.path}: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Atomically persist scan stats."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with tmp_path.open("w") as f:
+                json.dump({t: asdict(s) for t, s in self.stats.items()}, f)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Could not write scan schedule {self.path}: {e}")
+
+    async def load_signal_activity(self, lookback_days: int | None = None) -> None:
+        """
+        Load per-ticker signal counts and volume from recent stored signals.
+
+        Seeds the ranking on a fresh runner and rewards tickers that
+        produced signals even if we have not scanned them recently.
+        """
+        from ..storage.signal_store import SignalQuery, get_signal_store
+
+        if lookback_days is None:
+            lookback_days = self.config.get("SCAN_SIGNAL_LOOKBACK_DAYS", 14)
+
+        query = SignalQuery(
+            start_date=(datetime.now(UTC) - timedelta(days=lookback_days)).date(),
+            columns=("ticker", "current_volume"),
+        )
+
+        try:
+            signals = await get_signal_store(self.config).fetch_signals(query)
+        except Exception as e:
+            logger.warning(f"Could not load signal activity for scheduling: {e}")
+            return
+
+        activity: dict[str, dict[str, float]] = defaultdict(
+            lambda: {"signals": 0.0, "volume": 0.0}
+        )
+        for signal in signals:
+            entry = activity[signal.ticker]
+            entry["signals"] += 1
+            entry["volume"] += signal.current_volume or 0
+
+        self.db_activity = dict(activity)
+        logger.info(
+            f"Loaded signal activity for {len(self.db_activity)} tickers "
+            f"over {lookback_days} days"
+        )
+
+    def score(self, ticker: str) -> float:
+        """Priority score: log options volume plus weighted signal yield."""
+        stats = self.stats.get(ticker)
+        activity = self.db_activity.get(ticker)
+
+        volume = stats.options_volume if stats else 0.0
+        signal_yield = stats.signal_yield if stats else 0.0
+        if activity:
+            volume = max(volume, activity["volume"])
+            signal_yield += activity["signals"]
+
+        return math.log1p(volume) + self.yield_weight * math.log1p(signal_yield)
+
+    def assign_tiers(self, tickers: list[str]) -> dict[str, int]:
+        """Rank tickers and assign tiers (1 = hottest, 0 = dormant)."""
+        tiers: dict[str, int] = {}
+        ranked = []
+
+        for ticker in dict.fromkeys(tickers):
+            stats = self.stats.get(ticker)
+            if (
+                stats
+                and stats.empty_scans >= self.dormant_after
+                and ticker not in self.db_activity
+            ):
+                tiers[ticker] = DORMANT_TIER
+            else:
+                ranked.append(ticker)
+
+        # Ties (e.g. never-scanned tickers) keep universe order
+        ranked.sort(key=self.score, reverse=True)
+
+        boundaries = []
+        total = 0
+        for size in self.tier_sizes:
+            total += size
+            boundaries.append(total)
+
+        for rank, ticker in enumerate(ranked):
+            tier = 1 + sum(rank >= b for b in boundaries)
+            tiers[ticker] = tier
+
+        return tiers
+
+    def _interval(self, tier: int) -> timedelta:
+        if tier == DORMANT_TIER:
+            return self.dormant_interval
+        return self.tier_intervals[tier - 1]
+
+    def plan(self, tickers: list[str], now: datetime | None = None) -> ScanPlan:
+        """
+        Choose the tickers due this run.
+
+        A ticker is due when it was never scanned or its tier interval has
+        elapsed. Due tickers are ordered by tier, then by how overdue they
+        are, then by score, and capped at SCAN_BUDGET_PER_RUN; the rest
+        stay due and go first next run.
+        """
+        now = now or datetime.now(UTC)
+        tiers = self.assign_tiers(tickers)
+
+        due: list[tuple[int, float, float, str]] = []
+        due_by_tier: dict[int, int] = defaultdict(int)
+
+        for ticker, tier in tiers.items():
+            interval = self._interval(tier)
+            stats = self.stats.get(ticker)
+
+            if stats and stats.last_scanned:
+                elapsed = now - datetime.fromisoformat(stats.last_scanned)
+                # Small slack so an hourly cron does not skip on jitter
+                if elapsed < interval * 0.9:
+                    continue
+                overdue = elapsed / interval
+            else:
+                overdue = math.inf
+
+            due_by_tier[tier] += 1
+            # Dormant tickers only get what is left of the budget
+            tier_order = math.inf if tier == DORMANT_TIER else tier
+            due.append((tier_order, -overdue, -self.score(ticker), ticker))
+
+        due.sort()
+        selected = [ticker for *_, ticker in due[: self.budget]]
+
+        return ScanPlan(
+            tickers=selected,
+            tiers=tiers,
+            due_by_tier=dict(due_by_tier),
+            deferred=max(0, len(due) - len(selected)),
+        )
+
+    def record_results(
+        self,
+        chain_volumes: dict[str, int],
+        signals: list[UnusualOptionsSignal],
+        now: datetime | None = None,
+    ) -> None:
+        """
+        Update stats for the tickers scanned this run.
+
+        Args:
+            chain_volumes: Total options volume per scanned ticker; tickers
+                that failed or were rate limited are absent and keep their
+                previous schedule
+            signals: Signals produced this run
+            now: Scan time
+        """
+        now_iso = (now or datetime.now(UTC)).isoformat()
+
+        signal_counts: dict[str, int] = defaultdict(int)
+        for signal in signals:
+            signal_counts[signal.ticker] += 1
+
+        for ticker, volume in chain_volumes.items():
+            stats = self.stats.setdefault(ticker, TickerScanStats())
+            count = signal_counts.get(ticker, 0)
+
+            if stats.scans == 0:
+                stats.options_volume = float(volume)
+                stats.signal_yield = float(count)
+            else:
+                stats.options_volume += EWMA_ALPHA * (volume - stats.options_volume)
+                stats.signal_yield += EWMA_ALPHA * (count - stats.signal_yield)
+
+            stats.empty_scans = stats.empty_scans + 1 if volume == 0 else 0
+            stats.scans += 1
+            stats.last_scanned = now_iso
@@ -5,7 +5,9 @@ Detects vertical spreads, calendar spreads, and other multi-leg strategies
 with conservative confidence thresholds to minimize false positives.
 """
 
-from dataclasses import dataclass
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import date, datetime
 
 from loguru import logger
@@ -27,6 +29,33 @@ class SpreadAnalysis:
     detection_indicators: list[str]
 
 
+@dataclass
+class _LegBucket:
+    """Sorted candidate legs sharing a bucket key (strike or expiry axis)."""
+
+    keys: list[float] = field(default_factory=list)
+    entries: list[tuple[int, OptionsContract]] = field(default_factory=list)
+
+
+@dataclass
+class _LegIndex:
+    """
+    Candidate-leg lookup for spread matching.
+
+    Verticals are bucketed by (ticker, option type, expiry) with legs sorted
+    by strike; calendars by (ticker, option type, strike) with legs sorted by
+    expiry ordinal. Each entry keeps its position in the detection batch so
+    matches come back in the same order as a linear scan would find them.
+    """
+
+    verticals: dict[tuple[str, str, date], _LegBucket]
+    calendars: dict[tuple[str, str, float], _LegBucket]
+
+
+# OCC-style symbol as built by the providers: TICKER + YYMMDD + C/P + strike*1000
+_OCC_SYMBOL_RE = re.compile(r"^(?P<ticker>.+?)\d{6}[CP]\d{8}$")
+
+
 @dataclass
 class Detection:
     """Import Detection type from detector.py."""
@@ -83,16 +112,16 @@ class SpreadDetector:
         """
         analyses = {}
 
-        # Group by ticker and expiry for vertical spread detection
-        self._group_by_ticker_expiry(detections)
+        # Index candidate legs once so each lookup is a binary search
+        index = self._build_leg_index(detections)
 
-        # Check each signal against others for patterns
+        # Check each signal against its candidate legs for patterns
         for detection in detections:
             contract = detection.contract
             symbol = contract.symbol
 
             # Find potential spread matches
-            potential_matches = self._find_matching_contracts(contract, detections)
+            potential_matches = self._find_matching_contracts(contract, index)
 
             if not potential_matches:
                 # No matches = not a spread
@@ -127,7 +156,7 @@ class SpreadDetector:
         return analyses
 
     def _find_matching_contracts(
-        self, contract: OptionsContract, all_detections: list[Detection]
+        self, contract: OptionsContract, index: _LegIndex
     ) -> list[OptionsContract]:
         """
         Find contracts that could form a spread with given contract.
@@ -137,42 +166,33 @@ class SpreadDetector:
         - Same option type (for vertical spreads)
         - Similar expiry (for vertical) OR same strike (for calendar)
         """
-        matches = []
-
-        for detection in all_detections:
-            other = detection.contract
-
-            # Skip self
-            if other.symbol == contract.symbol:
-                continue
-
-            # Must be same ticker
-            if not other.symbol.startswith(contract.symbol.split("_")[0]):
-                continue
-
-            # Vertical spread: same expiry, same type, different strike
-            if (
-                other.expiry == contract.expiry
-                and other.option_type == contract.option_type
-            ):
-                strike_diff = abs(other.strike - contract.strike)
-
-                # Reasonable spread width
-                if 0 < strike_diff <= self.max_strike_width:
-                    matches.append(other)
-
-            # Calendar spread: same strike, same type, different expiry
-            elif (
-                other.strike == contract.strike
-                and other.option_type == contract.option_type
-            ):
-                days_apart = abs((other.expiry - contract.expiry).days)
-
-                # Calendar spreads typically 7-90 days apart
-                if 7 <= days_apart <= 90:
-                    matches.append(other)
-
-        return matches
+        ticker = self._extract_ticker(contract)
+        candidates: list[tuple[int, OptionsContract]] = []
+
+        # Vertical spread: same expiry, same type, strike within max width
+        bucket = index.verticals.get((ticker, contract.option_type, contract.expiry))
+        if bucket:
+            lo = bisect_left(bucket.keys, contract.strike - self.max_strike_width)
+            hi = bisect_right(bucket.keys, contract.strike + self.max_strike_width)
+            candidates.extend(
+                entry
+                for entry in bucket.entries[lo:hi]
+                if entry[1].strike != contract.strike
+            )
+
+        # Calendar spread: same strike, same type, typically 7-90 days apart
+        bucket = index.calendars.get((ticker, contract.option_type, contract.strike))
+        if bucket:
+            expiry_ordinal = contract.expiry.toordinal()
+            for low, high in ((-90, -7), (7, 90)):
+                lo = bisect_left(bucket.keys, expiry_ordinal + low)
+                hi = bisect_right(bucket.keys, expiry_ordinal + high)
+                candidates.extend(bucket.entries[lo:hi])
+
+        # Preserve batch order so tie-breaking matches a linear scan
+        candidates.sort(key=lambda entry: entry[0])
+
+        return [other for _, other in candidates if other.symbol != contract.symbol]
 
     def _calculate_spread_confidence(
         self, contract: OptionsContract, matches: list[OptionsContract]
@@ -321,26 +341,49 @@ class SpreadDetector:
             detection_indicators=best_indicators,
         )
 
-    def _group_by_ticker_expiry(
-        self, detections: list[Detection]
-    ) -> dict[tuple[str, date, str], list[Detection]]:
-        """Group detections by ticker, expiry, and option type."""
-        grouped = {}
+    def _build_leg_index(self, detections: list[Detection]) -> _LegIndex:
+        """Bucket detections by ticker/type/expiry and ticker/type/strike."""
+        verticals: dict[tuple[str, str, date], _LegBucket] = {}
+        calendars: dict[tuple[str, str, float], _LegBucket] = {}
 
-        for detection in detections:
+        for position, detection in enumerate(detections):
             contract = detection.contract
-
-            # Extract ticker from symbol (before first underscore or digit)
-            symbol_parts = contract.symbol.split("_")
-            ticker = symbol_parts[0] if symbol_parts else contract.symbol
-
-            key = (ticker, contract.expiry, contract.option_type)
-
-            if key not in grouped:
-                grouped[key] = []
-            grouped[key].append(detection)
-
-        return grouped
+            ticker = self._extract_ticker(contract)
+
+            vertical_key = (ticker, contract.option_type, contract.expiry)
+            verticals.setdefault(vertical_key, _LegBucket()).entries.append(
+                (position, contract)
+            )
+
+            calendar_key = (ticker, contract.option_type, contract.strike)
+            calendars.setdefault(calendar_key, _LegBucket()).entries.append(
+                (position, contract)
+            )
+
+        for bucket in verticals.values():
+            bucket.entries.sort(key=lambda entry: entry[1].strike)
+            bucket.keys = [contract.strike for _, contract in bucket.entries]
+
+        for bucket in calendars.values():
+            bucket.entries.sort(key=lambda entry: entry[1].expiry)
+            bucket.keys = [
+                contract.expiry.toordinal() for _, contract in bucket.entries
+            ]
+
+        return _LegIndex(verticals=verticals, calendars=calendars)
+
+    def _extract_ticker(self, contract: OptionsContract) -> str:
+        """Extract the underlying ticker from a contract."""
+        ticker = getattr(contract, "ticker", None)
+        if ticker:
+            return ticker
+
+        match = _OCC_SYMBOL_RE.match(contract.symbol)
+        if match:
+            return match.group("ticker")
+
+        # Fall back to underscore-delimited symbols
+        return contract.symbol.split("_")[0]
 
     def _in_range(self, value: float, bounds: tuple[float, float]) -> bool:
         """Check if value is within bounds."""
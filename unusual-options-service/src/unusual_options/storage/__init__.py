@@ -1,8 +1,10 @@
 """Database storage layer for unusual options scanner."""
 
+from .batch import SignalBatch
 from .models import RiskAssessment, UnusualOptionsSignal
 
 __all__ = [
     "UnusualOptionsSignal",
     "RiskAssessment",
+    "SignalBatch",
 ]
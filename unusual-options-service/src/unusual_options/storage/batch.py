@@ -0,0 +1,429 @@
+"""
+Columnar container for many UnusualOptionsSignal records.
+
+A SignalBatch keeps one NumPy array per signal field instead of one
+dataclass instance per signal: numeric and boolean fields are typed arrays
+(optional floats use NaN for None), timestamps are datetime64, and strings
+and lists are object arrays. Rows are exposed as lightweight __slots__
+views with the same attribute names as UnusualOptionsSignal, so report code
+that reads ``signal.ticker`` works unchanged.
+
+Conversions to and from Supabase row payloads are done column by column,
+and group-by helpers (grade, ticker, classification) use np.unique plus
+bincount instead of per-signal dict appends.
+"""
+
+import json
+import typing
+from collections.abc import Iterator, Sequence
+from dataclasses import MISSING, fields
+from datetime import UTC, date, datetime
+from types import NoneType, UnionType
+from typing import Any
+
+import numpy as np
+
+from .models import GRADE_ORDER, UnusualOptionsSignal
+
+# Array kinds
+FLOAT = "float"  # float64, NaN = None
+INT = "int"  # int64
+BOOL = "bool"  # bool
+DATE = "date"  # datetime64[D]
+DATETIME = "datetime"  # datetime64[us], UTC
+OBJECT = "object"  # str, optional int/bool, lists, dicts
+
+
+def _kind(annotation: Any) -> str:
+    optional = False
+    if isinstance(annotation, UnionType) or typing.get_origin(annotation) is (
+        typing.Union
+    ):
+        args = [a for a in typing.get_args(annotation) if a is not NoneType]
+        optional = len(args) < len(typing.get_args(annotation))
+        annotation = args[0] if len(args) == 1 else object
+
+    if annotation is float:
+        return FLOAT
+    if optional:
+        return OBJECT
+    if annotation is bool:
+        return BOOL
+    if annotation is int:
+        return INT
+    if annotation is datetime:
+        return DATETIME
+    if annotation is date:
+        return DATE
+    return OBJECT
+
+
+_HINTS = typing.get_type_hints(UnusualOptionsSignal)
+FIELD_KINDS: dict[str, str] = {
+    f.name: _kind(_HINTS[f.name]) for f in fields(UnusualOptionsSignal)
+}
+
+
+def _field_default(f: Any) -> Any:
+    if f.default is not MISSING:
+        return f.default
+    if f.default_factory is not MISSING:
+        return None  # Per-row factories (ids, timestamps, lists)
+    return None
+
+
+FIELD_DEFAULTS: dict[str, Any] = {
+    f.name: _field_default(f) for f in fields(UnusualOptionsSignal)
+}
+
+# Row columns whose falsy values fall back like signal_from_row does
+ROW_FALLBACKS: dict[str, Any] = {
+    "average_volume": 0,
+    "previous_oi": 0,
+    "sentiment": "NEUTRAL",
+    "moneyness": "UNKNOWN",
+    "risk_level": "LOW",
+    "has_volume_anomaly": False,
+    "has_oi_spike": False,
+    "has_premium_flow": False,
+    "data_provider": "Unknown",
+}
+
+JSON_LIST_COLUMNS = ("risk_factors", "classification_factors")
+
+
+def _to_array(values: Sequence[Any], kind: str) -> np.ndarray:
+    """Build a typed column from Python values."""
+    if kind == FLOAT:
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    if kind == INT:
+        return np.array([0 if v is None else v for v in values], dtype=np.int64)
+    if kind == BOOL:
+        return np.array([bool(v) for v in values], dtype=bool)
+    if kind == DATE:
+        return np.array(
+            [None if v is None else v for v in values], dtype="datetime64[D]"
+        )
+    if kind == DATETIME:
+        return np.array(
+            [
+                None
+                if v is None
+                else np.datetime64(
+                    v.astimezone(UTC).replace(tzinfo=None) if v.tzinfo else v,
+                    "us",
+                )
+                for v in values
+            ],
+            dtype="datetime64[us]",
+        )
+    out = np.empty(len(values), dtype=object)
+    out[:] = list(values)
+    return out
+
+
+def _to_python(value: Any, kind: str) -> Any:
+    """Convert one array element back to the dataclass field type."""
+    if kind == FLOAT:
+        return None if np.isnan(value) else float(value)
+    if kind == INT:
+        return int(value)
+    if kind == BOOL:
+        return bool(value)
+    if kind == DATE:
+        return None if np.isnat(value) else value.astype(date)
+    if kind == DATETIME:
+        if np.isnat(value):
+            return None
+        return value.astype(datetime).replace(tzinfo=UTC)
+    return value
+
+
+def _column_to_list(array: np.ndarray, kind: str) -> list[Any]:
+    """Convert a whole column to Python values."""
+    if kind == FLOAT:
+        out = array.astype(object)
+        out[np.isnan(array)] = None
+        return out.tolist()
+    if kind in (INT, BOOL):
+        return array.tolist()
+    if kind == DATE:
+        # NaT converts to None
+        return array.astype(object).tolist()
+    if kind == DATETIME:
+        return [
+            None if v is None else v.replace(tzinfo=UTC) for v in array.astype(object)
+        ]
+    return array.tolist()
+
+
+def _parse_json_list(value: Any) -> list:
+    if isinstance(value, list):
+        return value
+    return json.loads(value) if value else []
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class SignalRow:
+    """Read-only view of one signal in a SignalBatch."""
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "SignalBatch", index: int):
+        self._batch = batch
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        return self._batch.value(name, self._index)
+
+    def __repr__(self) -> str:
+        return (
+            f"SignalRow({self.ticker} {self.option_symbol} "
+            f"grade={self.grade} score={self.overall_score})"
+        )
+
+    def to_signal(self) -> UnusualOptionsSignal:
+        """Materialize as a full UnusualOptionsSignal."""
+        return self._batch.signal(self._index)
+
+
+class SignalBatch:
+    """Column-oriented collection of signals."""
+
+    __slots__ = ("columns", "_size")
+
+    def __init__(self, columns: dict[str, np.ndarray], size: int):
+        self.columns = columns
+        self._size = size
+
+    # Construction -------------------------------------------------------
+
+    @classmethod
+    def from_signals(cls, signals: Sequence[UnusualOptionsSignal]) -> "SignalBatch":
+        """Build a batch from signal objects."""
+        columns = {
+            name: _to_array([getattr(s, name) for s in signals], kind)
+            for name, kind in FIELD_KINDS.items()
+        }
+        return cls(columns, len(signals))
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[dict[str, Any]]) -> "SignalBatch":
+        """
+        Build a batch from unusual_options_signals rows.
+
+        Only columns present in the rows are kept (projected queries stay
+        small); other fields read as their dataclass defaults.
+        """
+        present = set()
+        for row in rows[:1]:
+            present.update(row)
+
+        columns = {}
+        for name in present:
+            kind = FIELD_KINDS.get(name)
+            if kind is None:
+                continue
+
+            values = [row.get(name) for row in rows]
+            if name in ROW_FALLBACKS:
+                fallback = ROW_FALLBACKS[name]
+                values = [v or fallback for v in values]
+            if name in JSON_LIST_COLUMNS:
+                values = [_parse_json_list(v) for v in values]
+            elif kind == DATE:
+                values = [date.fromisoformat(v[:10]) if v else None for v in values]
+            elif kind == DATETIME:
+                values = [_parse_timestamp(v) for v in values]
+
+            columns[name] = _to_array(values, kind)
+
+        return cls(columns, len(rows))
+
+    # Access -------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[SignalRow]:
+        for i in range(self._size):
+            yield SignalRow(self, i)
+
+    def __getitem__(self, index: int) -> SignalRow:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return SignalRow(self, index)
+
+    def column(self, name: str) -> np.ndarray:
+        """Column array; absent columns are filled with the field default."""
+        if name in self.columns:
+            return self.columns[name]
+        if name not in FIELD_KINDS:
+            raise AttributeError(name)
+        return _to_array([FIELD_DEFAULTS[name]] * self._size, FIELD_KINDS[name])
+
+    def value(self, name: str, index: int) -> Any:
+        """Single field of one row as a Python value."""
+        if name not in FIELD_KINDS:
+            raise AttributeError(name)
+        if name not in self.columns:
+            return FIELD_DEFAULTS[name]
+        return _to_python(self.columns[name][index], FIELD_KINDS[name])
+
+    def signal(self, index: int) -> UnusualOptionsSignal:
+        """Materialize one row as an UnusualOptionsSignal."""
+        values = {
+            name: _to_python(array[index], FIELD_KINDS[name])
+            for name, array in self.columns.items()
+        }
+        return UnusualOptionsSignal(
+            **{k: v for k, v in values.items() if v is not None or k in _NULLABLE}
+        )
+
+    def to_signals(self) -> list[UnusualOptionsSignal]:
+        """Materialize every row."""
+        return [self.signal(i) for i in range(self._size)]
+
+    # Selection ----------------------------------------------------------
+
+    def take(self, indices: np.ndarray | Sequence[int]) -> "SignalBatch":
+        """New batch with the given rows (in the given order)."""
+        indices = np.asarray(indices, dtype=np.int64)
+        return SignalBatch(
+            {name: array[indices] for name, array in self.columns.items()},
+            len(indices),
+        )
+
+    def filter(self, mask: np.ndarray) -> "SignalBatch":
+        """New batch with rows where mask is True."""
+        return self.take(np.flatnonzero(mask))
+
+    def sort_by(self, name: str, descending: bool = False) -> "SignalBatch":
+        """New batch sorted by a column (NaN last)."""
+        values = self.column(name)
+        order = np.argsort(-values if descending else values, kind="stable")
+        return self.take(order)
+
+    # Group-by -----------------------------------------------------------
+
+    def _codes(self, name: str) -> tuple[list[Any], np.ndarray]:
+        """Unique keys and per-row key codes for a column."""
+        values = self.column(name)
+        if values.dtype == object:
+            values = np.array(["" if v is None else v for v in values], dtype=str)
+        keys, codes = np.unique(values, return_inverse=True)
+        return keys.tolist(), codes
+
+    def group_indices(self, name: str) -> dict[Any, np.ndarray]:
+        """Row indices for each distinct value of a column."""
+        keys, codes = self._codes(name)
+        order = np.argsort(codes, kind="stable")
+        splits = np.cumsum(np.bincount(codes, minlength=len(keys)))[:-1]
+        return dict(zip(keys, np.split(order, splits), strict=True))
+
+    def group_by(self, name: str) -> dict[Any, "SignalBatch"]:
+        """Split into one batch per distinct value of a column."""
+        return {key: self.take(idx) for key, idx in self.group_indices(name).items()}
+
+    def count_by(self, name: str) -> dict[Any, int]:
+        """Row count per distinct value of a column."""
+        keys, codes = self._codes(name)
+        return dict(
+            zip(keys, np.bincount(codes, minlength=len(keys)).tolist(), strict=True)
+        )
+
+    def sum_by(self, value_name: str, name: str) -> dict[Any, float]:
+        """Sum of a numeric column per group (NaN ignored)."""
+        keys, codes = self._codes(name)
+        values = np.nan_to_num(self.column(value_name).astype(np.float64))
+        sums = np.bincount(codes, weights=values, minlength=len(keys))
+        return dict(zip(keys, sums.tolist(), strict=True))
+
+    def mean_by(self, value_name: str, name: str) -> dict[Any, float | None]:
+        """Mean of a numeric column per group (NaN ignored, None if empty)."""
+        keys, codes = self._codes(name)
+        values = self.column(value_name).astype(np.float64)
+        valid = ~np.isnan(values)
+        sums = np.bincount(codes[valid], weights=values[valid], minlength=len(keys))
+        counts = np.bincount(codes[valid], minlength=len(keys))
+        return {
+            key: (float(s / c) if c else None)
+            for key, s, c in zip(keys, sums, counts, strict=True)
+        }
+
+    def group_by_grade(self) -> dict[str, "SignalBatch"]:
+        """Groups by grade, best grade first."""
+        groups = self.group_by("grade")
+        return dict(sorted(groups.items(), key=lambda kv: -GRADE_ORDER.get(kv[0], 0)))
+
+    def group_by_ticker(self) -> dict[str, "SignalBatch"]:
+        """Groups by ticker."""
+        return self.group_by("ticker")
+
+    def group_by_classification(self) -> dict[str, "SignalBatch"]:
+        """Groups by signal_classification."""
+        return self.group_by("signal_classification")
+
+    # Row payloads -------------------------------------------------------
+
+    def to_rows(self, encoders: Sequence[tuple[str, str]]) -> list[dict[str, Any]]:
+        """
+        Encode rows for a Supabase insert, one column at a time.
+
+        Args:
+            encoders: (column, encoding) pairs; encodings are
+                "raw", "float", "float_or_none" (falsy -> None),
+                "float_or_zero" (None -> 0.0), "float_if_set" (None stays
+                None), "iso", "json_or_none" and "list_or_none"
+
+        Returns:
+            One dict per row with the columns in encoder order
+        """
+        names = [name for name, _ in encoders]
+        encoded = [self._encode(name, encoding) for name, encoding in encoders]
+        return [
+            dict(zip(names, values, strict=True))
+            for values in zip(*encoded, strict=True)
+        ]
+
+    def _encode(self, name: str, encoding: str) -> list[Any]:
+        kind = FIELD_KINDS[name]
+        array = self.column(name)
+
+        if encoding in ("float", "float_or_none", "float_or_zero", "float_if_set"):
+            values = array.astype(np.float64)
+            missing = np.isnan(values)
+            if encoding == "float_or_none":
+                missing |= values == 0
+            out = values.astype(object)
+            if encoding == "float_or_zero":
+                out[missing] = 0.0
+            elif encoding != "float":
+                out[missing] = None
+            return out.tolist()
+
+        values = _column_to_list(array, kind)
+        if encoding == "raw":
+            return values
+        if encoding == "iso":
+            return [None if v is None else v.isoformat() for v in values]
+        if encoding == "json_or_none":
+            return [json.dumps(v) if v else None for v in values]
+        if encoding == "list_or_none":
+            return [v if v else None for v in values]
+        raise ValueError(f"Unknown encoding {encoding!r} for {name}")
+
+
+# Fields that may legitimately be None on a materialized signal
+_NULLABLE = {
+    name
+    for name, hint in _HINTS.items()
+    if isinstance(hint, UnionType) and NoneType in typing.get_args(hint)
+}
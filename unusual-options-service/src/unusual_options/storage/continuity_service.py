@@ -9,7 +9,7 @@ This service handles:
 """
 
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from loguru import logger
@@ -17,6 +17,25 @@ from supabase import Client
 
 from .models import UnusualOptionsSignal
 
+# Columns needed to apply a continuity update client-side. Includes every
+# NOT NULL column without a default so the bulk upsert can satisfy the
+# insert half of INSERT ... ON CONFLICT.
+EXISTING_SIGNAL_COLUMNS = (
+    "signal_id, ticker, option_symbol, strike, expiry, option_type, "
+    "days_to_expiry, risk_level, current_volume, current_oi, premium_flow, "
+    "underlying_price, overall_score, grade, signal_group_id, detection_count, "
+    "last_detected_at"
+)
+
+# Max option symbols per in-filter (keeps the PostgREST URL short)
+LOOKUP_CHUNK_SIZE = 200
+
+# Max rows per bulk write request
+WRITE_BATCH_SIZE = 500
+
+# Dedupe key: same columns find_existing_signal() matches on
+SignalKey = tuple[str, str, float, str, str]
+
 
 class SignalContinuityService:
     """
@@ -126,58 +145,9 @@ class SignalContinuityService:
             current_time = datetime.now(UTC).isoformat()
 
             # Prepare data
-            data = {
-                "signal_id": signal_id,
-                "ticker": signal.ticker,
-                "option_symbol": signal.option_symbol,
-                "strike": float(signal.strike),
-                "expiry": signal.expiry.isoformat(),
-                "option_type": signal.option_type,
-                "days_to_expiry": signal.days_to_expiry,
-                "underlying_price": float(signal.underlying_price),
-                "current_volume": signal.current_volume,
-                "current_oi": signal.current_oi,
-                "implied_volatility": float(signal.implied_volatility)
-                if signal.implied_volatility
-                else None,
-                "volume_ratio": float(signal.volume_ratio)
-                if signal.volume_ratio
-                else None,
-                "average_volume": signal.average_volume,
-                "oi_change_pct": float(signal.oi_change_pct)
-                if signal.oi_change_pct
-                else None,
-                "previous_oi": signal.previous_oi,
-                "premium_flow": float(signal.premium_flow)
-                if signal.premium_flow is not None
-                else 0.0,
-                "aggressive_order_pct": float(signal.aggressive_order_pct)
-                if signal.aggressive_order_pct
-                else None,
-                "put_call_ratio": float(signal.put_call_ratio)
-                if signal.put_call_ratio
-                else None,
-                "sentiment": signal.sentiment,
-                "moneyness": signal.moneyness,
-                "overall_score": float(signal.overall_score),
-                "grade": signal.grade,
-                "confidence": float(signal.confidence),
-                "risk_level": signal.risk_level,
-                "risk_factors": signal.risk_factors,
-                "has_volume_anomaly": signal.has_volume_anomaly,
-                "has_oi_spike": signal.has_oi_spike,
-                "has_premium_flow": signal.has_premium_flow,
-                "data_provider": signal.data_provider,
-                "detection_timestamp": signal.detection_timestamp.isoformat(),
-                # Continuity fields
-                # Use current time to prevent false stale detection
-                "is_new_signal": True,
-                "signal_group_id": signal_group_id,
-                "first_detected_at": current_time,  # When we stored it
-                "last_detected_at": current_time,  # When we stored it
-                "detection_count": 1,
-                "is_active": True,
-            }
+            data = self._build_signal_row(
+                signal, signal_id, signal_group_id, current_time
+            )
 
             result = self.client.table("unusual_options_signals").insert(data).execute()
 
@@ -195,12 +165,248 @@ class SignalContinuityService:
             logger.error(f"Error storing new signal: {e}")
             return None
 
+    def _build_signal_row(
+        self,
+        signal: UnusualOptionsSignal,
+        signal_id: str,
+        signal_group_id: str,
+        current_time: str,
+    ) -> dict[str, Any]:
+        """
+        Build the unusual_options_signals row for a newly detected signal.
+
+        Args:
+            signal: Signal to store
+            signal_id: ID for the new row
+            signal_group_id: Continuity group for the new row
+            current_time: ISO timestamp used for first/last detection
+
+        Returns:
+            Row payload for insert
+        """
+        return {
+            "signal_id": signal_id,
+            "ticker": signal.ticker,
+            "option_symbol": signal.option_symbol,
+            "strike": float(signal.strike),
+            "expiry": signal.expiry.isoformat(),
+            "option_type": signal.option_type,
+            "days_to_expiry": signal.days_to_expiry,
+            "underlying_price": float(signal.underlying_price),
+            "current_volume": signal.current_volume,
+            "current_oi": signal.current_oi,
+            "implied_volatility": float(signal.implied_volatility)
+            if signal.implied_volatility
+            else None,
+            "volume_ratio": float(signal.volume_ratio) if signal.volume_ratio else None,
+            "average_volume": signal.average_volume,
+            "oi_change_pct": float(signal.oi_change_pct)
+            if signal.oi_change_pct
+            else None,
+            "previous_oi": signal.previous_oi,
+            "premium_flow": float(signal.premium_flow)
+            if signal.premium_flow is not None
+            else 0.0,
+            "aggressive_order_pct": float(signal.aggressive_order_pct)
+            if signal.aggressive_order_pct
+            else None,
+            "put_call_ratio": float(signal.put_call_ratio)
+            if signal.put_call_ratio
+            else None,
+            "sentiment": signal.sentiment,
+            "moneyness": signal.moneyness,
+            "overall_score": float(signal.overall_score),
+            "grade": signal.grade,
+            "confidence": float(signal.confidence),
+            "risk_level": signal.risk_level,
+            "risk_factors": signal.risk_factors,
+            "has_volume_anomaly": signal.has_volume_anomaly,
+            "has_oi_spike": signal.has_oi_spike,
+            "has_premium_flow": signal.has_premium_flow,
+            "data_provider": signal.data_provider,
+            "detection_timestamp": signal.detection_timestamp.isoformat(),
+            # Continuity fields
+            # Use current time to prevent false stale detection
+            "is_new_signal": True,
+            "signal_group_id": signal_group_id,
+            "first_detected_at": current_time,  # When we stored it
+            "last_detected_at": current_time,  # When we stored it
+            "detection_count": 1,
+            "is_active": True,
+        }
+
+    async def find_existing_signals(
+        self, signals: list[UnusualOptionsSignal]
+    ) -> dict[SignalKey, dict[str, Any]]:
+        """
+        Resolve existing signals for a batch in bulk (within 24 hours).
+
+        Applies the same match as the find_existing_signal() RPC, but with
+        one in-filtered query per chunk of option symbols instead of one
+        round trip per signal.
+
+        Args:
+            signals: Signals to check for duplicates
+
+        Returns:
+            Dict mapping dedupe key to the most recent matching row
+        """
+        symbols = sorted({signal.option_symbol for signal in signals})
+        cutoff = (datetime.now(UTC) - timedelta(hours=24)).isoformat()
+        existing: dict[SignalKey, dict[str, Any]] = {}
+
+        for i in range(0, len(symbols), LOOKUP_CHUNK_SIZE):
+            chunk = symbols[i : i + LOOKUP_CHUNK_SIZE]
+
+            result = (
+                self.client.table("unusual_options_signals")
+                .select(EXISTING_SIGNAL_COLUMNS)
+                .in_("option_symbol", chunk)
+                .eq("is_active", True)
+                .gt("last_detected_at", cutoff)
+                .order("last_detected_at", desc=True)
+                .execute()
+            )
+
+            for row in result.data or []:
+                key = self._row_key(row)
+                # Rows are newest first; keep the most recent per key
+                existing.setdefault(key, row)
+
+        logger.debug(
+            f"Resolved {len(existing)} existing signals for {len(signals)} candidates"
+        )
+        return existing
+
+    def _signal_key(self, signal: UnusualOptionsSignal) -> SignalKey:
+        """Dedupe key for a signal."""
+        return (
+            signal.ticker,
+            signal.option_symbol,
+            round(float(signal.strike), 2),
+            signal.expiry.isoformat(),
+            signal.option_type,
+        )
+
+    def _row_key(self, row: dict[str, Any]) -> SignalKey:
+        """Dedupe key for a stored signal row."""
+        return (
+            row["ticker"],
+            row["option_symbol"],
+            round(float(row["strike"]), 2),
+            str(row["expiry"])[:10],
+            row["option_type"],
+        )
+
+    def _apply_continuity_update(
+        self,
+        row: dict[str, Any],
+        signal: UnusualOptionsSignal,
+        current_time: str,
+    ) -> dict[str, Any]:
+        """
+        Apply a re-detection to a signal row and build its continuity record.
+
+        Mirrors the update_signal_continuity() RPC: the row is updated in
+        place with the new metrics and the history record carries deltas
+        against the previous values.
+
+        Args:
+            row: Current signal row (mutated in place)
+            signal: New signal data
+            current_time: ISO timestamp of this detection
+
+        Returns:
+            Row for unusual_options_signal_continuity
+        """
+        new_premium_flow = float(signal.premium_flow) if signal.premium_flow else 0.0
+        new_score = float(signal.overall_score)
+        old_grade = row["grade"]
+
+        # Same text comparison the RPC uses
+        if signal.grade > old_grade:
+            grade_change = "UPGRADED"
+        elif signal.grade < old_grade:
+            grade_change = "DOWNGRADED"
+        else:
+            grade_change = "UNCHANGED"
+
+        continuity_row = {
+            "signal_id": row["signal_id"],
+            "signal_group_id": row["signal_group_id"],
+            "detected_at": current_time,
+            "current_volume": signal.current_volume,
+            "current_oi": signal.current_oi,
+            "premium_flow": new_premium_flow,
+            "underlying_price": float(signal.underlying_price),
+            "overall_score": new_score,
+            "grade": signal.grade,
+            "volume_delta": signal.current_volume - (row["current_volume"] or 0),
+            "oi_delta": signal.current_oi - (row["current_oi"] or 0),
+            "premium_flow_delta": new_premium_flow - float(row["premium_flow"] or 0),
+            "score_delta": new_score - float(row["overall_score"] or 0),
+            "grade_change": grade_change,
+        }
+
+        row.update(
+            {
+                "current_volume": signal.current_volume,
+                "current_oi": signal.current_oi,
+                "premium_flow": new_premium_flow,
+                "underlying_price": float(signal.underlying_price),
+                "overall_score": new_score,
+                "grade": signal.grade,
+                "last_detected_at": current_time,
+                "detection_count": (row["detection_count"] or 1) + 1,
+                "is_new_signal": False,
+            }
+        )
+
+        return continuity_row
+
+    def _write_rows(
+        self, table: str, rows: list[dict[str, Any]], upsert: bool = False
+    ) -> set[str]:
+        """
+        Bulk insert or upsert rows in batches.
+
+        Args:
+            table: Target table
+            rows: Row payloads
+            upsert: Upsert on signal_id instead of plain insert
+
+        Returns:
+            signal_ids of rows in batches that failed to write
+        """
+        failed_ids: set[str] = set()
+
+        for i in range(0, len(rows), WRITE_BATCH_SIZE):
+            batch = rows[i : i + WRITE_BATCH_SIZE]
+
+            try:
+                if upsert:
+                    self.client.table(table).upsert(
+                        batch, on_conflict="signal_id"
+                    ).execute()
+                else:
+                    self.client.table(table).insert(batch).execute()
+
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} rows to {table}: {e}")
+                failed_ids.update(row["signal_id"] for row in batch)
+
+        return failed_ids
+
     async def process_signals(
         self, signals: list[UnusualOptionsSignal]
     ) -> dict[str, Any]:
         """
         Process a batch of signals with deduplication.
 
+        Existing signals are resolved with one bulk lookup, then new signals,
+        updated signals and continuity history are each written in bulk, so
+        the number of round trips does not grow with the batch size.
+
         Args:
             signals: List of signals to process
 
@@ -215,32 +421,76 @@ class SignalContinuityService:
             "signal_ids": [],
         }
 
+        if not signals:
+            return stats
+
+        try:
+            existing = await self.find_existing_signals(signals)
+        except Exception as e:
+            logger.error(f"Error finding existing signals: {e}")
+            stats["failed_signals"] = len(signals)
+            return stats
+
+        current_time = datetime.now(UTC).isoformat()
+
+        new_rows: dict[str, dict[str, Any]] = {}
+        updated_rows: dict[str, dict[str, Any]] = {}
+        continuity_rows: list[dict[str, Any]] = []
+        outcomes: list[tuple[str, str]] = []  # (signal_id, "new" | "updated")
+
         for signal in signals:
             try:
-                # Check if signal already exists
-                existing_id = await self.find_existing_signal(signal)
-
-                if existing_id:
-                    # Update existing signal
-                    success = await self.update_existing_signal(existing_id, signal)
-                    if success:
-                        stats["updated_signals"] += 1
-                        stats["signal_ids"].append(existing_id)
-                    else:
-                        stats["failed_signals"] += 1
-                else:
+                key = self._signal_key(signal)
+                row = existing.get(key)
+
+                if row is None:
                     # Store as new signal
-                    signal_id = await self.store_new_signal(signal)
-                    if signal_id:
-                        stats["new_signals"] += 1
-                        stats["signal_ids"].append(signal_id)
-                    else:
-                        stats["failed_signals"] += 1
+                    signal_id = str(uuid.uuid4())
+                    row = self._build_signal_row(
+                        signal, signal_id, signal_id, current_time
+                    )
+                    new_rows[signal_id] = row
+                    # Later duplicates in this batch continue this signal
+                    existing[key] = row
+                    outcomes.append((signal_id, "new"))
+                    continue
+
+                # Update existing signal
+                continuity_rows.append(
+                    self._apply_continuity_update(row, signal, current_time)
+                )
+                if row["signal_id"] not in new_rows:
+                    updated_rows[row["signal_id"]] = row
+                outcomes.append((row["signal_id"], "updated"))
 
             except Exception as e:
                 logger.error(f"Error processing signal {signal.ticker}: {e}")
                 stats["failed_signals"] += 1
 
+        # New signals first: continuity rows may reference them
+        failed_new = self._write_rows(
+            "unusual_options_signals", list(new_rows.values())
+        )
+        failed_updates = self._write_rows(
+            "unusual_options_signals", list(updated_rows.values()), upsert=True
+        )
+        failed_ids = failed_new | failed_updates
+
+        self._write_rows(
+            "unusual_options_signal_continuity",
+            [row for row in continuity_rows if row["signal_id"] not in failed_ids],
+        )
+
+        for signal_id, outcome in outcomes:
+            if signal_id in failed_ids:
+                stats["failed_signals"] += 1
+            elif outcome == "new":
+                stats["new_signals"] += 1
+                stats["signal_ids"].append(signal_id)
+            else:
+                stats["updated_signals"] += 1
+                stats["signal_ids"].append(signal_id)
+
         logger.info(
             f"Processed {stats['total_signals']} signals: "
             f"{stats['new_signals']} new, "
@@ -7,7 +7,166 @@ from typing import Any
 from loguru import logger
 from supabase import Client, create_client
 
-from .models import UnusualOptionsSignal
+from .batch import SignalBatch
+from .models import GRADE_ORDER, UnusualOptionsSignal
+
+# Columns read by signal_from_row (select these instead of "*" to skip
+# heavy JSON columns such as raw_detection_data)
+SIGNAL_COLUMNS = (
+    "signal_id",
+    "ticker",
+    "option_symbol",
+    "strike",
+    "expiry",
+    "option_type",
+    "days_to_expiry",
+    "underlying_price",
+    "current_volume",
+    "current_oi",
+    "implied_volatility",
+    "volume_ratio",
+    "average_volume",
+    "oi_change_pct",
+    "previous_oi",
+    "premium_flow",
+    "aggressive_order_pct",
+    "put_call_ratio",
+    "sentiment",
+    "moneyness",
+    "overall_score",
+    "grade",
+    "confidence",
+    "risk_level",
+    "risk_factors",
+    "has_volume_anomaly",
+    "has_oi_spike",
+    "has_premium_flow",
+    "data_provider",
+    "detection_timestamp",
+    "signal_classification",
+    "classification_reason",
+    "predicted_win_rate",
+    "classification_factors",
+)
+
+
+# Insert payload for store_signals: (column, SignalBatch encoding)
+SIGNAL_INSERT_ENCODERS = (
+    ("ticker", "raw"),
+    ("option_symbol", "raw"),
+    ("strike", "float"),
+    ("expiry", "iso"),
+    ("option_type", "raw"),
+    ("days_to_expiry", "raw"),
+    ("underlying_price", "float"),
+    ("current_volume", "raw"),
+    ("current_oi", "raw"),
+    ("implied_volatility", "float_or_none"),
+    ("volume_ratio", "float_or_none"),
+    ("average_volume", "raw"),
+    ("oi_change_pct", "float_or_none"),
+    ("previous_oi", "raw"),
+    ("premium_flow", "float_or_zero"),
+    ("aggressive_order_pct", "float_or_none"),
+    ("put_call_ratio", "float_or_none"),
+    ("sentiment", "raw"),
+    ("moneyness", "raw"),
+    ("overall_score", "float"),
+    ("grade", "raw"),
+    ("confidence", "float"),
+    ("risk_level", "raw"),
+    ("risk_factors", "json_or_none"),
+    ("has_volume_anomaly", "raw"),
+    ("has_oi_spike", "raw"),
+    ("has_premium_flow", "raw"),
+    ("data_provider", "raw"),
+    ("detection_timestamp", "iso"),
+    # Spread detection fields (Phase 1)
+    ("is_likely_spread", "raw"),
+    ("spread_confidence", "float_or_none"),
+    ("spread_type", "raw"),
+    ("matched_leg_symbols", "list_or_none"),
+    ("spread_strike_width", "float_or_none"),
+    ("spread_detection_reason", "raw"),
+    ("spread_net_premium", "float_or_none"),
+    # Signal Classification (Jan 2026 - data-driven approach)
+    ("signal_classification", "raw"),
+    ("classification_reason", "raw"),
+    ("predicted_win_rate", "float_if_set"),
+    ("classification_factors", "json_or_none"),
+)
+
+
+def grades_at_or_above(min_grade: str) -> list[str]:
+    """Get all grades >= min_grade (S/A/B/C/D/F)."""
+    min_grade_value = GRADE_ORDER.get(min_grade, 1)
+    return [grade for grade, value in GRADE_ORDER.items() if value >= min_grade_value]
+
+
+def _json_list(value: Any) -> list:
+    """Decode a JSONB list column that may arrive as a list or a string."""
+    if isinstance(value, list):
+        return value
+    return json.loads(value) if value else []
+
+
+def signal_from_row(row: dict[str, Any]) -> UnusualOptionsSignal:
+    """
+    Convert a unusual_options_signals row to a signal.
+
+    Columns missing from the row (projected queries) keep their defaults.
+
+    Args:
+        row: Row dict from Supabase
+
+    Returns:
+        Parsed signal
+    """
+    optional = {}
+    if row.get("signal_id"):
+        optional["signal_id"] = row["signal_id"]
+    if row.get("expiry"):
+        optional["expiry"] = datetime.fromisoformat(row["expiry"]).date()
+    if row.get("detection_timestamp"):
+        optional["detection_timestamp"] = datetime.fromisoformat(
+            row["detection_timestamp"]
+        )
+
+    return UnusualOptionsSignal(
+        ticker=row.get("ticker", ""),
+        option_symbol=row.get("option_symbol", ""),
+        strike=row.get("strike", 0.0),
+        option_type=row.get("option_type", ""),
+        days_to_expiry=row.get("days_to_expiry", 0),
+        underlying_price=row.get("underlying_price", 0.0),
+        current_volume=row.get("current_volume", 0),
+        current_oi=row.get("current_oi", 0),
+        implied_volatility=row.get("implied_volatility"),
+        volume_ratio=row.get("volume_ratio"),
+        average_volume=row.get("average_volume") or 0,
+        oi_change_pct=row.get("oi_change_pct"),
+        previous_oi=row.get("previous_oi") or 0,
+        premium_flow=row.get("premium_flow"),
+        aggressive_order_pct=row.get("aggressive_order_pct"),
+        put_call_ratio=row.get("put_call_ratio"),
+        sentiment=row.get("sentiment") or "NEUTRAL",
+        moneyness=row.get("moneyness") or "UNKNOWN",
+        overall_score=row.get("overall_score", 0.0),
+        grade=row.get("grade", "F"),
+        confidence=row.get("confidence"),
+        risk_level=row.get("risk_level") or "LOW",
+        risk_factors=_json_list(row.get("risk_factors")),
+        has_volume_anomaly=row.get("has_volume_anomaly") or False,
+        has_oi_spike=row.get("has_oi_spike") or False,
+        has_premium_flow=row.get("has_premium_flow") or False,
+        data_provider=row.get("data_provider") or "Unknown",
+        # Signal Classification fields
+        signal_classification=row.get("signal_classification", "unclassified"),
+        classification_reason=row.get("classification_reason", ""),
+        predicted_win_rate=row.get("predicted_win_rate"),
+        classification_factors=_json_list(row.get("classification_factors")),
+        **optional,
+    )
 
 
 class SupabaseStorage:
@@ -69,80 +228,10 @@ class SupabaseStorage:
         try:
             client = self._get_client()
 
-            # Convert signals to database format
-            signal_data = []
-            for signal in signals:
-                data = {
-                    "ticker": signal.ticker,
-                    "option_symbol": signal.option_symbol,
-                    "strike": float(signal.strike),
-                    "expiry": signal.expiry.isoformat(),
-                    "option_type": signal.option_type,
-                    "days_to_expiry": signal.days_to_expiry,
-                    "underlying_price": float(signal.underlying_price),
-                    "current_volume": signal.current_volume,
-                    "current_oi": signal.current_oi,
-                    "implied_volatility": float(signal.implied_volatility)
-                    if signal.implied_volatility
-                    else None,
-                    "volume_ratio": float(signal.volume_ratio)
-                    if signal.volume_ratio
-                    else None,
-                    "average_volume": signal.average_volume,
-                    "oi_change_pct": float(signal.oi_change_pct)
-                    if signal.oi_change_pct
-                    else None,
-                    "previous_oi": signal.previous_oi,
-                    "premium_flow": float(signal.premium_flow)
-                    if signal.premium_flow is not None
-                    else 0.0,
-                    "aggressive_order_pct": float(signal.aggressive_order_pct)
-                    if signal.aggressive_order_pct
-                    else None,
-                    "put_call_ratio": float(signal.put_call_ratio)
-                    if signal.put_call_ratio
-                    else None,
-                    "sentiment": signal.sentiment,
-                    "moneyness": signal.moneyness,
-                    "overall_score": float(signal.overall_score),
-                    "grade": signal.grade,
-                    "confidence": float(signal.confidence),
-                    "risk_level": signal.risk_level,
-                    "risk_factors": json.dumps(signal.risk_factors)
-                    if signal.risk_factors
-                    else None,
-                    "has_volume_anomaly": signal.has_volume_anomaly,
-                    "has_oi_spike": signal.has_oi_spike,
-                    "has_premium_flow": signal.has_premium_flow,
-                    "data_provider": signal.data_provider,
-                    "detection_timestamp": signal.detection_timestamp.isoformat(),
-                    # Spread detection fields (Phase 1)
-                    "is_likely_spread": signal.is_likely_spread,
-                    "spread_confidence": float(signal.spread_confidence)
-                    if signal.spread_confidence
-                    else None,
-                    "spread_type": signal.spread_type,
-                    "matched_leg_symbols": signal.matched_leg_symbols
-                    if signal.matched_leg_symbols
-                    else None,
-                    "spread_strike_width": float(signal.spread_strike_width)
-                    if signal.spread_strike_width
-                    else None,
-                    "spread_detection_reason": signal.spread_detection_reason,
-                    "spread_net_premium": float(signal.spread_net_premium)
-                    if signal.spread_net_premium
-                    else None,
-                    # Signal Classification (Jan 2026 - data-driven approach)
-                    "signal_classification": signal.signal_classification,
-                    "classification_reason": signal.classification_reason,
-                    "predicted_win_rate": float(signal.predicted_win_rate)
-                    if signal.predicted_win_rate is not None
-                    else None,
-                    "classification_factors": json.dumps(signal.classification_factors)
-                    if signal.classification_factors
-                    else None,
-                }
-                signal_data.append(data)
+            # Convert signals to database format (column by column)
+            signal_data = SignalBatch.from_signals(signals).to_rows(
+                SIGNAL_INSERT_ENCODERS
+            )
 
             # Insert signals in batches
             batch_size = 100
@@ -198,14 +287,8 @@ class SupabaseStorage:
                 query = query.eq("ticker", ticker.upper())
 
             if min_grade:
-                grade_order = {"S": 6, "A": 5, "B": 4, "C": 3, "D": 2, "F": 1}
-                min_grade_value = grade_order.get(min_grade, 1)
-
                 # Filter by grade - include all grades >= min_grade
-                valid_grades = []
-                for grade, value in grade_order.items():
-                    if value >= min_grade_value:
-                        valid_grades.append(grade)
+                valid_grades = grades_at_or_above(min_grade)
 
                 if valid_grades:
                     query = query.in_("grade", valid_grades)
@@ -228,60 +311,7 @@ class SupabaseStorage:
             signals = []
             for row in result.data:
                 try:
-                    signal = UnusualOptionsSignal(
-                        ticker=row["ticker"],
-                        option_symbol=row["option_symbol"],
-                        strike=row["strike"],
-                        expiry=datetime.fromisoformat(row["expiry"]).date(),
-                        option_type=row["option_type"],
-                        days_to_expiry=row["days_to_expiry"],
-                        underlying_price=row["underlying_price"],
-                        current_volume=row["current_volume"],
-                        current_oi=row["current_oi"],
-                        implied_volatility=row["implied_volatility"],
-                        volume_ratio=row["volume_ratio"],
-                        average_volume=row["average_volume"] or 0,
-                        oi_change_pct=row["oi_change_pct"],
-                        previous_oi=row["previous_oi"] or 0,
-                        premium_flow=row["premium_flow"],
-                        aggressive_order_pct=row["aggressive_order_pct"],
-                        put_call_ratio=row["put_call_ratio"],
-                        sentiment=row["sentiment"] or "NEUTRAL",
-                        moneyness=row["moneyness"] or "UNKNOWN",
-                        overall_score=row["overall_score"],
-                        grade=row["grade"],
-                        confidence=row["confidence"],
-                        risk_level=row["risk_level"] or "LOW",
-                        risk_factors=row["risk_factors"]
-                        if isinstance(row["risk_factors"], list)
-                        else (
-                            json.loads(row["risk_factors"])
-                            if row["risk_factors"]
-                            else []
-                        ),
-                        has_volume_anomaly=row["has_volume_anomaly"] or False,
-                        has_oi_spike=row["has_oi_spike"] or False,
-                        has_premium_flow=row["has_premium_flow"] or False,
-                        data_provider=row["data_provider"] or "Unknown",
-                        detection_timestamp=datetime.fromisoformat(
-                            row["detection_timestamp"]
-                        ),
-                        # Signal Classification fields
-                        signal_classification=row.get(
-                            "signal_classification", "unclassified"
-                        ),
-                        classification_reason=row.get("classification_reason", ""),
-                        predicted_win_rate=row.get("predicted_win_rate"),
-                        classification_factors=row.get("classification_factors")
-                        if isinstance(row.get("classification_factors"), list)
-                        else (
-                            json.loads(row.get("classification_factors"))
-                            if row.get("classification_factors")
-                            else []
-                        ),
-                    )
-                    signals.append(signal)
-
+                    signals.append(signal_from_row(row))
                 except Exception as e:
                     logger.warning(f"Error parsing signal row: {e}")
                     continue
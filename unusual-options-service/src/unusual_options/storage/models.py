@@ -5,6 +5,9 @@ from datetime import UTC, date, datetime
 from enum import Enum
 from uuid import uuid4
 
+# Signal grades, best first
+GRADE_ORDER = {"S": 6, "A": 5, "B": 4, "C": 3, "D": 2, "F": 1}
+
 
 class SignalClassification(str, Enum):
     """
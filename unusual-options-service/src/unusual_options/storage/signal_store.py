@@ -0,0 +1,392 @@
+"""
+Shared signal access for analysis scripts.
+
+Pushes grade, date, ticker and threshold filters into the Supabase query,
+pages through results as an async generator, projects only the columns a
+report needs, and keeps a local read-through cache so repeated report runs
+only pull rows changed since the last run.
+
+Cache design:
+- One JSON file per query scope (grade, tickers, thresholds, columns)
+- Rows keyed by signal_id, covering detections from ``covered_start`` on
+- ``watermark`` is the newest ``updated_at`` seen; the next run fetches
+  only rows updated at or after it and re-applies the filters locally,
+  so rows that changed grade or premium drop out of the scope
+- Rows detected before the requested start are pruned and
+  ``covered_start`` moves up with the window, so rolling windows do not
+  grow the file
+- Deleted rows never show up in a delta, so the scope is re-fetched in
+  full once ``refreshed_at`` is older than SIGNAL_CACHE_MAX_AGE_HOURS
+"""
+
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .batch import SignalBatch
+from .database import (
+    SIGNAL_COLUMNS,
+    SupabaseStorage,
+    grades_at_or_above,
+    signal_from_row,
+)
+from .models import UnusualOptionsSignal
+
+TABLE = "unusual_options_signals"
+
+# Rows per page; PostgREST caps responses at 1000 rows by default
+PAGE_SIZE = 1000
+
+# Bump when the cache file layout changes
+CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SignalQuery:
+    """Filters and projection for a signal fetch."""
+
+    min_grade: str | None = None
+    start_date: date | None = None
+    end_date: date | None = None
+    tickers: tuple[str, ...] = ()
+    min_dte: int | None = None
+    max_dte: int | None = None
+    min_premium: float | None = None
+    min_volume: int | None = None
+    columns: tuple[str, ...] = SIGNAL_COLUMNS
+
+    def scope_key(self) -> str:
+        """Cache scope: every filter except the date window."""
+        scope = asdict(self)
+        scope.pop("start_date")
+        scope.pop("end_date")
+        scope["tickers"] = sorted(t.upper() for t in self.tickers)
+        scope["columns"] = sorted(self.select_columns())
+        scope["version"] = CACHE_VERSION
+        payload = json.dumps(scope, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+    def select_columns(self) -> tuple[str, ...]:
+        """Projected columns, plus the ones paging, caching and filters use."""
+        extra = ["signal_id", "detection_timestamp", "updated_at"]
+        if self.min_grade:
+            extra.append("grade")
+        if self.tickers:
+            extra.append("ticker")
+        if self.min_dte is not None or self.max_dte is not None:
+            extra.append("days_to_expiry")
+        if self.min_premium is not None:
+            extra.append("premium_flow")
+        if self.min_volume is not None:
+            extra.append("current_volume")
+        return tuple(dict.fromkeys((*self.columns, *extra)))
+
+    def matches(self, row: dict[str, Any]) -> bool:
+        """Apply the non-date filters to a row locally."""
+        if self.min_grade and row.get("grade") not in grades_at_or_above(
+            self.min_grade
+        ):
+            return False
+        if self.tickers and row.get("ticker") not in {t.upper() for t in self.tickers}:
+            return False
+
+        dte = row.get("days_to_expiry")
+        if self.min_dte is not None and (dte is None or dte < self.min_dte):
+            return False
+        if self.max_dte is not None and (dte is None or dte > self.max_dte):
+            return False
+
+        premium = row.get("premium_flow")
+        if self.min_premium is not None and (
+            premium is None or premium < self.min_premium
+        ):
+            return False
+
+        volume = row.get("current_volume")
+        if self.min_volume is not None and (volume is None or volume < self.min_volume):
+            return False
+
+        return True
+
+    def in_window(self, row: dict[str, Any]) -> bool:
+        """Apply the date window to a row locally."""
+        detected = row["detection_timestamp"]
+        if self.start_date and detected < self.start_date.isoformat():
+            return False
+        if self.end_date and detected > self.end_date.isoformat():
+            return False
+        return True
+
+
+class SignalStore(SupabaseStorage):
+    """Filtered, paged and cached access to unusual_options_signals."""
+
+    def __init__(self, config: dict[str, Any]):
+        super().__init__(config)
+        self.cache_enabled = config.get("SIGNAL_CACHE_ENABLED", True)
+        self.cache_dir = Path(config.get("CACHE_DIR", "cache")) / "signals"
+        self.cache_max_age = timedelta(
+            hours=config.get("SIGNAL_CACHE_MAX_AGE_HOURS", 24)
+        )
+
+    def _build_query(self, query: SignalQuery, server_filters: bool = True) -> Any:
+        """Build the Supabase query with filters pushed to the server."""
+        builder = (
+            self._get_client().table(TABLE).select(",".join(query.select_columns()))
+        )
+
+        if query.tickers:
+            builder = builder.in_("ticker", [t.upper() for t in query.tickers])
+
+        if query.start_date:
+            builder = builder.gte("detection_timestamp", query.start_date.isoformat())
+
+        if not server_filters:
+            return builder
+
+        if query.min_grade:
+            builder = builder.in_("grade", grades_at_or_above(query.min_grade))
+        if query.end_date:
+            builder = builder.lte("detection_timestamp", query.end_date.isoformat())
+        if query.min_dte is not None:
+            builder = builder.gte("days_to_expiry", query.min_dte)
+        if query.max_dte is not None:
+            builder = builder.lte("days_to_expiry", query.max_dte)
+        if query.min_premium is not None:
+            builder = builder.gte("premium_flow", query.min_premium)
+        if query.min_volume is not None:
+            builder = builder.gte("current_volume", query.min_volume)
+
+        return builder
+
+    async def _iter_rows(
+        self,
+        query: SignalQuery,
+        updated_since: str | None = None,
+        server_filters: bool = True,
+        page_size: int = PAGE_SIZE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Page through matching rows in a stable order."""
+        offset = 0
+
+        while True:
+            builder = self._build_query(query, server_filters)
+            if updated_since:
+                builder = builder.gte("updated_at", updated_since)
+
+            result = (
+                builder.order("detection_timestamp")
+                .order("signal_id")
+                .range(offset, offset + page_size - 1)
+                .execute()
+            )
+            rows = result.data or []
+
+            for row in rows:
+                yield row
+
+            if len(rows) < page_size:
+                break
+            offset += page_size
+
+    async def iter_signals(
+        self, query: SignalQuery, page_size: int = PAGE_SIZE
+    ) -> AsyncIterator[UnusualOptionsSignal]:
+        """
+        Stream signals page by page, bypassing the cache.
+
+        Args:
+            query: Filters and projection
+            page_size: Rows per request
+
+        Yields:
+            Signals in detection order
+        """
+        async for row in self._iter_rows(query, page_size=page_size):
+            try:
+                yield signal_from_row(row)
+            except Exception as e:
+                logger.warning(f"Error parsing signal row: {e}")
+
+    async def fetch_signals(
+        self, query: SignalQuery, use_cache: bool | None = None
+    ) -> list[UnusualOptionsSignal]:
+        """
+        Fetch all matching signals, highest score first.
+
+        Args:
+            query: Filters and projection
+            use_cache: Override SIGNAL_CACHE_ENABLED for this call
+
+        Returns:
+            List of signals
+        """
+        rows = await self._fetch_rows(query, use_cache)
+
+        signals = []
+        for row in rows:
+            try:
+                signals.append(signal_from_row(row))
+            except Exception as e:
+                logger.warning(f"Error parsing signal row: {e}")
+
+        signals.sort(key=lambda s: s.overall_score or 0, reverse=True)
+        logger.info(f"Retrieved {len(signals)} signals from database")
+        return signals
+
+    async def fetch_batch(
+        self, query: SignalQuery, use_cache: bool | None = None
+    ) -> SignalBatch:
+        """
+        Fetch all matching signals as a columnar batch, highest score first.
+
+        Cheaper than fetch_signals for large windows: rows are converted
+        column by column and only the projected columns are kept.
+
+        Args:
+            query: Filters and projection
+            use_cache: Override SIGNAL_CACHE_ENABLED for this call
+
+        Returns:
+            SignalBatch of matching signals
+        """
+        rows = await self._fetch_rows(query, use_cache)
+
+        try:
+            batch = SignalBatch.from_rows(rows)
+        except Exception as e:
+            logger.error(f"Error parsing signal rows: {e}")
+            return SignalBatch.from_rows([])
+
+        if "overall_score" in batch.columns:
+            batch = batch.sort_by("overall_score", descending=True)
+        logger.info(f"Retrieved {len(batch)} signals from database")
+        return batch
+
+    async def _fetch_rows(
+        self, query: SignalQuery, use_cache: bool | None
+    ) -> list[dict[str, Any]]:
+        """Fetch matching rows, through the local cache when enabled."""
+        if use_cache is None:
+            use_cache = self.cache_enabled
+
+        try:
+            if use_cache and query.start_date:
+                return await self._fetch_cached_rows(query)
+            return [row async for row in self._iter_rows(query)]
+        except Exception as e:
+            logger.error(f"Error retrieving signals: {e}")
+            return []
+
+    async def _fetch_cached_rows(self, query: SignalQuery) -> list[dict[str, Any]]:
+        """Read-through fetch: reuse cached rows, pull only what changed."""
+        cache_path = self.cache_dir / f"{query.scope_key()}.json"
+        cache = self._load_cache(cache_path)
+        start = query.start_date.isoformat()
+
+        now = datetime.now(UTC)
+        refreshed_at = cache.get("refreshed_at")
+        covered = (
+            cache["covered_start"] is not None
+            and cache["covered_start"] <= start
+            # Periodic full refresh drops rows deleted from the table
+            and refreshed_at is not None
+            and now - parse_timestamp(refreshed_at) < self.cache_max_age
+        )
+        rows: dict[str, dict[str, Any]] = cache["rows"] if covered else {}
+
+        if covered and cache["watermark"]:
+            # Delta: rows touched since the last run, filtered locally so
+            # rows that left the scope are evicted
+            fetched = 0
+            async for row in self._iter_rows(
+                query, updated_since=cache["watermark"], server_filters=False
+            ):
+                fetched += 1
+                if query.matches(row):
+                    rows[row["signal_id"]] = row
+                else:
+                    rows.pop(row["signal_id"], None)
+            logger.debug(f"Signal cache hit: {len(rows)} cached, {fetched} refreshed")
+        else:
+            # Full window fetch; end date stays open so the watermark
+            # covers everything after start
+            async for row in self._iter_rows(replace(query, end_date=None)):
+                rows[row["signal_id"]] = row
+            cache["refreshed_at"] = now.isoformat()
+            logger.debug(f"Signal cache miss: fetched {len(rows)} rows")
+
+        # Keep only the requested window onwards
+        rows = {
+            signal_id: row
+            for signal_id, row in rows.items()
+            if row["detection_timestamp"] >= start
+        }
+        cache["covered_start"] = start
+
+        watermarks = [
+            row["updated_at"] for row in rows.values() if row.get("updated_at")
+        ]
+        if cache["watermark"]:
+            watermarks.append(cache["watermark"])
+        if watermarks:
+            cache["watermark"] = max(watermarks, key=parse_timestamp)
+        cache["rows"] = rows
+        self._save_cache(cache_path, cache)
+
+        return [row for row in rows.values() if query.in_window(row)]
+
+    def _load_cache(self, path: Path) -> dict[str, Any]:
+        """Load a cache scope file, or an empty scope."""
+        empty = {
+            "covered_start": None,
+            "refreshed_at": None,
+            "watermark": None,
+            "rows": {},
+        }
+
+        if not path.exists():
+            return empty
+
+        try:
+            with path.open() as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable signal cache {path}: {e}")
+            return empty
+
+    def _save_cache(self, path: Path, cache: dict[str, Any]) -> None:
+        """Atomically write a cache scope file."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with tmp_path.open("w") as f:
+                json.dump(cache, f)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write signal cache {path}: {e}")
+
+    def clear_cache(self) -> int:
+        """Delete all cached scopes. Returns number of files removed."""
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse a Supabase timestamptz string."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Convenience function for getting a store instance
+def get_signal_store(config: dict[str, Any]) -> SignalStore:
+    """Get signal store instance."""
+    return SignalStore(config)
@@ -1,5 +1,6 @@
 """Storage helper functions for CLI."""
 
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 
 from rich.console import Console
@@ -8,9 +9,14 @@ from rich.table import Table
 console = Console()
 
 
+def _span(metrics, stage: str):
+    """Timing span on metrics, or a no-op when metrics are not collected."""
+    return metrics.span(stage) if metrics is not None else nullcontext()
+
+
 async def store_signals(
-    config: dict, signals: list, use_continuity: bool = True
-) -> None:
+    config: dict, signals: list, use_continuity: bool = True, metrics=None
+) -> bool:
     """
     Store signals in database with optional continuity tracking.
 
@@ -18,10 +24,14 @@ async def store_signals(
         config: Configuration dictionary
         signals: List of signals to store
         use_continuity: Use deduplication and continuity tracking (default: True)
+        metrics: Optional ScanMetrics to record storage timings in
+
+    Returns:
+        True if every signal was stored
     """
     if not signals:
         console.print("[yellow]No signals to store[/yellow]")
-        return
+        return True
 
     try:
         if use_continuity:
@@ -35,25 +45,30 @@ async def store_signals(
             continuity_service = await create_continuity_service(config)
 
             # Process signals with deduplication
-            stats = await continuity_service.process_signals(signals)
+            with _span(metrics, "store"):
+                stats = await continuity_service.process_signals(signals)
 
             # Mark expired signals as inactive
-            expired_count = await continuity_service.mark_expired_signals()
+            with _span(metrics, "mark_expired"):
+                expired_count = await continuity_service.mark_expired_signals()
 
             if stats["failed_signals"] == 0:
                 console.print(
                     f"[green]✓ Stored {stats['new_signals']} new, updated {stats['updated_signals']}, marked {expired_count} expired[/green]"
                 )
-            else:
-                console.print(
-                    f"[yellow]⚠ Stored {stats['new_signals']} new, updated {stats['updated_signals']}, {stats['failed_signals']} failed[/yellow]"
-                )
+                return True
+
+            console.print(
+                f"[yellow]⚠ Stored {stats['new_signals']} new, updated {stats['updated_signals']}, {stats['failed_signals']} failed[/yellow]"
+            )
+            return False
         else:
             # Legacy: Direct storage without continuity tracking
             from .storage.database import get_storage
 
             storage = get_storage(config)
-            success = await storage.store_signals(signals)
+            with _span(metrics, "store"):
+                success = await storage.store_signals(signals)
 
             if success:
                 console.print(
@@ -61,9 +76,11 @@ async def store_signals(
                 )
             else:
                 console.print("[red]✗ Failed to store signals in database[/red]")
+            return success
 
     except Exception as e:
         console.print(f"[red]✗ Database storage error: {e}[/red]")
+        return False
 
 
 async def list_signals(config: dict, days: int, min_grade: str) -> None:
@@ -0,0 +1,222 @@
+"""
+Scan instrumentation: per-ticker stage timings and provider counters.
+
+A ScanMetrics instance is shared by the orchestrator and its data
+provider. The ticker being scanned is tracked in a context variable, so
+spans and counters recorded deep inside the provider (requests, retries,
+429s, backoff sleeps) are attributed to the right ticker even when
+several scans run concurrently.
+
+Reports are written as JSON (full detail plus the slowest tickers) and as
+a Prometheus text-format file for CI artifacts.
+"""
+
+import json
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+# Counter names
+REQUESTS = "requests"
+RETRIES = "retries"
+RATE_LIMITED = "rate_limited"
+SLEEP_SECONDS = "sleep_seconds"
+CONTRACTS = "contracts"
+
+COUNTER_HELP = {
+    REQUESTS: "Provider requests attempted",
+    RETRIES: "Provider requests retried",
+    RATE_LIMITED: "Provider responses that were rate limited (429)",
+    SLEEP_SECONDS: "Seconds spent sleeping for rate limits and backoff",
+    CONTRACTS: "Option contracts processed",
+}
+
+
+def _number(value: float) -> float | int:
+    """Counts as ints, seconds rounded to milliseconds."""
+    return int(value) if float(value).is_integer() else round(value, 3)
+
+
+_current_ticker: ContextVar[str | None] = ContextVar("scan_ticker", default=None)
+
+
+class ScanMetrics:
+    """Collects timing spans and counters for one scan run."""
+
+    def __init__(self) -> None:
+        self.started_at = datetime.now(UTC)
+        self._started = time.perf_counter()
+        # stage -> [calls, total seconds, max seconds]
+        self.stages: dict[str, list[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+        self.counters: dict[str, float] = defaultdict(float)
+        # ticker -> stage -> seconds, ticker -> counter -> value
+        self.ticker_stages: dict[str, dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self.ticker_counters: dict[str, dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+
+    @contextmanager
+    def ticker(self, ticker: str) -> Iterator[None]:
+        """Attribute spans and counters inside this block to a ticker."""
+        token = _current_ticker.set(ticker)
+        try:
+            with self.span("total"):
+                yield
+        finally:
+            _current_ticker.reset(token)
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time a stage for the current ticker (or the whole run)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage: str, seconds: float) -> None:
+        stats = self.stages[stage]
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+
+        ticker = _current_ticker.get()
+        if ticker is not None:
+            self.ticker_stages[ticker][stage] += seconds
+
+    def incr(self, counter: str, value: float = 1) -> None:
+        """Increment a counter for the run and the current ticker."""
+        self.counters[counter] += value
+
+        ticker = _current_ticker.get()
+        if ticker is not None:
+            self.ticker_counters[ticker][counter] += value
+
+    def slowest_tickers(self, n: int = 10) -> list[dict[str, Any]]:
+        """Tickers with the longest total scan time, slowest first."""
+        ranked = sorted(
+            self.ticker_stages.items(),
+            key=lambda kv: kv[1].get("total", 0.0),
+            reverse=True,
+        )
+        return [
+            {
+                "ticker": ticker,
+                "seconds": round(stages.get("total", 0.0), 3),
+                "stages": {
+                    stage: round(seconds, 3)
+                    for stage, seconds in stages.items()
+                    if stage != "total"
+                },
+                "counters": {
+                    name: _number(value)
+                    for name, value in self.ticker_counters.get(ticker, {}).items()
+                },
+            }
+            for ticker, stages in ranked[:n]
+        ]
+
+    def report(self, slowest: int = 10) -> dict[str, Any]:
+        """Run report as a JSON-serializable dict."""
+        return {
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": round(time.perf_counter() - self._started, 3),
+            "tickers_scanned": len(self.ticker_stages),
+            "stages": {
+                stage: {
+                    "calls": int(calls),
+                    "total_seconds": round(total, 3),
+                    "mean_seconds": round(total / calls, 4) if calls else 0.0,
+                    "max_seconds": round(longest, 3),
+                }
+                for stage, (calls, total, longest) in sorted(self.stages.items())
+            },
+            "counters": {
+                name: _number(self.counters.get(name, 0)) for name in COUNTER_HELP
+            },
+            "slowest_tickers": self.slowest_tickers(slowest),
+        }
+
+    def to_prometheus(self, slowest: int = 10) -> str:
+        """Report in Prometheus text exposition format."""
+        report = self.report(slowest)
+        lines = [
+            "# HELP uos_scan_duration_seconds Wall time of the scan run",
+            "# TYPE uos_scan_duration_seconds gauge",
+            f"uos_scan_duration_seconds {report['duration_seconds']}",
+            "# HELP uos_scan_tickers_total Tickers scanned",
+            "# TYPE uos_scan_tickers_total counter",
+            f"uos_scan_tickers_total {report['tickers_scanned']}",
+            "# HELP uos_scan_stage_seconds_total Time spent per scan stage",
+            "# TYPE uos_scan_stage_seconds_total counter",
+        ]
+        for stage, stats in report["stages"].items():
+            lines.append(
+                f'uos_scan_stage_seconds_total{{stage="{stage}"}} '
+                f"{stats['total_seconds']}"
+            )
+        lines += [
+            "# HELP uos_scan_stage_calls_total Spans recorded per scan stage",
+            "# TYPE uos_scan_stage_calls_total counter",
+        ]
+        for stage, stats in report["stages"].items():
+            lines.append(
+                f'uos_scan_stage_calls_total{{stage="{stage}"}} {stats["calls"]}'
+            )
+
+        for name, help_text in COUNTER_HELP.items():
+            metric = f"uos_scan_{name}_total"
+            lines += [
+                f"# HELP {metric} {help_text}",
+                f"# TYPE {metric} counter",
+                f"{metric} {report['counters'][name]}",
+            ]
+
+        lines += [
+            "# HELP uos_scan_ticker_seconds Scan time of the slowest tickers",
+            "# TYPE uos_scan_ticker_seconds gauge",
+        ]
+        for entry in report["slowest_tickers"]:
+            lines.append(
+                f'uos_scan_ticker_seconds{{ticker="{entry["ticker"]}"}} '
+                f"{entry['seconds']}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def write_reports(self, directory: str | Path, slowest: int = 10) -> None:
+        """Write scan_report.json and scan_metrics.prom into a directory."""
+        directory = Path(directory)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            with (directory / "scan_report.json").open("w") as f:
+                json.dump(self.report(slowest), f, indent=2)
+            (directory / "scan_metrics.prom").write_text(self.to_prometheus(slowest))
+            logger.info(f"Wrote scan reports to {directory}")
+        except OSError as e:
+            logger.warning(f"Could not write scan reports to {directory}: {e}")
+
+    def summary(self) -> str:
+        """One-line summary of where the time went."""
+        stages = ", ".join(
+            f"{stage} {total:.1f}s"
+            for stage, (_, total, _) in sorted(
+                self.stages.items(), key=lambda kv: kv[1][1], reverse=True
+            )
+            if stage != "total"
+        )
+        return (
+            f"{len(self.ticker_stages)} tickers; {stages}; "
+            f"{int(self.counters[REQUESTS])} requests, "
+            f"{int(self.counters[RETRIES])} retries, "
+            f"{int(self.counters[RATE_LIMITED])} rate limited, "
+            f"{self.counters[SLEEP_SECONDS]:.1f}s sleeping"
+        )
@@ -121,6 +121,8 @@ def get_liquid_tickers(
             ticker
             for ticker in all_tickers
             if ticker.get("exchange", "").upper() in major_exchanges
+            and _meets_minimum(ticker.get("market_cap"), min_market_cap)
+            and _meets_minimum(ticker.get("avg_volume"), min_avg_volume)
         ]
 
         # Extract just the symbols
@@ -177,6 +179,13 @@ def get_liquid_tickers(
         ]
 
 
+def _meets_minimum(value: Any, minimum: float | None) -> bool:
+    """Check a fundamentals threshold; unknown values are not filtered out."""
+    if value is None or not minimum:
+        return True
+    return value >= minimum
+
+
 def validate_ticker_symbols(symbols: list[str]) -> list[str]:
     """
     Validate ticker symbols against database.
@@ -1,6 +1,10 @@
 import json
+import multiprocessing
+import os
 import random
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import click
@@ -64,7 +68,7 @@ class GradientGeneratorCLI:
                 grad_type = GradientType(preset["type"])
                 grad_colors = preset["colors"]
                 grad_params = preset["params"]
-                name = preset["name"]
+                name = output_name or preset["name"]
             else:
                 if not gradient_type or not colors:
                     raise ValueError(
@@ -135,6 +139,63 @@ class GradientGeneratorCLI:
             print(f"❌ Error generating gradient: {e}")
             return False
 
+    def render_batch(self, jobs: list[dict], workers: int = 1) -> list[bool]:
+        """
+        Render generate_gradient jobs, across worker processes if workers > 1.
+
+        Jobs carry their colors and params (including any seed), so files are
+        identical whatever the number of workers; each file is written by the
+        worker as its render finishes. Prints a throughput summary.
+
+        Args:
+            jobs: Keyword arguments for generate_gradient, one dict per image
+            workers: Worker processes (0 = one per CPU core)
+
+        Returns:
+            list[bool]: Success of each job, in job order
+        """
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(jobs))
+
+        started = time.perf_counter()
+        if workers <= 1:
+            results = [self.generate_gradient(**job) for job in jobs]
+        else:
+            print(f"⚙️  Rendering {len(jobs)} images on {workers} worker processes")
+            results = [False] * len(jobs)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = {
+                    executor.submit(_render_batch_job, job): index
+                    for index, job in enumerate(jobs)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        # The worker itself died (e.g. out of memory)
+                        print(f"❌ Worker failed on job {index + 1}: {e}")
+        elapsed = max(time.perf_counter() - started, 1e-9)
+
+        resolutions = Resolution.get_all()
+        megapixels = sum(
+            resolutions[job.get("resolution", "1080p")][0]
+            * resolutions[job.get("resolution", "1080p")][1]
+            / 1e6
+            for job, ok in zip(jobs, results, strict=True)
+            if ok
+        )
+        done = sum(results)
+        print(
+            f"⏱️  {done} images, {megapixels:.1f} MP in {elapsed:.1f}s: "
+            f"{done / elapsed:.2f} images/s, {megapixels / elapsed:.1f} MP/s"
+        )
+        return results
+
     def _create_generator(
         self,
         grad_type: GradientType,
@@ -174,6 +235,27 @@ class GradientGeneratorCLI:
             return LinearGradientGenerator(width, height, colors, **params)
 
 
+# CLI instance of a batch worker process, created on its first job
+_worker_cli: GradientGeneratorCLI | None = None
+
+
+def _render_batch_job(job: dict) -> bool:
+    """Run one generate_gradient job inside a batch worker process."""
+    global _worker_cli
+    if _worker_cli is None:
+        _worker_cli = GradientGeneratorCLI()
+    return _worker_cli.generate_gradient(**job)
+
+
+jobs_option = click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    show_default=True,
+    help="Worker processes to render with (0 = one per CPU core)",
+)
+
+
 @click.group()
 @click.version_option("1.0.0")
 def cli():
@@ -305,35 +387,42 @@ def list_palettes():
 @click.option("--preset", "-p", help="Preset to use for batch generation")
 @click.option("--count", "-n", default=5, help="Number of gradients to generate")
 @click.option("--resolution", "-r", default="1080p", help="Output resolution")
-def batch(preset, count, resolution):
+@jobs_option
+def batch(preset, count, resolution, jobs):
     """Generate multiple gradients with variations."""
     generator = GradientGeneratorCLI()
 
     if preset:
         # Generate variations of the same preset
-        for i in range(count):
-            output_name = f"{preset}_variation_{i + 1}"
-            success = generator.generate_gradient(
-                preset_name=preset, resolution=resolution, output_name=output_name
-            )
-            if not success:
-                print(f"Failed to generate variation {i + 1}")
+        names = [f"{preset}_variation_{i + 1}" for i in range(count)]
+        batch_jobs = [
+            {"preset_name": preset, "resolution": resolution, "output_name": name}
+            for name in names
+        ]
+        failure = "Failed to generate variation {}"
     else:
         # Generate random presets
         import random
 
         presets = GradientPreset.list_presets()
 
+        batch_jobs = []
         for i in range(count):
             selected_preset = random.choice(presets)
             output_name = f"batch_{i + 1}_{selected_preset.lower().replace(' ', '_')}"
-            success = generator.generate_gradient(
-                preset_name=selected_preset,
-                resolution=resolution,
-                output_name=output_name,
+            batch_jobs.append(
+                {
+                    "preset_name": selected_preset,
+                    "resolution": resolution,
+                    "output_name": output_name,
+                }
             )
-            if not success:
-                print(f"Failed to generate batch item {i + 1}")
+        failure = "Failed to generate batch item {}"
+
+    results = generator.render_batch(batch_jobs, jobs)
+    for i, success in enumerate(results):
+        if not success:
+            print(failure.format(i + 1))
 
     print(f"🎉 Batch generation complete! Generated {count} gradients.")
 
@@ -791,7 +880,8 @@ def ai_enhanced(
 @click.option(
     "--complexity", type=float, default=0.7, help="Overall complexity (0.0-1.0)"
 )
-def ai_mood_batch(count, theme, resolution, use_ollama, complexity):
+@jobs_option
+def ai_mood_batch(count, theme, resolution, use_ollama, complexity, jobs):
     """Generate a batch of AI wallpapers exploring different moods, lighting, and atmospheres."""
     generator = GradientGeneratorCLI()
 
@@ -1079,7 +1169,7 @@ def ai_mood_batch(count, theme, resolution, use_ollama, complexity):
     )
     print("─" * 50)
 
-    successful_generations = 0
+    batch_jobs = []
 
     for i in range(count):
         # Select configuration (cycle through if count > available configs)
@@ -1134,21 +1224,26 @@ def ai_mood_batch(count, theme, resolution, use_ollama, complexity):
         # Create descriptive output name
         output_name = f"ai_mood_{theme}_{i + 1:02d}_{config['mood']}_{config['lighting']}_{composition}"
 
-        # Generate the wallpaper
-        success = generator.generate_gradient(
-            gradient_type=gradient_type,
-            colors=colors,
-            resolution=resolution,
-            output_name=output_name,
-            output_format="png",
-            **ai_params,
+        batch_jobs.append(
+            {
+                "gradient_type": gradient_type,
+                "colors": colors,
+                "resolution": resolution,
+                "output_name": output_name,
+                "output_format": "png",
+                **ai_params,
+            }
         )
 
+    # Render the wallpapers
+    print()
+    results = generator.render_batch(batch_jobs, jobs)
+    for job, success in zip(batch_jobs, results, strict=True):
         if success:
-            successful_generations += 1
-            print(f"   ✅ Generated: {output_name}")
+            print(f"   ✅ Generated: {job['output_name']}")
         else:
-            print(f"   ❌ Failed to generate {output_name}")
+            print(f"   ❌ Failed to generate {job['output_name']}")
+    successful_generations = sum(results)
 
     print("\n" + "─" * 50)
     print(
@@ -1161,7 +1256,8 @@ def ai_mood_batch(count, theme, resolution, use_ollama, complexity):
 @click.option("--count", "-n", default=5, help="Number of AI gradients to generate")
 @click.option("--resolution", "-r", default="1080p", help="Output resolution")
 @click.option("--mix-styles", is_flag=True, help="Mix different AI styles")
-def ai_batch(count, resolution, mix_styles):
+@jobs_option
+def ai_batch(count, resolution, mix_styles, jobs):
     """Generate multiple AI-powered gradients with random variations."""
     generator = GradientGeneratorCLI()
 
@@ -1180,6 +1276,7 @@ def ai_batch(count, resolution, mix_styles):
 
     print(f"🤖 Generating {count} AI-powered gradients...")
 
+    batch_jobs = []
     for i in range(count):
         style = random.choice(styles) if mix_styles else "fusion"
         gradient_type = random.choice(types)
@@ -1237,14 +1334,18 @@ def ai_batch(count, resolution, mix_styles):
 
         print(f"Generating {i + 1}/{count}: {style} {gradient_type} (seed: {seed})")
 
-        success = generator.generate_gradient(
-            gradient_type=gradient_type,
-            colors=colors,
-            resolution=resolution,
-            output_name=output_name,
-            **params,
+        batch_jobs.append(
+            {
+                "gradient_type": gradient_type,
+                "colors": colors,
+                "resolution": resolution,
+                "output_name": output_name,
+                **params,
+            }
         )
 
+    results = generator.render_batch(batch_jobs, jobs)
+    for i, success in enumerate(results):
         if not success:
             print(f"Failed to generate gradient {i + 1}")
 
@@ -5,12 +5,13 @@ Start with:
     uvicorn server:app --host 0.0.0.0 --port 8000
 """
 
-import io
+import os
 import random
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
 from pydantic import BaseModel, Field
@@ -31,8 +32,33 @@ from src.generators import (
 )
 from src.utils.ai_color_gen import AIColorGenerator
 from src.utils.color_utils import ColorPalette
+from src.utils.encode import (
+    DEFAULT_COMPRESS_LEVEL,
+    DEFAULT_QUALITY,
+    encoding_options,
+    media_type,
+)
+from src.utils.render_cache import RenderCache, render_key
+from src.utils.render_pool import RenderPool, RenderPoolBusy, render_to_bytes
+
+# Renders run in worker processes. WP_RENDER_WORKERS=0 renders on the
+# request thread; WP_RENDER_QUEUE renders may wait beyond the busy workers
+# before requests get 503.
+_WORKERS = int(os.getenv("WP_RENDER_WORKERS", str(os.cpu_count() or 1)))
+RENDER_POOL = RenderPool(
+    workers=_WORKERS,
+    max_queue=int(os.getenv("WP_RENDER_QUEUE", str(2 * max(_WORKERS, 1)))),
+    timeout=float(os.getenv("WP_RENDER_TIMEOUT_S", "120")),
+)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    RENDER_POOL.shutdown()
 
-app = FastAPI(title="wp-service", version="1.0.0")
+
+app = FastAPI(title="wp-service", version="1.0.0", lifespan=_lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -55,6 +81,34 @@ GENERATOR_MAP = {
 }
 
 
+# Encoded renders keyed by their inputs. WP_RENDER_CACHE_MEMORY_MB=0 disables
+# caching; WP_RENDER_CACHE_DIR="" keeps it in memory only.
+def _env_mb(name: str, default: str) -> int:
+    return int(float(os.getenv(name, default)) * 1024 * 1024)
+
+
+RENDER_CACHE = (
+    RenderCache(
+        os.getenv("WP_RENDER_CACHE_DIR", "cache/renders") or None,
+        memory_bytes=_env_mb("WP_RENDER_CACHE_MEMORY_MB", "64"),
+        disk_bytes=_env_mb("WP_RENDER_CACHE_DISK_MB", "1024"),
+    )
+    if _env_mb("WP_RENDER_CACHE_MEMORY_MB", "64") > 0
+    else None
+)
+
+# Opt-in float32 renders evaluated in row tiles, so peak memory follows the
+# tile size rather than the resolution (useful in small containers)
+LOW_MEMORY_RENDER = os.getenv("WP_RENDER_LOW_MEMORY", "0").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# PNG zlib level / WebP method for requests that do not set compress_level
+COMPRESS_LEVEL = int(os.getenv("WP_COMPRESS_LEVEL", str(DEFAULT_COMPRESS_LEVEL)))
+
+
 # ---------------------------------------------------------------------------
 # Request / response models
 # ---------------------------------------------------------------------------
@@ -71,11 +125,20 @@ class GenerateRequest(BaseModel):
     seed: int | None = None
     professional: bool = True
     holographic: bool | None = None
+    # Encoding: png, jpeg or webp; quality for JPEG/WebP; zlib level for PNG
+    # and method for WebP (WP_COMPRESS_LEVEL when unset)
+    quality: int = Field(DEFAULT_QUALITY, ge=1, le=100)
+    compress_level: int | None = Field(None, ge=0, le=9)
 
     class Config:
         populate_by_name = True
 
 
+class PreviewRequest(GenerateRequest):
+    # Preview width in pixels; height follows the resolution's aspect ratio
+    width: int = Field(480, ge=16, le=1280)
+
+
 class AIColorsRequest(BaseModel):
     prompt: str
     num_colors: int = 4
@@ -98,8 +161,10 @@ def _build_params(
     professional: bool,
     resolution: str = "1080p",
     holographic: bool | None = None,
+    rng: random.Random | None = None,
 ) -> dict:
     """Build generation params for HTTP generation (tuned for smooth, editorial output)."""
+    rng = rng or random.Random()
     w, h = Resolution.get(resolution)
     ref_diag = (1920 * 1920 + 1080 * 1080) ** 0.5
     diag = (w * w + h * h) ** 0.5
@@ -113,7 +178,7 @@ def _build_params(
             "reflection": 0.4 + complexity * 0.3,
             "distortion": 0.15 + complexity * 0.1,
             "highlights": 0.6 + complexity * 0.3,
-            "angle": random.randint(15, 165),
+            "angle": rng.randint(15, 165),
             "grain_intensity": base_grain + complexity * 0.01,
             "grain_type": "photographic",
             "grain_quality": "professional",
@@ -129,7 +194,7 @@ def _build_params(
             "grain_intensity": base_grain + complexity * 0.01,
             "grain_type": "photographic",
             "grain_quality": "professional",
-            "angle": random.randint(15, 165),
+            "angle": rng.randint(15, 165),
             "gamma_correct": True,
             "anti_banding": True,
         }
@@ -150,18 +215,93 @@ def _build_params(
     }
 
 
+def _colors_and_params(req: GenerateRequest) -> tuple[list, dict]:
+    """Palette and generator params for a request (reproducible when seeded)."""
+    ai_gen = AIColorGenerator(
+        seed=req.seed,
+        use_ollama=req.use_ollama,
+    )
+
+    if req.use_ollama and req.prompt:
+        try:
+            colors = ai_gen.generate_ollama_palette(req.prompt, 4, req.style)
+        except RuntimeError as exc:
+            raise HTTPException(status_code=502, detail=str(exc)) from exc
+    elif req.use_ollama:
+        try:
+            colors = ai_gen.generate_ollama_style_palette(req.style, 4)
+        except RuntimeError as exc:
+            raise HTTPException(status_code=502, detail=str(exc)) from exc
+    else:
+        colors = ai_gen.generate_professional_palette(req.style, 4)
+
+    params = _build_params(
+        req.gradient_type,
+        req.complexity,
+        req.professional,
+        req.resolution,
+        req.holographic,
+        rng=random.Random(req.seed) if req.seed is not None else None,
+    )
+    if req.seed is not None:
+        params["seed"] = int(req.seed)
+    if LOW_MEMORY_RENDER:
+        params["low_memory"] = True
+    return colors, params
+
+
+def _encoding(req: GenerateRequest) -> dict:
+    """Encoder options for a request, only those its output format uses."""
+    level = req.compress_level
+    return encoding_options(
+        req.output_format, COMPRESS_LEVEL if level is None else level, req.quality
+    )
+
+
+def _server_timing(timings: dict[str, float] | None) -> str:
+    """Server-Timing header value (milliseconds), or a cache hit marker."""
+    if timings is None:
+        return 'cache;desc="hit"'
+    return ", ".join(f"{name};dur={sec * 1000:.1f}" for name, sec in timings.items())
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header covers etag (weak or strong)."""
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return etag in tags
+
+
 def _render_image(
     gradient_type: str,
     colors: list[tuple[int, int, int]],
     resolution: str,
     output_format: str,
     params: dict,
-) -> bytes:
-    """Render a gradient and return raw image bytes."""
+    encoding: dict,
+    key: str | None = None,
+    size: tuple[int, int] | None = None,
+) -> tuple[bytes, dict[str, float] | None]:
+    """
+    Render a gradient and return raw image bytes (cached by render key).
+
+    An explicit (width, height) size renders a preview on the request
+    thread instead of queueing behind full-size renders in the pool.
+
+    Returns:
+        Tuple of the encoded bytes and the render/encode seconds (None when
+        served from the cache)
+    """
+    if RENDER_CACHE is not None and key is not None:
+        cached = RENDER_CACHE.get(key)
+        if cached is not None:
+            return cached, None
+
     res = Resolution.get_all()
     if resolution not in res:
         raise HTTPException(status_code=400, detail=f"Unknown resolution: {resolution}")
-    width, height = res[resolution]
+    width, height = size or res[resolution]
 
     gen_cls = GENERATOR_MAP.get(gradient_type)
     if gen_cls is None:
@@ -169,14 +309,31 @@ def _render_image(
             status_code=400, detail=f"Unknown gradient type: {gradient_type}"
         )
 
-    generator = gen_cls(width, height, colors, **params)
-    img = generator.to_image()
+    try:
+        args = (gen_cls, width, height, colors, params, output_format)
+        if size is not None:
+            data, timings = render_to_bytes(*args, **encoding)
+        else:
+            data, timings = RENDER_POOL.render(
+                *args,
+                encoding.get("compress_level", DEFAULT_COMPRESS_LEVEL),
+                encoding.get("quality", DEFAULT_QUALITY),
+            )
+    except RenderPoolBusy as exc:
+        raise HTTPException(
+            status_code=503,
+            detail="Render queue is full, try again shortly",
+            headers={"Retry-After": str(exc.retry_after)},
+        ) from exc
+    except TimeoutError as exc:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Render did not finish within {RENDER_POOL.timeout:g}s",
+        ) from exc
 
-    buf = io.BytesIO()
-    fmt = "JPEG" if output_format.lower() in ("jpg", "jpeg") else "PNG"
-    img.save(buf, format=fmt, quality=95)
-    buf.seek(0)
-    return buf.read()
+    if RENDER_CACHE is not None and key is not None:
+        RENDER_CACHE.put(key, data)
+    return data, timings
 
 
 # ---------------------------------------------------------------------------
@@ -250,41 +407,109 @@ def generate_ai_colors(req: AIColorsRequest):
     )
 
 
+@app.get("/api/cache")
+def render_cache_stats():
+    """Return render cache hit/miss counters and sizes."""
+    if RENDER_CACHE is None:
+        return {"enabled": False}
+    return {"enabled": True, **RENDER_CACHE.summary()}
+
+
+@app.get("/api/render-pool")
+def render_pool_stats():
+    """Return render worker pool size, queue depth and counters."""
+    return RENDER_POOL.summary()
+
+
 @app.post("/api/generate")
-def generate_wallpaper(req: GenerateRequest):
-    """Generate a wallpaper and return it as image bytes."""
-    ai_gen = AIColorGenerator(
-        seed=req.seed,
-        use_ollama=req.use_ollama,
-    )
+def generate_wallpaper(req: GenerateRequest, if_none_match: str | None = Header(None)):
+    """
+    Generate a wallpaper and return it as image bytes.
 
-    if req.use_ollama and req.prompt:
-        try:
-            colors = ai_gen.generate_ollama_palette(req.prompt, 4, req.style)
-        except RuntimeError as exc:
-            raise HTTPException(status_code=502, detail=str(exc)) from exc
-    elif req.use_ollama:
-        try:
-            colors = ai_gen.generate_ollama_style_palette(req.style, 4)
-        except RuntimeError as exc:
-            raise HTTPException(status_code=502, detail=str(exc)) from exc
-    else:
-        colors = ai_gen.generate_professional_palette(req.style, 4)
+    The ETag is the render key, so a repeat request carrying it in
+    If-None-Match gets a 304 without rendering.
+    """
+    colors, params = _colors_and_params(req)
+    encoding = _encoding(req)
 
-    params = _build_params(
+    key = render_key(
         req.gradient_type,
-        req.complexity,
-        req.professional,
+        colors,
         req.resolution,
-        req.holographic,
+        req.output_format,
+        params,
+        encoding,
     )
-    if req.seed is not None:
-        params["seed"] = int(req.seed)
-    image_bytes = _render_image(
-        req.gradient_type, colors, req.resolution, req.output_format, params
+    headers = {"ETag": f'"{key}"'}
+    if _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    image_bytes, timings = _render_image(
+        req.gradient_type,
+        colors,
+        req.resolution,
+        req.output_format,
+        params,
+        encoding,
+        key,
+    )
+    headers["Server-Timing"] = _server_timing(timings)
+
+    return Response(
+        content=image_bytes, media_type=media_type(req.output_format), headers=headers
+    )
+
+
+@app.post("/api/preview")
+def preview_wallpaper(req: PreviewRequest, if_none_match: str | None = Header(None)):
+    """
+    Render a small, aspect-preserving preview of a /api/generate request.
+
+    The preview uses the same generator, colors and params, with smoothing
+    and grain scaled to the full resolution (``reference_width``). A seed
+    is chosen when the request has none and returned in ``X-Seed``; the
+    same request with that seed sent to /api/generate renders the
+    full-size version of the image.
+    """
+    if req.seed is None:
+        req = req.model_copy(update={"seed": random.randint(1, 2**31 - 1)})
+
+    if req.resolution not in Resolution.get_all():
+        raise HTTPException(
+            status_code=400, detail=f"Unknown resolution: {req.resolution}"
+        )
+    full_width, full_height = Resolution.get(req.resolution)
+    width = min(req.width, full_width)
+    height = max(1, round(width * full_height / full_width))
+
+    colors, params = _colors_and_params(req)
+    params["reference_width"] = full_width
+    encoding = _encoding(req)
+
+    key = render_key(
+        req.gradient_type,
+        colors,
+        f"{width}x{height}",
+        req.output_format,
+        params,
+        encoding,
+    )
+    headers = {"ETag": f'"{key}"', "X-Seed": str(req.seed)}
+    if _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    image_bytes, timings = _render_image(
+        req.gradient_type,
+        colors,
+        req.resolution,
+        req.output_format,
+        params,
+        encoding,
+        key,
+        size=(width, height),
     )
+    headers["Server-Timing"] = _server_timing(timings)
 
-    media = (
-        "image/jpeg" if req.output_format.lower() in ("jpg", "jpeg") else "image/png"
+    return Response(
+        content=image_bytes, media_type=media_type(req.output_format), headers=headers
     )
-    return Response(content=image_bytes, media_type=media)
@@ -3,11 +3,15 @@ Base classes and enums for the gradient generator.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from enum import Enum
 
 import numpy as np
 from PIL import Image
 
+# Rows per independently seeded block of tile_noise() fields
+_NOISE_BLOCK_ROWS = 64
+
 
 class GradientType(Enum):
     """Supported gradient types."""
@@ -61,6 +65,10 @@ class Resolution:
 class BaseGenerator(ABC):
     """Base class for all gradient generators."""
 
+    # Pointwise generators implement t_field and set this, letting low-memory
+    # renders color the image tile by tile
+    tileable = False
+
     def __init__(
         self, width: int, height: int, colors: list[tuple[int, int, int]], **params
     ):
@@ -102,19 +110,186 @@ class BaseGenerator(ABC):
             return str(self.params["blend_space"])
         return "oklab" if self.params.get("gamma_correct", True) else "srgb"
 
+    @property
+    def low_memory(self) -> bool:
+        """Opt-in float32 pipeline evaluated in row tiles (``params['low_memory']``)."""
+        return bool(self.params.get("low_memory", False))
+
+    @property
+    def float_dtype(self) -> type:
+        """Working float type: float32 in low-memory mode, float64 otherwise."""
+        return np.float32 if self.low_memory else np.float64
+
+    @property
+    def pixel_scale(self) -> float:
+        """
+        Size of a pixel here relative to a ``reference_width`` render.
+
+        Pixel-sized effects (smoothing radius, grain) are multiplied by this,
+        so a small preview rendered with ``reference_width`` set to the
+        full-size width looks like the full render scaled down. 1.0 when
+        the param is unset.
+        """
+        reference = self.params.get("reference_width")
+        return self.width / reference if reference else 1.0
+
+    def row_tiles(self) -> list[slice]:
+        """
+        Row bands to evaluate the image in.
+
+        The whole image in one band by default; ``tile_rows`` rows per band
+        (default 256) in low-memory mode.
+        """
+        if not self.low_memory:
+            return [slice(0, self.height)]
+        step = max(1, int(self.params.get("tile_rows", 256)))
+        return [
+            slice(top, min(top + step, self.height))
+            for top in range(0, self.height, step)
+        ]
+
+    def tile_noise(
+        self, rng: np.random.Generator, field: int, rows: slice
+    ) -> np.ndarray:
+        """
+        Standard normal float32 noise over a band of rows of one noise field.
+
+        Fields are drawn in blocks of rows, each from its own stream keyed by
+        (field, block) under ``rng``'s seed, so a band (halo rows included)
+        has the same values whichever tile asks for it, and low-memory
+        results do not depend on ``tile_rows``.
+
+        Args:
+            rng: Generator whose seed the streams derive from
+            field: Index of the noise field
+            rows: Band of rows to return
+
+        Returns:
+            numpy.ndarray: float32 noise of shape (rows, width)
+        """
+        seed = rng.bit_generator.seed_seq
+        first = rows.start // _NOISE_BLOCK_ROWS
+        last = (rows.stop - 1) // _NOISE_BLOCK_ROWS
+        blocks = [
+            np.random.default_rng(
+                np.random.SeedSequence(
+                    seed.entropy, spawn_key=(*seed.spawn_key, field, block)
+                )
+            ).standard_normal((_NOISE_BLOCK_ROWS, self.width), dtype=np.float32)
+            for block in range(first, last + 1)
+        ]
+        offset = first * _NOISE_BLOCK_ROWS
+        return np.concatenate(blocks)[rows.start - offset : rows.stop - offset]
+
+    def grid_vectors(
+        self,
+        x_range: tuple[float, float],
+        y_range: tuple[float, float],
+        rows: slice = slice(None),
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Pixel coordinates as broadcastable vectors instead of a full meshgrid.
+
+        Args:
+            x_range: Coordinates of the first and last column
+            y_range: Coordinates of the first and last row
+            rows: Band of rows to return y for
+
+        Returns:
+            Tuple of x with shape (1, width) and y with shape (rows, 1), in the
+            working float type
+        """
+        x = np.linspace(*x_range, self.width, dtype=self.float_dtype)
+        y = np.linspace(*y_range, self.height, dtype=self.float_dtype)
+        return x[np.newaxis, :], y[rows, np.newaxis]
+
+    def t_field(self, rows: slice) -> np.ndarray:
+        """
+        Scalar field t in [0, 1] for a band of rows.
+
+        Pointwise generators (``tileable = True``) implement this so the image
+        can be colored tile by tile; the result must broadcast to
+        (rows, width).
+        """
+        raise NotImplementedError(f"{type(self).__name__} is not tileable")
+
+    def render_t_field(self, dtype: type | None = None) -> np.ndarray:
+        """
+        Color ``t_field`` over the whole image, one row tile at a time.
+
+        Args:
+            dtype: Output dtype (see ``interpolate_tiles``)
+
+        Returns:
+            numpy.ndarray: RGB array (H, W, 3) in 0–255
+        """
+        return self.interpolate_tiles(self.t_field, dtype)
+
+    def interpolate_tiles(
+        self, t_rows: Callable[[slice], np.ndarray], dtype: type | None = None
+    ) -> np.ndarray:
+        """
+        Map t to RGB tile by tile, so color temporaries stay tile-sized.
+
+        Args:
+            t_rows: Returns t for a band of rows (broadcastable to (rows, width))
+            dtype: Output dtype (default: working float type). With uint8, each
+                tile is clipped and stored as it is produced, so no full-size
+                float image is ever allocated.
+
+        Returns:
+            numpy.ndarray: RGB array (H, W, 3) in 0–255
+        """
+        tiles = self.row_tiles()
+        if dtype is None and len(tiles) == 1:
+            rows = tiles[0]
+            t = np.broadcast_to(t_rows(rows), (self.height, self.width))
+            return self.interpolate_from_t_grid(t)
+
+        out = np.empty((self.height, self.width, 3), dtype=dtype or self.float_dtype)
+        for rows in tiles:
+            band = self.interpolate_from_t_grid(t_rows(rows))
+            if out.dtype == np.uint8:
+                np.clip(band, 0, 255, out=band)
+            out[rows] = band
+        return out
+
+    def normalized_field(self, field_rows: Callable[[slice], np.ndarray]) -> np.ndarray:
+        """
+        Evaluate a scalar field tile by tile and rescale it to [0, 1].
+
+        Args:
+            field_rows: Returns the field for a band of rows
+
+        Returns:
+            numpy.ndarray: (H, W) field in the working float type, min-max
+            normalized over the whole image
+        """
+        field = np.empty((self.height, self.width), dtype=self.float_dtype)
+        for rows in self.row_tiles():
+            field[rows] = field_rows(rows)
+
+        low, high = field.min(), field.max()
+        field -= low
+        field /= high - low
+        return field
+
     def interpolate_from_t_grid(self, t_grid: np.ndarray) -> np.ndarray:
         """
-        Vector map of t in [0, 1] to RGB (H, W, 3) float64 0–255.
+        Vector map of t in [0, 1] to RGB (..., 3) 0–255.
 
         Uses OKLab when gamma-correct blending is enabled (default), linear sRGB
         power curve when blend_space is ``linear``, or direct sRGB lerp otherwise.
+        Computes in float32 for float32 t and float64 for anything else.
         """
         from ..utils.color_utils import oklab_to_rgb8, rgb8_to_oklab
 
-        t = np.clip(np.asarray(t_grid, dtype=np.float64), 0.0, 1.0)
+        t = np.asarray(t_grid)
+        dtype = np.float32 if t.dtype == np.float32 else np.float64
+        t = np.clip(t.astype(dtype, copy=False), 0.0, 1.0)
         n = len(self.colors)
         if n < 2:
-            c = np.array(self.colors[0], dtype=np.float64)
+            c = np.array(self.colors[0], dtype=dtype)
             return np.broadcast_to(c, t.shape + (3,)).copy()
 
         space = self._blend_space()
@@ -124,25 +299,77 @@ class BaseGenerator(ABC):
         tt3 = tt[..., np.newaxis]
 
         if space == "srgb":
-            pal = np.array(self.colors, dtype=np.float64)
+            pal = np.array(self.colors, dtype=dtype)
             c0 = pal[idx]
             c1 = pal[idx + 1]
             return (1.0 - tt3) * c0 + tt3 * c1
 
         if space == "linear":
-            pal = (np.array(self.colors, dtype=np.float64) / 255.0) ** 2.2
+            pal = ((np.array(self.colors, dtype=np.float64) / 255.0) ** 2.2).astype(
+                dtype
+            )
             c0 = pal[idx]
             c1 = pal[idx + 1]
             mixed = (1.0 - tt3) * c0 + tt3 * c1
             return np.clip(mixed ** (1.0 / 2.2), 0.0, 1.0) * 255.0
 
         pal = np.array(self.colors, dtype=np.float64)
-        lab_stops = rgb8_to_oklab(pal)
+        lab_stops = rgb8_to_oklab(pal).astype(dtype)
         c0 = lab_stops[idx]
         c1 = lab_stops[idx + 1]
         mixed_lab = (1.0 - tt3) * c0 + tt3 * c1
         return oklab_to_rgb8(mixed_lab)
 
+    def adjust_hsv(
+        self,
+        array: np.ndarray,
+        hue_shift: np.ndarray | float = 0.0,
+        saturation: np.ndarray | float = 1.0,
+        value: np.ndarray | float = 1.0,
+    ) -> np.ndarray:
+        """
+        Shift hue and scale saturation/value over a whole RGB image.
+
+        Works in float32 bands of rows so intermediates stay cache-sized;
+        results match a per-pixel ``colorsys`` round trip to 3e-4 (0–255).
+
+        Args:
+            array: RGB array (H, W, 3) in 0–255
+            hue_shift: Hue offset in turns (wraps); scalar or broadcastable to (H, W)
+            saturation: Saturation multiplier (capped at 1); as hue_shift
+            value: Value multiplier (capped at 1); as hue_shift
+
+        Returns:
+            numpy.ndarray: Adjusted RGB array (H, W, 3) 0–255, float64 (float32
+            for float32 input)
+        """
+        from ..utils.color_utils import hsv_to_rgb_array, rgb_to_hsv_array
+
+        height, width = array.shape[:2]
+        # Wrap the shift to [-0.5, 0.5] first so hue + shift stays small,
+        # where float32 steps keep the round trip within 3e-4 of colorsys
+        hue_shift = np.asarray(hue_shift)
+        hue_shift = hue_shift - np.round(hue_shift)
+        hue_shift, saturation, value = (
+            np.broadcast_to(np.asarray(p, dtype=np.float32), (height, width))
+            for p in (hue_shift, saturation, value)
+        )
+
+        dtype = np.float32 if array.dtype == np.float32 else np.float64
+        result = np.empty((height, width, 3), dtype=dtype)
+        band = 32
+        for top in range(0, height, band):
+            rows = slice(top, top + band)
+            hsv = rgb_to_hsv_array(array[rows].astype(np.float32) / 255.0)
+            h = hsv[..., 0]
+            h += hue_shift[rows]
+            h -= np.floor(h)
+            np.minimum(hsv[..., 1] * saturation[rows], 1.0, out=hsv[..., 1])
+            np.minimum(hsv[..., 2] * value[rows], 1.0, out=hsv[..., 2])
+            result[rows] = hsv_to_rgb_array(hsv)
+        result *= 255.0
+        return result
+
     @abstractmethod
     def generate(self) -> np.ndarray:
         """
@@ -161,10 +388,8 @@ class BaseGenerator(ABC):
             filename: Output filename
             quality: JPEG quality (ignored for PNG)
         """
-        gradient_array = self.generate()
-
         # Ensure values are in valid range
-        gradient_array = np.clip(gradient_array, 0, 255).astype(np.uint8)
+        gradient_array = self.to_array()
 
         # Create PIL Image
         image = Image.fromarray(gradient_array, "RGB")
@@ -182,9 +407,27 @@ class BaseGenerator(ABC):
         Returns:
             PIL.Image.Image: The gradient as a PIL Image
         """
+        return Image.fromarray(self.to_array(), "RGB")
+
+    def to_array(self) -> np.ndarray:
+        """
+        Render the gradient as a uint8 RGB array.
+
+        In low-memory mode, tileable generators write each tile straight into
+        the uint8 image and other generators are clipped in place, so the peak
+        is the generator's own working set plus the 8-bit output.
+
+        Returns:
+            numpy.ndarray: uint8 array of shape (height, width, 3)
+        """
+        if self.low_memory and self.tileable:
+            return self.render_t_field(np.uint8)
+
         gradient_array = self.generate()
-        gradient_array = np.clip(gradient_array, 0, 255).astype(np.uint8)
-        return Image.fromarray(gradient_array, "RGB")
+        if self.low_memory and gradient_array.dtype.kind == "f":
+            np.clip(gradient_array, 0, 255, out=gradient_array)
+            return gradient_array.astype(np.uint8)
+        return np.clip(gradient_array, 0, 255).astype(np.uint8)
 
     def interpolate_colors(self, t: float) -> tuple[int, int, int]:
         """
@@ -229,13 +472,49 @@ class BaseGenerator(ABC):
         Returns:
             numpy.ndarray: Smoothed array
         """
-        from scipy.ndimage import gaussian_filter
+        return self.smooth_channels(array, sigma)
+
+    def smooth_channels(
+        self, array: np.ndarray, sigma: float, mode: str = "reflect"
+    ) -> np.ndarray:
+        """
+        Gaussian-blur all channels of an (H, W, C) array.
 
-        # Apply smoothing to each color channel
-        smoothed = np.zeros_like(array)
-        for i in range(3):
-            smoothed[:, :, i] = gaussian_filter(array[:, :, i], sigma=sigma)
+        Uses ``utils.blur.gaussian_blur``: one exact filter call for small
+        sigmas, a downsampled blur from ``blur_fast_sigma`` (default 4.0; 0
+        keeps every blur exact). In low-memory mode the blur runs over row
+        tiles padded with a halo covering the kernel, so tiles match the
+        full-frame result while temporaries stay tile-sized; the output is
+        then float32.
 
+        Args:
+            array: Input array (H, W, C)
+            sigma: Gaussian sigma in pixels (of the ``reference_width``
+                render, see ``pixel_scale``)
+            mode: Border mode passed to ``scipy.ndimage.gaussian_filter``
+
+        Returns:
+            numpy.ndarray: Smoothed array
+        """
+        from ..utils.blur import FAST_SIGMA, blur_factor, blur_halo, gaussian_blur
+
+        sigma = sigma * self.pixel_scale
+        fast_sigma = float(self.params.get("blur_fast_sigma", FAST_SIGMA))
+        if not self.low_memory:
+            return gaussian_blur(array, sigma, mode=mode, fast_sigma=fast_sigma)
+
+        height = array.shape[0]
+        halo = blur_halo(sigma, fast_sigma)
+        factor = blur_factor(sigma, fast_sigma)
+        smoothed = np.empty(array.shape, dtype=np.float32)
+        for rows in self.row_tiles():
+            # Start on a multiple of the downsampling factor so tiles share
+            # the full-frame block grid
+            top = max(rows.start - halo, 0) // factor * factor
+            bottom = min(rows.stop + halo, height)
+            band = array[top:bottom].astype(np.float32)
+            filtered = gaussian_blur(band, sigma, mode=mode, fast_sigma=fast_sigma)
+            smoothed[rows] = filtered[rows.start - top : rows.stop - top]
         return smoothed
 
     def gamma_correct_interpolate(self, t: float) -> tuple[int, int, int]:
@@ -290,6 +569,9 @@ class BaseGenerator(ABC):
             numpy.ndarray: Dithered array
         """
         rng = self._dither_rng()
+        if self.low_memory:
+            return self._dither_tiles(array, intensity, rng)
+
         noise = rng.normal(0, intensity, array.shape)
         noise = noise + rng.normal(0, intensity * 0.5, array.shape)
         noise = noise / 2.0
@@ -297,6 +579,22 @@ class BaseGenerator(ABC):
         dithered = array + noise
         return np.clip(dithered, 0, 255)
 
+    def _dither_tiles(
+        self, array: np.ndarray, intensity: float, rng: np.random.Generator
+    ) -> np.ndarray:
+        """Low-memory dithering: float32 noise drawn tile by tile."""
+        # One stream per noise term keeps the result independent of tile_rows
+        first, second = rng.spawn(2)
+
+        dithered = array.astype(np.float32)
+        for rows in self.row_tiles():
+            shape = dithered[rows].shape
+            noise = first.standard_normal(shape, dtype=np.float32) * intensity
+            noise += second.standard_normal(shape, dtype=np.float32) * (intensity * 0.5)
+            noise /= 2.0
+            dithered[rows] += noise
+        return np.clip(dithered, 0, 255, out=dithered)
+
     def optimize_for_web(
         self, array: np.ndarray, target_format: str = "jpg"
     ) -> np.ndarray:
@@ -6,12 +6,144 @@ import numpy as np
 
 from ..core.base import BaseGenerator
 
+# Escape radius for smooth coloring (2^8); a large radius keeps the
+# fractional iteration count continuous across escape bands
+_SMOOTH_BAILOUT2 = 2.0**16
+
+# Compact the active set once this share of it has escaped
+_COMPACT_SHARE = 0.25
+
+# Squared distance under which an orbit counts as having returned to a
+# saved point (periodicity check)
+_PERIOD_EPS2 = 1e-20
+
+
+def _in_main_bulbs(cr: np.ndarray, ci: np.ndarray) -> np.ndarray:
+    """Points inside the Mandelbrot main cardioid or period-2 bulb."""
+    x = cr - 0.25
+    ci2 = ci * ci
+    q = x * x + ci2
+    cardioid = q * (q + x) <= 0.25 * ci2
+    bulb = (cr + 1.0) ** 2 + ci2 <= 0.0625
+    return cardioid | bulb
+
+
+def escape_time(
+    zr: np.ndarray,
+    zi: np.ndarray,
+    cr: np.ndarray,
+    ci: np.ndarray,
+    max_iter: int,
+    burning_ship: bool = False,
+    smooth: bool = True,
+    periodicity: bool = True,
+    skip: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Escape-time iteration of z <- z^2 + c over a compacted active set.
+
+    Only points that have not escaped are iterated. Escaped points are
+    parked at z = c = 0 (a fixed point) and dropped from the arrays once
+    they make up a quarter of them, and every update runs in place on
+    preallocated scratch arrays.
+
+    Args:
+        zr, zi: Starting z, real and imaginary parts (1-D float64)
+        cr, ci: c per point, same shape as zr
+        max_iter: Maximum iterations
+        burning_ship: Iterate (|Re z| + i|Im z|)^2 + c instead
+        smooth: Fractional counts n - log2(log2|z_n|) with a 2^8 escape
+            radius; otherwise integer counts with radius 2
+        periodicity: Stop iterating orbits that return to a saved point
+            (they never escape)
+        skip: Optional mask of points known never to escape
+
+    Returns:
+        numpy.ndarray: Iteration count per point; ``max_iter - 1`` for
+        points that never escape
+    """
+    counts = np.full(zr.shape, max_iter - 1, dtype=np.float64)
+
+    index = np.arange(zr.size)
+    if skip is not None:
+        index = index[~skip]
+    zr, zi, cr, ci = zr[index], zi[index], cr[index], ci[index]
+
+    bailout2 = _SMOOTH_BAILOUT2 if smooth else 4.0
+    zr2 = zr * zr
+    zi2 = zi * zi
+    mag2 = np.empty_like(zr)
+    live = np.ones(zr.shape, dtype=bool)
+    parked = 0
+
+    # Brent-style periodicity check: compare against z saved at
+    # power-of-two iterations, testing every 8th iteration
+    saved_r, saved_i = zr.copy(), zi.copy()
+    save_at = 16
+
+    for n in range(max_iter):
+        np.add(zr2, zi2, out=mag2)
+        finished = mag2 > bailout2
+        escaped = np.flatnonzero(finished)
+        if escaped.size:
+            if smooth:
+                log_zn = 0.5 * np.log2(mag2[escaped])
+                counts[index[escaped]] = np.maximum(n - np.log2(log_zn), 0.0)
+            else:
+                counts[index[escaped]] = max(n - 1, 0)
+
+        if periodicity and n % 8 == 0 and n:
+            diff = (zr - saved_r) ** 2 + (zi - saved_i) ** 2
+            finished |= live & (diff < _PERIOD_EPS2)
+            if n == save_at:
+                saved_r[:] = zr
+                saved_i[:] = zi
+                save_at *= 2
+
+        done = np.flatnonzero(finished)
+        if done.size:
+            for arr in (zr, zi, cr, ci, zr2, zi2):
+                arr[done] = 0.0
+            live[done] = False
+            parked += done.size
+
+            if parked >= _COMPACT_SHARE * live.size:
+                keep = np.flatnonzero(live)
+                if keep.size == 0:
+                    break
+                index = index[keep]
+                zr, zi, cr, ci = zr[keep], zi[keep], cr[keep], ci[keep]
+                zr2, zi2 = zr2[keep], zi2[keep]
+                saved_r, saved_i = saved_r[keep], saved_i[keep]
+                mag2 = np.empty_like(zr)
+                live = np.ones(zr.shape, dtype=bool)
+                parked = 0
+
+        # z <- z^2 + c, in place (the imaginary part needs the old real part)
+        np.multiply(zr, zi, out=zi)
+        if burning_ship:
+            np.abs(zi, out=zi)
+        zi *= 2.0
+        zi += ci
+        np.subtract(zr2, zi2, out=zr)
+        zr += cr
+        np.multiply(zr, zr, out=zr2)
+        np.multiply(zi, zi, out=zi2)
+
+    return counts
+
 
 class FractalGenerator(BaseGenerator):
     """Generate gradients using fractal algorithms."""
 
+    tileable = True
+
     def generate(self) -> np.ndarray:
         """Generate a fractal gradient."""
+        return self.render_t_field()
+
+    def t_field(self, rows: slice) -> np.ndarray:
+        """Normalized escape iterations for a band of rows."""
 
         # Parameters
         fractal_type = self.params.get("type", "mandelbrot")
@@ -21,21 +153,25 @@ class FractalGenerator(BaseGenerator):
         center_y = self.params.get("center_y", 0.0)
 
         if fractal_type == "mandelbrot":
-            return self._mandelbrot(max_iter, zoom, center_x, center_y)
+            t = self._mandelbrot(max_iter, zoom, center_x, center_y, rows)
         elif fractal_type == "julia":
             c_real = self.params.get("c_real", -0.7)
             c_imag = self.params.get("c_imag", 0.27015)
-            return self._julia(max_iter, zoom, center_x, center_y, c_real, c_imag)
+            t = self._julia(max_iter, zoom, center_x, center_y, c_real, c_imag, rows)
         elif fractal_type == "burning_ship":
-            return self._burning_ship(max_iter, zoom, center_x, center_y)
+            t = self._burning_ship(max_iter, zoom, center_x, center_y, rows)
         else:
             # Default to Mandelbrot
-            return self._mandelbrot(max_iter, zoom, center_x, center_y)
+            t = self._mandelbrot(max_iter, zoom, center_x, center_y, rows)
 
-    def _mandelbrot(
-        self, max_iter: int, zoom: float, center_x: float, center_y: float
-    ) -> np.ndarray:
-        """Generate Mandelbrot set."""
+        # Iteration stays in float64 (zoomed views need the precision); only
+        # the normalized counts drop to the working type
+        return t.astype(self.float_dtype, copy=False)
+
+    def _plane(
+        self, zoom: float, center_x: float, center_y: float, rows: slice
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Real and imaginary parts of the complex plane for a band of rows."""
 
         # Define complex plane bounds
         width_bound = 2.0 / zoom
@@ -44,25 +180,52 @@ class FractalGenerator(BaseGenerator):
         # Create coordinate arrays
         x = np.linspace(center_x - width_bound, center_x + width_bound, self.width)
         y = np.linspace(center_y - height_bound, center_y + height_bound, self.height)
-        X, Y = np.meshgrid(x, y)
+        return np.meshgrid(x, y[rows])
 
-        # Create complex plane
-        C = X + 1j * Y
-        Z = np.zeros_like(C)
+    def _iterate(
+        self,
+        zr: np.ndarray,
+        zi: np.ndarray,
+        cr: np.ndarray,
+        ci: np.ndarray,
+        max_iter: int,
+        burning_ship: bool = False,
+        skip: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Run the escape-time kernel on a grid and normalize to 0-1."""
+        shape = zr.shape
+        counts = escape_time(
+            zr.ravel(),
+            zi.ravel(),
+            cr.ravel(),
+            ci.ravel(),
+            max_iter,
+            burning_ship=burning_ship,
+            smooth=self.params.get("smooth", True),
+            periodicity=self.params.get("early_out", True),
+            skip=None if skip is None else skip.ravel(),
+        )
 
-        # Iteration counts
-        iterations = np.zeros(C.shape, dtype=int)
+        # Normalize iterations to 0-1 range for color mapping
+        return counts.reshape(shape) / max_iter
 
-        for i in range(max_iter):
-            # Calculate next iteration
-            mask = np.abs(Z) <= 2
-            Z[mask] = Z[mask] ** 2 + C[mask]
-            iterations[mask] = i
+    def _mandelbrot(
+        self,
+        max_iter: int,
+        zoom: float,
+        center_x: float,
+        center_y: float,
+        rows: slice = slice(None),
+    ) -> np.ndarray:
+        """Generate Mandelbrot set (normalized iterations for a band of rows)."""
+        cr, ci = self._plane(zoom, center_x, center_y, rows)
 
-        # Normalize iterations to 0-1 range for color mapping
-        normalized_iterations = iterations / max_iter
+        # The main cardioid and period-2 bulb never escape
+        skip = _in_main_bulbs(cr, ci) if self.params.get("early_out", True) else None
 
-        return self.interpolate_from_t_grid(normalized_iterations)
+        return self._iterate(
+            np.zeros_like(cr), np.zeros_like(ci), cr, ci, max_iter, skip=skip
+        )
 
     def _julia(
         self,
@@ -72,64 +235,28 @@ class FractalGenerator(BaseGenerator):
         center_y: float,
         c_real: float,
         c_imag: float,
+        rows: slice = slice(None),
     ) -> np.ndarray:
-        """Generate Julia set."""
-
-        # Define complex plane bounds
-        width_bound = 2.0 / zoom
-        height_bound = 2.0 / zoom
-
-        # Create coordinate arrays
-        x = np.linspace(center_x - width_bound, center_x + width_bound, self.width)
-        y = np.linspace(center_y - height_bound, center_y + height_bound, self.height)
-        X, Y = np.meshgrid(x, y)
-
-        # Create complex plane
-        Z = X + 1j * Y
-        C = complex(c_real, c_imag)
-
-        # Iteration counts
-        iterations = np.zeros(Z.shape, dtype=int)
-
-        for i in range(max_iter):
-            # Calculate next iteration
-            mask = np.abs(Z) <= 2
-            Z[mask] = Z[mask] ** 2 + C
-            iterations[mask] = i
-
-        # Normalize iterations to 0-1 range for color mapping
-        normalized_iterations = iterations / max_iter
-
-        return self.interpolate_from_t_grid(normalized_iterations)
+        """Generate Julia set (normalized iterations for a band of rows)."""
+        zr, zi = self._plane(zoom, center_x, center_y, rows)
+        return self._iterate(
+            zr,
+            zi,
+            np.full_like(zr, c_real),
+            np.full_like(zi, c_imag),
+            max_iter,
+        )
 
     def _burning_ship(
-        self, max_iter: int, zoom: float, center_x: float, center_y: float
+        self,
+        max_iter: int,
+        zoom: float,
+        center_x: float,
+        center_y: float,
+        rows: slice = slice(None),
     ) -> np.ndarray:
-        """Generate Burning Ship fractal."""
-
-        # Define complex plane bounds
-        width_bound = 2.0 / zoom
-        height_bound = 2.0 / zoom
-
-        # Create coordinate arrays
-        x = np.linspace(center_x - width_bound, center_x + width_bound, self.width)
-        y = np.linspace(center_y - height_bound, center_y + height_bound, self.height)
-        X, Y = np.meshgrid(x, y)
-
-        # Create complex plane
-        C = X + 1j * Y
-        Z = np.zeros_like(C)
-
-        # Iteration counts
-        iterations = np.zeros(C.shape, dtype=int)
-
-        for i in range(max_iter):
-            # Calculate next iteration (burning ship variation)
-            mask = np.abs(Z) <= 2
-            Z[mask] = (np.abs(Z[mask].real) + 1j * np.abs(Z[mask].imag)) ** 2 + C[mask]
-            iterations[mask] = i
-
-        # Normalize iterations to 0-1 range for color mapping
-        normalized_iterations = iterations / max_iter
-
-        return self.interpolate_from_t_grid(normalized_iterations)
+        """Generate Burning Ship fractal (normalized iterations for a band of rows)."""
+        cr, ci = self._plane(zoom, center_x, center_y, rows)
+        return self._iterate(
+            np.zeros_like(cr), np.zeros_like(ci), cr, ci, max_iter, burning_ship=True
+        )
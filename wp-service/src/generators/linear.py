@@ -10,18 +10,22 @@ from ..core.base import BaseGenerator
 class LinearGradientGenerator(BaseGenerator):
     """Generate linear gradients."""
 
+    tileable = True
+
     def generate(self) -> np.ndarray:
         """Generate a linear gradient."""
+        return self.render_t_field()
+
+    def t_field(self, rows: slice) -> np.ndarray:
+        """Position along the gradient direction for a band of rows."""
 
         # Parameters
         angle = self.params.get("angle", 0)  # Angle in degrees
-        center_x = self.params.get("center_x", 0.5)  # Center X (0-1)
-        center_y = self.params.get("center_y", 0.5)  # Center Y (0-1)
+        center_x = float(self.params.get("center_x", 0.5))  # Center X (0-1)
+        center_y = float(self.params.get("center_y", 0.5))  # Center Y (0-1)
 
         # Create coordinate arrays
-        x = np.linspace(0, 1, self.width)
-        y = np.linspace(0, 1, self.height)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.grid_vectors((0, 1), (0, 1), rows)
 
         # Adjust coordinates relative to center
         X_centered = X - center_x
@@ -29,16 +33,18 @@ class LinearGradientGenerator(BaseGenerator):
 
         # Apply rotation
         angle_rad = np.radians(angle)
-        cos_angle = np.cos(angle_rad)
-        sin_angle = np.sin(angle_rad)
+        cos_angle = float(np.cos(angle_rad))
+        sin_angle = float(np.sin(angle_rad))
 
         # Rotate coordinates
         X_rot = X_centered * cos_angle - Y_centered * sin_angle
 
-        # Normalize to 0-1 range
-        gradient_values = X_rot
-        gradient_values = (gradient_values - gradient_values.min()) / (
-            gradient_values.max() - gradient_values.min()
-        )
+        # Normalize to 0-1 range. A linear function peaks at the image corners,
+        # so the bounds come from those and are shared by every tile.
+        x_all, y_all = self.grid_vectors((0, 1), (0, 1))
+        corners = (x_all[:, [0, -1]] - center_x) * cos_angle - (
+            y_all[[0, -1], :] - center_y
+        ) * sin_angle
+        low, high = corners.min(), corners.max()
 
-        return self.interpolate_from_t_grid(gradient_values)
+        return (X_rot - low) / (high - low)
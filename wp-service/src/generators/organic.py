@@ -2,12 +2,19 @@
 Organic gradient generators for smooth, glass-like effects.
 """
 
+import itertools
+from collections.abc import Callable, Iterable
+
 import numpy as np
 from scipy import ndimage
 from scipy.ndimage import gaussian_filter
 
 from ..core.base import BaseGenerator
-from .perlin import PerlinNoiseGenerator
+from ..utils.noise import perlin_field
+
+# Rows of neighbours the grain filters and distortions read (film's widest
+# blur reaches 6 rows; professional grain shifts 2 rows, then blurs 4)
+_GRAIN_HALO = 8
 
 
 class OrganicGradientGenerator(BaseGenerator):
@@ -21,11 +28,9 @@ class OrganicGradientGenerator(BaseGenerator):
         flow_strength = self.params.get("flow_strength", 0.3)
         grain_intensity = self.params.get("grain_intensity", 0.05)
 
-        # Create base flow field using multiple octaves of noise
-        flow_field = self._create_flow_field(flow_strength)
-
-        # Create smooth color transitions
-        gradient_base = self._create_base_gradient(flow_field)
+        # Create smooth color transitions over a flow field built from
+        # multiple octaves of noise
+        gradient_base = self._create_base_gradient(flow_strength)
 
         # Apply smoothing for glass-like quality
         gradient_smooth = self._apply_smoothing(gradient_base, smoothness)
@@ -44,13 +49,13 @@ class OrganicGradientGenerator(BaseGenerator):
 
         return gradient_final
 
-    def _create_flow_field(self, strength: float) -> np.ndarray:
-        """Create organic flow field for natural movement."""
+    def _create_flow_field(
+        self, strength: float, rows: slice = slice(None)
+    ) -> np.ndarray:
+        """Create organic flow field for natural movement (for a band of rows)."""
 
         # Create multiple noise layers for organic flow
-        x = np.linspace(0, 4, self.width)
-        y = np.linspace(0, 4, self.height)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.grid_vectors((0, 4), (0, 4), rows)
 
         # Base flow - large scale movement
         flow1 = np.sin(X * 0.8) * np.cos(Y * 0.6)
@@ -68,50 +73,45 @@ class OrganicGradientGenerator(BaseGenerator):
 
         perlin_blend = float(self.params.get("organic_perlin_blend", 0.28))
         if perlin_blend > 0.0:
-            seed = int(self.params.get("seed", 42))
-            perlin = PerlinNoiseGenerator(
+            pn = perlin_field(
                 self.width,
                 self.height,
-                [(0, 0, 0), (255, 255, 255)],
                 scale=float(self.params.get("organic_perlin_scale", 2.4)),
                 octaves=int(self.params.get("organic_perlin_octaves", 3)),
                 persistence=0.55,
                 lacunarity=2.0,
-                seed=seed,
+                seed=int(self.params.get("seed", 42)),
+                rows=rows,
+                dtype=self.float_dtype,
             )
-            pn = perlin.raw_noise_values()
             pn = (pn - 0.5) * 2.0
             flow_field = (1.0 - perlin_blend) * flow_field + perlin_blend * pn
 
         return flow_field
 
-    def _create_base_gradient(self, flow_field: np.ndarray) -> np.ndarray:
+    def _create_base_gradient(self, flow_strength: float) -> np.ndarray:
         """Create base gradient with organic flow."""
 
-        # Create coordinate arrays
-        x = np.linspace(0, 1, self.width)
-        y = np.linspace(0, 1, self.height)
-        X, Y = np.meshgrid(x, y)
-
         # Base gradient direction with organic distortion
         base_angle = self.params.get("angle", 45)
         angle_rad = np.radians(base_angle)
+        cos_angle = float(np.cos(angle_rad))
+        sin_angle = float(np.sin(angle_rad))
 
-        # Apply flow field distortion
-        distorted_coords = (
-            X * np.cos(angle_rad) + Y * np.sin(angle_rad) + flow_field * 0.3
-        )
+        def distorted_coords(rows: slice) -> np.ndarray:
+            X, Y = self.grid_vectors((0, 1), (0, 1), rows)
+            flow_field = self._create_flow_field(flow_strength, rows)
+
+            # Apply flow field distortion
+            return X * cos_angle + Y * sin_angle + flow_field * 0.3
 
         # Normalize to 0-1 range
-        gradient_values = distorted_coords
-        gradient_values = (gradient_values - gradient_values.min()) / (
-            gradient_values.max() - gradient_values.min()
-        )
+        gradient_values = self.normalized_field(distorted_coords)
 
         # Apply easing for smoother transitions
-        gradient_values = self._apply_easing(gradient_values)
-
-        return self.interpolate_from_t_grid(gradient_values)
+        return self.interpolate_tiles(
+            lambda rows: self._apply_easing(gradient_values[rows])
+        )
 
     def _apply_easing(self, values: np.ndarray) -> np.ndarray:
         """Apply smooth easing for organic transitions."""
@@ -120,52 +120,114 @@ class OrganicGradientGenerator(BaseGenerator):
 
     def _apply_smoothing(self, gradient: np.ndarray, smoothness: float) -> np.ndarray:
         """Apply Gaussian smoothing for glass-like quality."""
-        smoothed = np.zeros_like(gradient)
-
-        for channel in range(3):
-            smoothed[:, :, channel] = gaussian_filter(
-                gradient[:, :, channel], sigma=smoothness, mode="reflect"
-            )
-
-        return smoothed
+        return self.smooth_channels(gradient, smoothness, mode="reflect")
 
     def _add_grain(self, gradient: np.ndarray, intensity: float) -> np.ndarray:
         """Add sophisticated grain texture with multiple types."""
         if intensity <= 0:
             return gradient
 
+        # Per-pixel noise averages out when a render is scaled down
+        intensity *= self.pixel_scale
+
         grain_type = self.params.get("grain_type", "photographic")
+        add_grain = {
+            "film": self._add_film_grain,
+            "photographic": self._add_photographic_grain,
+            "digital": self._add_digital_noise,
+            "artistic": self._add_artistic_grain,
+        }.get(grain_type, self._add_photographic_grain)  # Default: photographic
 
-        if grain_type == "film":
-            return self._add_film_grain(gradient, intensity)
-        elif grain_type == "photographic":
-            return self._add_photographic_grain(gradient, intensity)
-        elif grain_type == "digital":
-            return self._add_digital_noise(gradient, intensity)
-        elif grain_type == "artistic":
-            return self._add_artistic_grain(gradient, intensity)
-        else:
-            return self._add_photographic_grain(gradient, intensity)  # Default
-
-    def _add_film_grain(self, gradient: np.ndarray, intensity: float) -> np.ndarray:
-        """Add film grain texture for vintage look."""
+        if self.low_memory:
+            return self._grain_tiles(gradient, intensity, add_grain)
+
+        rng = self._rng()
+        rows = slice(0, self.height)
+        return add_grain(gradient, intensity, rows, self._grain_noise(rng, rows))
+
+    def _grain_noise(
+        self, rng: np.random.Generator, rows: slice, tiled: bool = False
+    ) -> Callable[[float], np.ndarray]:
+        """
+        Noise source for grain over a band of rows.
+
+        Each call returns the next noise layer for the band, scaled by its
+        argument: straight from ``rng`` for a full frame, or from
+        ``tile_noise`` (one field per layer) when tiled.
+        """
+        shape = (rows.stop - rows.start, self.width)
+        if not tiled:
+            return lambda scale: rng.normal(0, scale, shape)
+
+        fields = itertools.count()
+        return lambda scale: (
+            self.tile_noise(rng, next(fields), rows) * np.float32(scale)
+        )
+
+    def _grain_tiles(
+        self,
+        gradient: np.ndarray,
+        intensity: float,
+        add_grain: Callable[..., np.ndarray],
+    ) -> np.ndarray:
+        """
+        Low-memory grain, added in place one row tile at a time.
+
+        Each tile is grained from a band padded with _GRAIN_HALO rows, so the
+        grain filters and distortions see the same neighbours as a full-frame
+        pass, and its noise comes from ``tile_noise``.
+        """
         rng = self._rng()
+        grainy = np.asarray(gradient, dtype=np.float32)
+        # Original values of the rows above the current tile (already grained)
+        above = grainy[:0]
+        for rows in self.row_tiles():
+            top = rows.start - len(above)
+            bottom = min(rows.stop + _GRAIN_HALO, self.height)
+            band = np.concatenate([above, grainy[rows.start : bottom]])
+            above = band[max(rows.stop - _GRAIN_HALO, 0) - top : rows.stop - top]
+            above = above.copy()
+
+            band_rows = slice(top, bottom)
+            noise = self._grain_noise(rng, band_rows, tiled=True)
+            result = add_grain(band, intensity, band_rows, noise)
+            grainy[rows] = result[rows.start - top : rows.stop - top]
+        return grainy
+
+    def _distorted_coords(
+        self, rows: slice, flow_x: np.ndarray, flow_y: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Pixel coordinates of a band shifted by a flow, relative to the band."""
+        y_coords = np.arange(rows.start, rows.stop)[:, np.newaxis]
+        x_coords = np.arange(self.width)[np.newaxis, :]
+        distorted_x = np.clip(x_coords + flow_x, 0, self.width - 1)
+        distorted_y = np.clip(y_coords + flow_y, 0, self.height - 1) - rows.start
+        return distorted_y, distorted_x
+
+    def _add_film_grain(
+        self,
+        gradient: np.ndarray,
+        intensity: float,
+        rows: slice,
+        noise: Callable[[float], np.ndarray],
+    ) -> np.ndarray:
+        """Add film grain texture for vintage look."""
 
         # Create multiple grain layers with different sizes
         grain_layers = []
 
         # Fine grain
-        fine_grain = rng.normal(0, intensity * 0.3, (self.height, self.width))
+        fine_grain = noise(intensity * 0.3)
         fine_grain = gaussian_filter(fine_grain, sigma=0.3)
         grain_layers.append(fine_grain)
 
         # Medium grain
-        medium_grain = rng.normal(0, intensity * 0.5, (self.height, self.width))
+        medium_grain = noise(intensity * 0.5)
         medium_grain = gaussian_filter(medium_grain, sigma=0.8)
         grain_layers.append(medium_grain)
 
         # Coarse grain
-        coarse_grain = rng.normal(0, intensity * 0.2, (self.height, self.width))
+        coarse_grain = noise(intensity * 0.2)
         coarse_grain = gaussian_filter(coarse_grain, sigma=1.5)
         grain_layers.append(coarse_grain)
 
@@ -186,22 +248,23 @@ class OrganicGradientGenerator(BaseGenerator):
         return grainy
 
     def _add_photographic_grain(
-        self, gradient: np.ndarray, intensity: float
+        self,
+        gradient: np.ndarray,
+        intensity: float,
+        rows: slice,
+        noise: Callable[[float], np.ndarray],
     ) -> np.ndarray:
         """Add photographic grain for realistic texture."""
-        rng = self._rng()
 
         # Use professional grain if enabled
         if self.params.get("grain_quality", "standard") == "professional":
-            return self._add_professional_grain(gradient, intensity)
+            return self._add_professional_grain(gradient, intensity, rows, noise)
 
         # Create structured noise pattern
-        x = np.linspace(0, 10, self.width)
-        y = np.linspace(0, 10, self.height)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.grid_vectors((0, 10), (0, 10), rows)
 
         # Base random noise
-        base_noise = rng.normal(0, intensity, (self.height, self.width))
+        base_noise = noise(intensity)
 
         # Add subtle structure to noise
         structured_noise = base_noise * (1 + 0.1 * np.sin(X * 50) * np.cos(Y * 50))
@@ -212,9 +275,7 @@ class OrganicGradientGenerator(BaseGenerator):
         # Add color-dependent grain (slightly different per channel)
         grainy = gradient.copy()
         for channel in range(3):
-            channel_grain = grain + rng.normal(
-                0, intensity * 0.1, (self.height, self.width)
-            )
+            channel_grain = grain + noise(intensity * 0.1)
 
             # Make grain more visible in shadow and highlight areas
             brightness = gradient[:, :, channel] / 255.0
@@ -229,18 +290,19 @@ class OrganicGradientGenerator(BaseGenerator):
         return grainy
 
     def _add_professional_grain(
-        self, gradient: np.ndarray, intensity: float
+        self,
+        gradient: np.ndarray,
+        intensity: float,
+        rows: slice,
+        noise: Callable[[float], np.ndarray],
     ) -> np.ndarray:
         """Professional-grade grain system matching stock photo quality."""
-        rng = self._rng()
 
         # Multi-octave noise for realistic grain structure
-        grain_layers = np.zeros((self.height, self.width))
+        grain_layers = np.zeros(gradient.shape[:2], dtype=self.float_dtype)
 
         # Create coordinate system for Perlin-like noise
-        x = np.linspace(0, 8, self.width)
-        y = np.linspace(0, 8, self.height)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.grid_vectors((0, 8), (0, 8), rows)
 
         # Multiple grain frequencies (like Adobe Stock)
         frequencies = [1.0, 2.0, 4.0, 8.0, 16.0]
@@ -248,22 +310,23 @@ class OrganicGradientGenerator(BaseGenerator):
 
         for freq, amp in zip(frequencies, amplitudes, strict=False):
             # Create organic noise pattern
-            octave_noise = rng.normal(0, intensity * amp, (self.height, self.width))
+            octave_noise = noise(intensity * amp)
 
             # Add organic flow patterns
             flow_x = np.sin(X * freq * 0.1) * 2.0
             flow_y = np.cos(Y * freq * 0.1) * 2.0
 
-            # Distort the noise
-            y_coords, x_coords = np.ogrid[: self.height, : self.width]
-            distorted_x = np.clip(x_coords + flow_x, 0, self.width - 1)
-            distorted_y = np.clip(y_coords + flow_y, 0, self.height - 1)
+            # Distort the noise (x shifts by column, y by row)
+            distorted_y, distorted_x = self._distorted_coords(rows, flow_x, flow_y)
 
             try:
                 from scipy import ndimage
 
                 distorted_noise = ndimage.map_coordinates(
-                    octave_noise, [distorted_y, distorted_x], order=1, mode="reflect"
+                    octave_noise,
+                    np.broadcast_arrays(distorted_y, distorted_x),
+                    order=1,
+                    mode="reflect",
                 )
             except Exception:
                 distorted_noise = octave_noise
@@ -275,7 +338,7 @@ class OrganicGradientGenerator(BaseGenerator):
             grain_layers += distorted_noise
 
         # Apply luminance-adaptive grain distribution
-        grainy = gradient.copy().astype(float)
+        grainy = gradient.astype(self.float_dtype)
 
         for channel in range(3):
             # Calculate local luminance
@@ -292,7 +355,7 @@ class OrganicGradientGenerator(BaseGenerator):
             grain_visibility = shadow_boost + highlight_boost + midtone_suppress
 
             # Add color-dependent variations
-            color_variation = rng.normal(0, intensity * 0.05, (self.height, self.width))
+            color_variation = noise(intensity * 0.05)
             channel_grain = grain_layers + color_variation
 
             # Apply grain with visibility mapping
@@ -302,58 +365,66 @@ class OrganicGradientGenerator(BaseGenerator):
         # Add subtle color noise for realism
         color_noise_intensity = intensity * 0.03
         for channel in range(3):
-            color_noise = rng.normal(
-                0, color_noise_intensity, (self.height, self.width)
-            )
+            color_noise = noise(color_noise_intensity)
             color_noise = gaussian_filter(color_noise, sigma=0.8)
             grainy[:, :, channel] += color_noise * 255
 
         return np.clip(grainy, 0, 255).astype(np.uint8)
 
-    def _add_digital_noise(self, gradient: np.ndarray, intensity: float) -> np.ndarray:
+    def _add_digital_noise(
+        self,
+        gradient: np.ndarray,
+        intensity: float,
+        rows: slice,
+        noise: Callable[[float], np.ndarray],
+    ) -> np.ndarray:
         """Add clean digital noise."""
-        rng = self._rng()
 
         # Simple gaussian noise
-        noise = rng.normal(0, intensity, (self.height, self.width))
-        noise = gaussian_filter(noise, sigma=0.3)
+        grain = gaussian_filter(noise(intensity), sigma=0.3)
 
         grainy = gradient.copy()
         for channel in range(3):
-            grainy[:, :, channel] = np.clip(grainy[:, :, channel] + noise * 255, 0, 255)
+            grainy[:, :, channel] = np.clip(grainy[:, :, channel] + grain * 255, 0, 255)
 
         return grainy
 
-    def _add_artistic_grain(self, gradient: np.ndarray, intensity: float) -> np.ndarray:
+    def _add_artistic_grain(
+        self,
+        gradient: np.ndarray,
+        intensity: float,
+        rows: slice,
+        noise: Callable[[float], np.ndarray],
+    ) -> np.ndarray:
         """Add artistic grain with irregular patterns."""
-        rng = self._rng()
 
         # Create organic grain pattern
-        x = np.linspace(0, 8, self.width)
-        y = np.linspace(0, 8, self.height)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.grid_vectors((0, 8), (0, 8), rows)
 
         # Multiple noise octaves for complex texture
-        grain = np.zeros((self.height, self.width))
+        grain = np.zeros(gradient.shape[:2], dtype=self.float_dtype)
 
         for octave in range(4):
             freq = 2**octave
             amplitude = intensity / (2**octave)
 
-            octave_noise = rng.normal(0, amplitude, (self.height, self.width))
+            octave_noise = noise(amplitude)
             octave_noise = gaussian_filter(octave_noise, sigma=0.5 / freq)
 
             # Add organic movement
             flow_x = np.sin(X * freq * 0.5) * 0.1
             flow_y = np.cos(Y * freq * 0.5) * 0.1
 
-            # Distort the noise slightly
-            y_coords, x_coords = np.ogrid[: self.height, : self.width]
-            distorted_x = np.clip(x_coords + flow_x * 10, 0, self.width - 1)
-            distorted_y = np.clip(y_coords + flow_y * 10, 0, self.height - 1)
+            # Distort the noise slightly (x shifts by column, y by row)
+            distorted_y, distorted_x = self._distorted_coords(
+                rows, flow_x * 10, flow_y * 10
+            )
 
             distorted_noise = ndimage.map_coordinates(
-                octave_noise, [distorted_y, distorted_x], order=1, mode="reflect"
+                octave_noise,
+                np.broadcast_arrays(distorted_y, distorted_x),
+                order=1,
+                mode="reflect",
             )
 
             grain += distorted_noise
@@ -378,11 +449,11 @@ class GlassGradientGenerator(BaseGenerator):
         distortion_amount = self.params.get("distortion", 0.1)
         highlight_intensity = self.params.get("highlights", 0.3)
 
-        # Create base layers
-        layers = []
-        for i in range(transparency_layers):
-            layer = self._create_glass_layer(i, transparency_layers)
-            layers.append(layer)
+        # Create base layers (lazily, so only one is held at a time)
+        layers = (
+            self._create_glass_layer(i, transparency_layers)
+            for i in range(transparency_layers)
+        )
 
         # Blend layers with transparency
         result = self._blend_glass_layers(layers)
@@ -417,46 +488,46 @@ class GlassGradientGenerator(BaseGenerator):
         # Each layer has slightly different properties
         layer_offset = layer_index / total_layers
 
-        # Create coordinates
-        x = np.linspace(0, 1, self.width)
-        y = np.linspace(0, 1, self.height)
-        X, Y = np.meshgrid(x, y)
-
         # Create flowing pattern for this layer
         angle = self.params.get("angle", 45) + layer_offset * 30
         angle_rad = np.radians(angle)
+        cos_angle = float(np.cos(angle_rad))
+        sin_angle = float(np.sin(angle_rad))
 
-        # Add some organic movement
-        flow_x = np.sin(X * 3 + layer_offset * np.pi) * 0.1
-        flow_y = np.cos(Y * 3 + layer_offset * np.pi) * 0.1
+        def gradient_coords(rows: slice) -> np.ndarray:
+            # Create coordinates
+            X, Y = self.grid_vectors((0, 1), (0, 1), rows)
 
-        # Calculate gradient with flow
-        gradient_coords = (X + flow_x) * np.cos(angle_rad) + (Y + flow_y) * np.sin(
-            angle_rad
-        )
+            # Add some organic movement
+            flow_x = np.sin(X * 3 + layer_offset * np.pi) * 0.1
+            flow_y = np.cos(Y * 3 + layer_offset * np.pi) * 0.1
 
-        # Normalize
-        gradient_values = gradient_coords
-        gradient_values = (gradient_values - gradient_values.min()) / (
-            gradient_values.max() - gradient_values.min()
-        )
+            # Calculate gradient with flow
+            return (X + flow_x) * cos_angle + (Y + flow_y) * sin_angle
 
-        t = np.clip(gradient_values + layer_offset * 0.2, 0.0, 1.0)
-        return self.interpolate_from_t_grid(t)
+        # Normalize
+        gradient_values = self.normalized_field(gradient_coords)
 
-    def _blend_glass_layers(self, layers: list[np.ndarray]) -> np.ndarray:
-        """Blend glass layers with transparency."""
+        return self.interpolate_tiles(
+            lambda rows: np.clip(gradient_values[rows] + layer_offset * 0.2, 0.0, 1.0)
+        )
 
-        if not layers:
-            return np.zeros((self.height, self.width, 3))
+    def _blend_glass_layers(self, layers: Iterable[np.ndarray]) -> np.ndarray:
+        """Blend glass layers with transparency (accumulated in place)."""
 
-        result = layers[0].copy()
+        result = None
+        for i, layer in enumerate(layers):
+            if result is None:
+                result = layer.copy()
+                continue
 
-        for i, layer in enumerate(layers[1:], 1):
             # Each layer becomes more transparent
             alpha = 0.7 / (i + 1)
-            result = result * (1 - alpha) + layer * alpha
+            result *= 1 - alpha
+            result += layer * alpha
 
+        if result is None:
+            return np.zeros((self.height, self.width, 3))
         return result
 
     def _add_glass_effects(
@@ -466,53 +537,12 @@ class GlassGradientGenerator(BaseGenerator):
 
         result = gradient.copy()
 
-        if reflection > 0:
-            # Add sophisticated reflection effect
-            x = np.linspace(0, 1, self.width)
-            y = np.linspace(0, 1, self.height)
-            X, Y = np.meshgrid(x, y)
-
-            # Create multiple reflection layers for depth
-            reflection_pattern = (
-                np.sin(Y * np.pi * 2) * np.cos(X * np.pi * 1.5) * 0.4
-                + np.sin(Y * np.pi * 4) * np.cos(X * np.pi * 3) * 0.3
-                + np.sin(Y * np.pi * 6) * np.cos(X * np.pi * 4.5) * 0.3
-            )
-            reflection_pattern = (reflection_pattern + 1) / 2  # Normalize to 0-1
-
-            # Apply reflection with Fresnel-like falloff
-            fresnel = np.abs(np.cos(X * np.pi / 2))  # Stronger reflection at angles
-            reflection_pattern *= fresnel
-
-            # Apply reflection
-            for channel in range(3):
-                result[:, :, channel] += reflection_pattern * reflection * 35
-
-        if highlights > 0:
-            # Add multiple highlight sources for realism
-            highlight_positions = [(0.3, 0.2), (0.7, 0.8), (0.15, 0.6)]
-            intensities = [1.0, 0.6, 0.4]
-
-            for (hx, hy), intensity in zip(
-                highlight_positions, intensities, strict=False
-            ):
-                highlight_x = self.width * hx
-                highlight_y = self.height * hy
-
-                y_coords, x_coords = np.ogrid[: self.height, : self.width]
-                distance = np.sqrt(
-                    (x_coords - highlight_x) ** 2 + (y_coords - highlight_y) ** 2
-                )
-
-                # Create soft highlight with realistic falloff
-                highlight_size = min(self.width, self.height) * (0.25 + 0.1 * intensity)
-                highlight_mask = np.exp(-distance / highlight_size)
-
-                # Apply highlight with intensity variation
-                for channel in range(3):
-                    result[:, :, channel] += (
-                        highlight_mask * highlights * intensity * 45
-                    )
+        # Both effects are pointwise, so they are added one row tile at a time
+        for rows in self.row_tiles():
+            if reflection > 0:
+                self._add_reflection(result, rows, reflection)
+            if highlights > 0:
+                self._add_highlights(result, rows, highlights)
 
         # Add holographic effects if enabled
         if self.params.get("holographic", False):
@@ -520,16 +550,64 @@ class GlassGradientGenerator(BaseGenerator):
 
         return np.clip(result, 0, 255)
 
-    def _add_holographic_effect(self, gradient: np.ndarray) -> np.ndarray:
-        """Add holographic/iridescent shimmer effects like Freepik reference."""
-        import colorsys
+    def _add_reflection(
+        self, result: np.ndarray, rows: slice, reflection: float
+    ) -> None:
+        """Add the reflection effect to a band of rows in place."""
+
+        # Add sophisticated reflection effect
+        X, Y = self.grid_vectors((0, 1), (0, 1), rows)
+
+        # Create multiple reflection layers for depth
+        reflection_pattern = (
+            np.sin(Y * np.pi * 2) * np.cos(X * np.pi * 1.5) * 0.4
+            + np.sin(Y * np.pi * 4) * np.cos(X * np.pi * 3) * 0.3
+            + np.sin(Y * np.pi * 6) * np.cos(X * np.pi * 4.5) * 0.3
+        )
+        reflection_pattern = (reflection_pattern + 1) / 2  # Normalize to 0-1
+
+        # Apply reflection with Fresnel-like falloff
+        fresnel = np.abs(np.cos(X * np.pi / 2))  # Stronger reflection at angles
+        reflection_pattern *= fresnel
+
+        # Apply reflection
+        for channel in range(3):
+            result[rows, :, channel] += reflection_pattern * reflection * 35
+
+    def _add_highlights(
+        self, result: np.ndarray, rows: slice, highlights: float
+    ) -> None:
+        """Add soft highlights to a band of rows in place."""
 
-        result = gradient.copy().astype(float)
+        # Add multiple highlight sources for realism
+        highlight_positions = [(0.3, 0.2), (0.7, 0.8), (0.15, 0.6)]
+        intensities = [1.0, 0.6, 0.4]
 
-        # Create coordinate system
-        x = np.linspace(0, 1, self.width)
-        y = np.linspace(0, 1, self.height)
-        X, Y = np.meshgrid(x, y)
+        y_coords = np.arange(self.height, dtype=self.float_dtype)[rows, np.newaxis]
+        x_coords = np.arange(self.width, dtype=self.float_dtype)[np.newaxis, :]
+
+        for (hx, hy), intensity in zip(highlight_positions, intensities, strict=False):
+            highlight_x = self.width * hx
+            highlight_y = self.height * hy
+
+            distance = np.sqrt(
+                (x_coords - highlight_x) ** 2 + (y_coords - highlight_y) ** 2
+            )
+
+            # Create soft highlight with realistic falloff
+            highlight_size = min(self.width, self.height) * (0.25 + 0.1 * intensity)
+            highlight_mask = np.exp(-distance / highlight_size)
+
+            # Apply highlight with intensity variation
+            for channel in range(3):
+                result[rows, :, channel] += highlight_mask * highlights * intensity * 45
+
+    def _add_holographic_effect(self, gradient: np.ndarray) -> np.ndarray:
+        """Add holographic/iridescent shimmer effects like Freepik reference."""
+        # Create coordinate system (row/column vectors broadcast to the grid;
+        # float32 is plenty for these modulation fields)
+        X = np.linspace(0, 1, self.width, dtype=np.float32)[np.newaxis, :]
+        Y = np.linspace(0, 1, self.height, dtype=np.float32)[:, np.newaxis]
 
         # Create viewing angle simulation
         angle_factor = np.sqrt((X - 0.5) ** 2 + (Y - 0.5) ** 2)
@@ -540,43 +618,34 @@ class GlassGradientGenerator(BaseGenerator):
 
         red_shift = np.sin(X * np.pi * 3 + Y * np.pi * 2) * prism_offset
 
-        # Apply color shifting
-        for i in range(self.height):
-            for j in range(self.width):
-                # Convert to HSV for easier color manipulation
-                r, g, b = result[i, j] / 255.0
-                h, s, v = colorsys.rgb_to_hsv(r, g, b)
-
-                # Add iridescent hue shifting
-                hue_shift = (
-                    red_shift[i, j] * 0.1
-                    + np.sin(i * 0.02 + j * 0.02) * 0.05
-                    + angle_factor[i, j] * 0.08
-                )
-                h = (h + hue_shift) % 1.0
-
-                # Enhance saturation for holographic look
-                s = min(1.0, s * (1.0 + angle_factor[i, j] * 0.3))
-
-                # Add subtle brightness modulation
-                v = min(1.0, v * (1.0 + angle_factor[i, j] * 0.15))
+        # Iridescent hue shifting along pixel rows/columns
+        rows = np.arange(self.height, dtype=np.float32)[:, np.newaxis]
+        cols = np.arange(self.width, dtype=np.float32)[np.newaxis, :]
+        hue_shift = (
+            red_shift * 0.1
+            + np.sin(rows * 0.02 + cols * 0.02) * 0.05
+            + angle_factor * 0.08
+        )
 
-                # Convert back to RGB
-                r, g, b = colorsys.hsv_to_rgb(h, s, v)
-                result[i, j] = [r * 255, g * 255, b * 255]
+        # Enhance saturation for holographic look, with subtle brightness
+        # modulation
+        result = self.adjust_hsv(
+            gradient,
+            hue_shift=hue_shift,
+            saturation=1.0 + angle_factor * 0.3,
+            value=1.0 + angle_factor * 0.15,
+        )
 
         # Add spectral highlights
         spectral_intensity = self.params.get("holographic_intensity", 0.3)
         spectral_pattern = np.sin(X * np.pi * 8) * np.cos(Y * np.pi * 6)
         spectral_pattern = (spectral_pattern + 1) / 2
-        spectral_pattern *= angle_factor  # Stronger at center
+        spectral_pattern = spectral_pattern * angle_factor  # Stronger at center
 
-        # Apply spectral enhancement
-        for channel in range(3):
-            channel_boost = spectral_pattern * spectral_intensity * 40
-            result[:, :, channel] += channel_boost
+        # Apply spectral enhancement (same boost on every channel)
+        result += (spectral_pattern * (spectral_intensity * 40))[..., np.newaxis]
 
-        return np.clip(result, 0, 255)
+        return np.clip(result, 0, 255, out=result)
 
     def _apply_glass_distortion(
         self, gradient: np.ndarray, amount: float
@@ -586,10 +655,8 @@ class GlassGradientGenerator(BaseGenerator):
         if amount <= 0:
             return gradient
 
-        # Create distortion field
-        x = np.linspace(0, 4 * np.pi, self.width)
-        y = np.linspace(0, 4 * np.pi, self.height)
-        X, Y = np.meshgrid(x, y)
+        # Create distortion field (dx varies by row, dy by column)
+        X, Y = self.grid_vectors((0, 4 * np.pi), (0, 4 * np.pi))
 
         # Distortion vectors
         dx = np.sin(Y * 0.5) * amount * self.width * 0.02
@@ -598,40 +665,36 @@ class GlassGradientGenerator(BaseGenerator):
         # Apply distortion to each channel
         result = np.zeros_like(gradient)
 
-        for channel in range(3):
+        # Source rows sit at most |dy| away, so each tile samples from a band
+        # padded by that much (plus one row for the bilinear neighbour)
+        halo = int(np.ceil(np.abs(dy).max())) + 2
+        y_coords, x_coords = np.ogrid[: self.height, : self.width]
+        for rows in self.row_tiles():
+            top = max(rows.start - halo, 0)
+            bottom = min(rows.stop + halo, self.height)
+
             # Use map_coordinates for smooth distortion
-            y_coords, x_coords = np.ogrid[: self.height, : self.width]
-            distorted_x = np.clip(x_coords + dx, 0, self.width - 1)
-            distorted_y = np.clip(y_coords + dy, 0, self.height - 1)
+            distorted_x = np.clip(x_coords + dx[rows], 0, self.width - 1)
+            distorted_y = np.clip(y_coords[rows] + dy, 0, self.height - 1) - top
 
-            result[:, :, channel] = ndimage.map_coordinates(
-                gradient[:, :, channel],
-                [distorted_y, distorted_x],
-                order=1,
-                mode="reflect",
-            )
+            for channel in range(3):
+                result[rows, :, channel] = ndimage.map_coordinates(
+                    gradient[top:bottom, :, channel],
+                    [distorted_y, distorted_x],
+                    order=1,
+                    mode="reflect",
+                )
 
         return result
 
     def _add_glass_grain(self, gradient: np.ndarray, intensity: float) -> np.ndarray:
         """Add grain texture specifically for glass gradients."""
-        grain_type = self.params.get("grain_type", "photographic")
-
         # Create an instance of OrganicGradientGenerator to reuse grain methods
+        # (its _add_grain scales by pixel_scale and tiles under low_memory)
         temp_organic = OrganicGradientGenerator(
             self.width, self.height, self.colors, **self.params
         )
-
-        if grain_type == "film":
-            return temp_organic._add_film_grain(gradient, intensity)
-        elif grain_type == "photographic":
-            return temp_organic._add_photographic_grain(gradient, intensity)
-        elif grain_type == "digital":
-            return temp_organic._add_digital_noise(gradient, intensity)
-        elif grain_type == "artistic":
-            return temp_organic._add_artistic_grain(gradient, intensity)
-        else:
-            return temp_organic._add_photographic_grain(gradient, intensity)
+        return temp_organic._add_grain(gradient, intensity)
 
 
 class FluidGradientGenerator(BaseGenerator):
@@ -645,11 +708,8 @@ class FluidGradientGenerator(BaseGenerator):
         smoothness = self.params.get("smoothness", 4.0)
         color_bleeding = self.params.get("bleeding", 0.3)
 
-        # Create multiple flow fields
-        flow_fields = self._create_fluid_flows(flow_complexity)
-
-        # Create color distribution
-        color_field = self._create_color_field(flow_fields, color_bleeding)
+        # Create color distribution from multiple flow fields
+        color_field = self._create_color_field(flow_complexity, color_bleeding)
 
         # Apply heavy smoothing for paint-like quality
         result = self._apply_fluid_smoothing(color_field, smoothness)
@@ -664,15 +724,15 @@ class FluidGradientGenerator(BaseGenerator):
 
         return result
 
-    def _create_fluid_flows(self, complexity: float) -> list[np.ndarray]:
-        """Create multiple fluid flow fields."""
+    def _create_fluid_flows(
+        self, complexity: float, rows: slice = slice(None)
+    ) -> list[np.ndarray]:
+        """Create multiple fluid flow fields (for a band of rows)."""
 
         flows = []
         num_flows = int(complexity * 2) + 2
 
-        x = np.linspace(0, 2 * np.pi, self.width)
-        y = np.linspace(0, 2 * np.pi, self.height)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.grid_vectors((0, 2 * np.pi), (0, 2 * np.pi), rows)
 
         for i in range(num_flows):
             # Each flow has different frequency and phase
@@ -690,68 +750,46 @@ class FluidGradientGenerator(BaseGenerator):
 
         return flows
 
-    def _create_color_field(
-        self, flows: list[np.ndarray], bleeding: float
-    ) -> np.ndarray:
+    def _create_color_field(self, complexity: float, bleeding: float) -> np.ndarray:
         """Create color field from flow patterns."""
 
-        # Combine all flows
-        combined_flow = sum(flows)
-
-        # Normalize flow values
-        flow_normalized = (combined_flow - combined_flow.min()) / (
-            combined_flow.max() - combined_flow.min()
+        # Combine all flows and normalize flow values
+        flow_normalized = self.normalized_field(
+            lambda rows: sum(self._create_fluid_flows(complexity, rows))
         )
 
-        # Add color bleeding effect
-        if bleeding > 0:
-            # Create secondary color regions
-            x = np.linspace(0, 1, self.width)
-            y = np.linspace(0, 1, self.height)
-            X, Y = np.meshgrid(x, y)
+        def color_t(rows: slice) -> np.ndarray:
+            if bleeding <= 0:
+                return flow_normalized[rows]
+
+            # Add color bleeding effect: secondary color regions
+            X, Y = self.grid_vectors((0, 1), (0, 1), rows)
 
             # Create color bleeding pattern
             bleeding_pattern = np.sin(X * np.pi * 3) * np.cos(Y * np.pi * 2)
             bleeding_pattern = (bleeding_pattern + 1) / 2
 
             # Blend with main flow
-            flow_normalized = (
-                1 - bleeding
-            ) * flow_normalized + bleeding * bleeding_pattern
+            return (1 - bleeding) * flow_normalized[rows] + bleeding * bleeding_pattern
 
-        return self.interpolate_from_t_grid(flow_normalized)
+        return self.interpolate_tiles(color_t)
 
     def _apply_fluid_smoothing(
         self, gradient: np.ndarray, smoothness: float
     ) -> np.ndarray:
         """Apply heavy smoothing for fluid paint effect."""
 
-        result = gradient.copy()
-
+        result = gradient
         for _ in range(2):
-            for channel in range(3):
-                result[:, :, channel] = gaussian_filter(
-                    result[:, :, channel], sigma=smoothness, mode="reflect"
-                )
+            result = self.smooth_channels(result, smoothness, mode="reflect")
 
         return result
 
     def _add_fluid_grain(self, gradient: np.ndarray, intensity: float) -> np.ndarray:
         """Add grain texture specifically for fluid gradients."""
-        grain_type = self.params.get("grain_type", "photographic")
-
         # Create an instance of OrganicGradientGenerator to reuse grain methods
+        # (its _add_grain scales by pixel_scale and tiles under low_memory)
         temp_organic = OrganicGradientGenerator(
             self.width, self.height, self.colors, **self.params
         )
-
-        if grain_type == "film":
-            return temp_organic._add_film_grain(gradient, intensity)
-        elif grain_type == "photographic":
-            return temp_organic._add_photographic_grain(gradient, intensity)
-        elif grain_type == "digital":
-            return temp_organic._add_digital_noise(gradient, intensity)
-        elif grain_type == "artistic":
-            return temp_organic._add_artistic_grain(gradient, intensity)
-        else:
-            return temp_organic._add_photographic_grain(gradient, intensity)
+        return temp_organic._add_grain(gradient, intensity)
@@ -10,20 +10,24 @@ from ..core.base import BaseGenerator
 class RadialGradientGenerator(BaseGenerator):
     """Generate radial gradients."""
 
+    tileable = True
+
     def generate(self) -> np.ndarray:
         """Generate a radial gradient."""
+        return self.render_t_field()
+
+    def t_field(self, rows: slice) -> np.ndarray:
+        """Normalized distance from the center for a band of rows."""
 
         # Parameters
-        center_x = self.params.get("center_x", 0.5)  # Center X (0-1)
-        center_y = self.params.get("center_y", 0.5)  # Center Y (0-1)
+        center_x = float(self.params.get("center_x", 0.5))  # Center X (0-1)
+        center_y = float(self.params.get("center_y", 0.5))  # Center Y (0-1)
         inner_radius = self.params.get("inner_radius", 0.0)  # Inner radius (0-1)
         outer_radius = self.params.get("outer_radius", 1.0)  # Outer radius (0-1)
-        ellipse_ratio = self.params.get("ellipse_ratio", 1.0)  # Width/height ratio
+        ellipse_ratio = float(self.params.get("ellipse_ratio", 1.0))  # Width/height
 
         # Create coordinate arrays
-        x = np.linspace(0, 1, self.width)
-        y = np.linspace(0, 1, self.height)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.grid_vectors((0, 1), (0, 1), rows)
 
         # Calculate distances from center
         dx = X - center_x
@@ -31,14 +35,12 @@ class RadialGradientGenerator(BaseGenerator):
         distances = np.sqrt(dx**2 + dy**2)
 
         # Normalize distances to inner/outer radius range
-        max_distance = np.sqrt(
-            (0.5) ** 2 + (0.5 * ellipse_ratio) ** 2
+        max_distance = float(
+            np.sqrt((0.5) ** 2 + (0.5 * ellipse_ratio) ** 2)
         )  # Distance to corner
         normalized_distances = distances / max_distance
 
         # Apply inner and outer radius constraints
-        gradient_values = np.clip(
+        return np.clip(
             (normalized_distances - inner_radius) / (outer_radius - inner_radius), 0, 1
         )
-
-        return self.interpolate_from_t_grid(gradient_values)
@@ -10,25 +10,30 @@ from ..core.base import BaseGenerator
 class WaveGradientGenerator(BaseGenerator):
     """Generate gradients using wave functions."""
 
+    tileable = True
+
     def generate(self) -> np.ndarray:
         """Generate a wave-based gradient."""
+        return self.render_t_field()
+
+    def t_field(self, rows: slice) -> np.ndarray:
+        """Wave value in [0, 1] for a band of rows."""
 
         # Parameters
         wave_type = self.params.get("wave_type", "sine")
         frequency = self.params.get("frequency", 1.0)
-        amplitude = self.params.get("amplitude", 1.0)
-        phase = self.params.get("phase", 0.0)
+        amplitude = float(self.params.get("amplitude", 1.0))
+        phase = float(self.params.get("phase", 0.0))
         direction = self.params.get("direction", 0)  # 0=horizontal, 90=vertical
 
         # Create coordinate arrays
-        x = np.linspace(0, 2 * np.pi * frequency, self.width)
-        y = np.linspace(0, 2 * np.pi * frequency, self.height)
-        X, Y = np.meshgrid(x, y)
+        extent = (0, 2 * np.pi * frequency)
+        X, Y = self.grid_vectors(extent, extent, rows)
 
         # Apply direction rotation
         angle_rad = np.radians(direction)
-        cos_angle = np.cos(angle_rad)
-        sin_angle = np.sin(angle_rad)
+        cos_angle = float(np.cos(angle_rad))
+        sin_angle = float(np.sin(angle_rad))
 
         # Rotate coordinates
         coords = X * cos_angle + Y * sin_angle + phase
@@ -53,16 +58,47 @@ class WaveGradientGenerator(BaseGenerator):
         # Apply amplitude and normalize to 0-1 range
         wave_values = amplitude * wave_values
         wave_values = (wave_values + amplitude) / (2 * amplitude)
-        wave_values = np.clip(wave_values, 0, 1)
-
-        return self.interpolate_from_t_grid(wave_values)
+        return np.clip(wave_values, 0, 1)
 
 
 class InterferencePatternGenerator(BaseGenerator):
     """Generate gradients using wave interference patterns."""
 
+    tileable = True
+    _range: tuple[float, float] | None = None
+
     def generate(self) -> np.ndarray:
         """Generate an interference pattern gradient."""
+        return self.render_t_field()
+
+    def t_field(self, rows: slice) -> np.ndarray:
+        """Interference sum normalized over the whole image, for a band of rows."""
+        total_wave = self._wave_sum(rows)
+
+        # Normalize to 0-1 range (bounds of the full image, found in a first
+        # pass over the tiles when rendering tile by tile)
+        if rows == slice(0, self.height):
+            low, high = total_wave.min(), total_wave.max()
+        else:
+            low, high = self._wave_range()
+
+        if high != low:
+            return (total_wave - low) / (high - low)
+        return np.full_like(total_wave, 0.5)
+
+    def _wave_range(self) -> tuple[float, float]:
+        """Min and max of the interference sum over all tiles (cached)."""
+        if self._range is None:
+            lows, highs = [], []
+            for rows in self.row_tiles():
+                total_wave = self._wave_sum(rows)
+                lows.append(total_wave.min())
+                highs.append(total_wave.max())
+            self._range = (min(lows), max(highs))
+        return self._range
+
+    def _wave_sum(self, rows: slice) -> np.ndarray:
+        """Sum of the source waves for a band of rows."""
 
         # Parameters
         num_sources = self.params.get("num_sources", 3)
@@ -70,12 +106,10 @@ class InterferencePatternGenerator(BaseGenerator):
         amplitude = self.params.get("amplitude", 1.0)
 
         # Create coordinate arrays
-        x = np.linspace(0, 1, self.width)
-        y = np.linspace(0, 1, self.height)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.grid_vectors((0, 1), (0, 1), rows)
 
         # Initialize wave sum
-        total_wave = np.zeros_like(X)
+        total_wave = np.zeros((Y.shape[0], self.width), dtype=self.float_dtype)
 
         # Generate interference from multiple sources
         rng = self._rng()
@@ -91,34 +125,30 @@ class InterferencePatternGenerator(BaseGenerator):
             wave = amplitude * np.sin(2 * np.pi * frequency * distance)
             total_wave += wave
 
-        # Normalize to 0-1 range
-        if total_wave.max() != total_wave.min():
-            total_wave = (total_wave - total_wave.min()) / (
-                total_wave.max() - total_wave.min()
-            )
-        else:
-            total_wave = np.ones_like(total_wave) * 0.5
-
-        return self.interpolate_from_t_grid(total_wave)
+        return total_wave
 
 
 class SpiralWaveGenerator(BaseGenerator):
     """Generate gradients using spiral wave patterns."""
 
+    tileable = True
+
     def generate(self) -> np.ndarray:
         """Generate a spiral wave gradient."""
+        return self.render_t_field()
+
+    def t_field(self, rows: slice) -> np.ndarray:
+        """Spiral wave value in [0, 1] for a band of rows."""
 
         # Parameters
-        frequency = self.params.get("frequency", 1.0)
-        spiral_tightness = self.params.get("spiral_tightness", 1.0)
-        center_x = self.params.get("center_x", 0.5)
-        center_y = self.params.get("center_y", 0.5)
+        frequency = float(self.params.get("frequency", 1.0))
+        spiral_tightness = float(self.params.get("spiral_tightness", 1.0))
+        center_x = float(self.params.get("center_x", 0.5))
+        center_y = float(self.params.get("center_y", 0.5))
         clockwise = self.params.get("clockwise", True)
 
         # Create coordinate arrays
-        x = np.linspace(0, 1, self.width)
-        y = np.linspace(0, 1, self.height)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.grid_vectors((0, 1), (0, 1), rows)
 
         # Calculate polar coordinates from center
         dx = X - center_x
@@ -137,26 +167,28 @@ class SpiralWaveGenerator(BaseGenerator):
         wave_values = np.sin(spiral_coords)
 
         # Normalize to 0-1 range
-        wave_values = (wave_values + 1) / 2
-
-        return self.interpolate_from_t_grid(wave_values)
+        return (wave_values + 1) / 2
 
 
 class CylindricalWaveGenerator(BaseGenerator):
     """Generate gradients using cylindrical wave patterns."""
 
+    tileable = True
+
     def generate(self) -> np.ndarray:
         """Generate a cylindrical wave gradient."""
+        return self.render_t_field()
+
+    def t_field(self, rows: slice) -> np.ndarray:
+        """Cylindrical wave value in [0, 1] for a band of rows."""
 
         # Parameters
         frequency = self.params.get("frequency", 1.0)
         axis = self.params.get("axis", "vertical")  # 'vertical' or 'horizontal'
-        center = self.params.get("center", 0.5)  # Center position along the axis
+        center = float(self.params.get("center", 0.5))  # Center along the axis
 
         # Create coordinate arrays
-        x = np.linspace(0, 1, self.width)
-        y = np.linspace(0, 1, self.height)
-        X, Y = np.meshgrid(x, y)
+        X, Y = self.grid_vectors((0, 1), (0, 1), rows)
 
         # Calculate distance from the axis
         if axis == "vertical":
@@ -173,6 +205,4 @@ class CylindricalWaveGenerator(BaseGenerator):
         wave_values = np.sin(2 * np.pi * frequency * distance)
 
         # Normalize to 0-1 range
-        wave_values = (wave_values + 1) / 2
-
-        return self.interpolate_from_t_grid(wave_values)
+        return (wave_values + 1) / 2
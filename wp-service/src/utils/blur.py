@@ -0,0 +1,122 @@
+"""
+Gaussian blur over the spatial axes of channel-last images.
+
+Small sigmas run one exact ``scipy.ndimage.gaussian_filter`` call over all
+channels (sigma 0 on the channel axis). From ``FAST_SIGMA`` up, the image
+is box-averaged down by a factor that grows with sigma, blurred with the
+remaining sigma and linearly upsampled again: the box and the linear
+upsampling each widen the blur, so the low-res sigma is reduced to keep the
+total variance equal to sigma^2. The cost then stops growing with sigma,
+and for the heavy smoothing the organic and fluid generators use the
+result is within a couple of 8-bit levels of the exact filter.
+"""
+
+import math
+
+import numpy as np
+from scipy.ndimage import gaussian_filter
+
+# Smallest sigma (pixels) that takes the downsampled path
+FAST_SIGMA = 4.0
+
+
+def blur_factor(sigma: float, fast_sigma: float = FAST_SIGMA) -> int:
+    """Downsampling factor used for sigma (1 = exact filter)."""
+    if fast_sigma <= 0 or sigma < fast_sigma:
+        return 1
+    return max(2, int(sigma / 2.0))
+
+
+def blur_halo(sigma: float, fast_sigma: float = FAST_SIGMA) -> int:
+    """Rows of context a tile needs on each side for the same result."""
+    return int(4.0 * sigma + 0.5) + 2 * blur_factor(sigma, fast_sigma)
+
+
+def _along(axis: int, index: slice) -> tuple:
+    """Index tuple selecting index on one axis."""
+    return (slice(None),) * axis + (index,)
+
+
+def _downsample(array: np.ndarray, factor: int) -> np.ndarray:
+    """Box-average by factor over the first two axes (edges mirrored)."""
+    height, width = array.shape[:2]
+    pad_h = -height % factor
+    pad_w = -width % factor
+    if pad_h or pad_w:
+        pad = [(0, pad_h), (0, pad_w)] + [(0, 0)] * (array.ndim - 2)
+        array = np.pad(array, pad, mode="symmetric")
+
+    # Sums of strided views are much faster than a reduction over a
+    # reshaped block axis
+    rows = sum(array[i::factor] for i in range(factor))
+    small = sum(rows[:, j::factor] for j in range(factor))
+    small *= 1.0 / factor**2
+    return small
+
+
+def _upsample_axis(array: np.ndarray, axis: int, factor: int, size: int) -> np.ndarray:
+    """
+    Linearly interpolate pixel centers back to full resolution on one axis.
+
+    Output pixel q * factor + p sits at a fixed fractional offset from
+    input pixel q for each phase p, so every phase is one scalar-weighted
+    blend of two shifted views; edges repeat the outermost pixel.
+    """
+    pad = [(0, 0)] * array.ndim
+    pad[axis] = (1, 1)
+    padded = np.pad(array, pad, mode="edge")
+
+    shape = list(array.shape)
+    shape[axis] = size
+    result = np.empty(shape, dtype=array.dtype)
+    for phase in range(min(factor, size)):
+        count = len(range(phase, size, factor))
+        offset = (phase + 0.5) / factor - 0.5
+        start = math.floor(offset) + 1  # Index of the lower neighbour in padded
+        weight = offset - math.floor(offset)
+
+        out = result[_along(axis, slice(phase, None, factor))]
+        np.multiply(
+            padded[_along(axis, slice(start, start + count))], 1 - weight, out=out
+        )
+        out += padded[_along(axis, slice(start + 1, start + 1 + count))] * weight
+    return result
+
+
+def gaussian_blur(
+    array: np.ndarray,
+    sigma: float,
+    mode: str = "reflect",
+    fast_sigma: float = FAST_SIGMA,
+) -> np.ndarray:
+    """
+    Blur an (H, W) or (H, W, C) array over its first two axes.
+
+    Args:
+        array: Float image; channels (if any) last
+        sigma: Gaussian sigma in pixels
+        mode: Border mode passed to ``scipy.ndimage.gaussian_filter``
+        fast_sigma: Sigma from which to blur at reduced resolution
+            (0 always uses the exact filter)
+
+    Returns:
+        numpy.ndarray: Blurred array of the same shape and dtype
+    """
+    spatial = (sigma, sigma) + (0,) * (array.ndim - 2)
+    factor = blur_factor(sigma, fast_sigma)
+    if factor == 1:
+        return gaussian_filter(array, sigma=spatial, mode=mode)
+
+    # Box averaging adds (k^2 - 1) / 12 of variance and linear upsampling
+    # about k^2 / 6; the low-res blur supplies the rest
+    residual = sigma**2 - (factor**2 - 1) / 12.0 - factor**2 / 6.0
+    low_sigma = math.sqrt(max(residual, 0.0)) / factor
+
+    small = _downsample(array, factor)
+    small = gaussian_filter(
+        small, sigma=(low_sigma, low_sigma) + (0,) * (array.ndim - 2), mode=mode
+    )
+    # Widen columns first, while there are still few rows: writes strided
+    # along axis 1 are the slow ones
+    height, width = array.shape[:2]
+    return _upsample_axis(_upsample_axis(small, 1, factor, width), 0, factor, height)
@@ -216,7 +216,7 @@ def _linear_to_srgb_channel(c: np.ndarray) -> np.ndarray:
 
 
 def oklab_to_rgb8(lab: np.ndarray) -> np.ndarray:
-    """OKLab (..., 3) float to sRGB (..., 3) uint8."""
+    """OKLab (..., 3) float to sRGB (..., 3) 0–255, rounded, in the input's dtype."""
     L0 = lab[..., 0]
     A0 = lab[..., 1]
     B0 = lab[..., 2]
@@ -233,7 +233,7 @@ def oklab_to_rgb8(lab: np.ndarray) -> np.ndarray:
     sg = _linear_to_srgb_channel(np.clip(lg, 0.0, 1.0))
     sb = _linear_to_srgb_channel(np.clip(lb, 0.0, 1.0))
     rgb = np.stack([sr, sg, sb], axis=-1)
-    return np.clip(np.round(rgb * 255.0), 0, 255).astype(np.float64)
+    return np.clip(np.round(rgb * 255.0), 0, 255)
 
 
 def rgb8_to_oklab(rgb: np.ndarray) -> np.ndarray:
@@ -255,6 +255,60 @@ def rgb8_to_oklab(rgb: np.ndarray) -> np.ndarray:
     return np.stack([L, A, B], axis=-1)
 
 
+def rgb_to_hsv_array(rgb: np.ndarray) -> np.ndarray:
+    """
+    RGB (..., 3) in 0–1 to HSV (..., 3); matches ``colorsys.rgb_to_hsv``.
+
+    Computes in the input's float dtype (float32 stays float32).
+    """
+    rgb = np.asarray(rgb)
+    if not np.issubdtype(rgb.dtype, np.floating):
+        rgb = rgb.astype(np.float64)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+
+    v = np.maximum(np.maximum(r, g), b)
+    delta = v - np.minimum(np.minimum(r, g), b)
+    gray = delta == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = delta / v
+        inv = 1.0 / delta
+        # Hue in sixths: red max (g-b)/d, green max 2+(b-r)/d, blue max 4+(r-g)/d
+        h = np.where(g == v, 2.0 + (b - r) * inv, 4.0 + (r - g) * inv)
+        red_max = r == v
+        h[red_max] = ((g - b) * inv)[red_max]
+    h[h < 0] += 6.0
+    h[gray] = 0.0
+    s[gray] = 0.0
+    h /= 6.0
+    return np.stack([h, s, v], axis=-1)
+
+
+def hsv_to_rgb_array(hsv: np.ndarray) -> np.ndarray:
+    """
+    HSV (..., 3) to RGB (..., 3) in 0–1; matches ``colorsys.hsv_to_rgb``.
+
+    Hue must be in [0, 1). Computes in the input's float dtype.
+    """
+    hsv = np.asarray(hsv)
+    if not np.issubdtype(hsv.dtype, np.floating):
+        hsv = hsv.astype(np.float64)
+    h, s, v = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+
+    # Branch-free sector form: channel = v - v*s*clip(min(k, 4-k), 0, 1)
+    # with k = (6h + n) mod 6 and n = 5, 3, 1 for r, g, b
+    h6 = h * 6.0
+    vs = v * s
+    rgb = np.empty(hsv.shape, dtype=hsv.dtype)
+    for c, n in enumerate((5.0, 3.0, 1.0)):
+        k = h6 + n
+        k[k >= 6.0] -= 6.0
+        np.minimum(k, 4.0 - k, out=k)
+        np.clip(k, 0.0, 1.0, out=k)
+        k *= vs
+        np.subtract(v, k, out=rgb[..., c])
+    return rgb
+
+
 def min_oklab_pairwise_distance(colors: list[tuple[int, int, int]]) -> float:
     """Minimum Euclidean distance in OKLab between any two stops."""
     if len(colors) < 2:
@@ -0,0 +1,86 @@
+"""
+Image encoding for HTTP renders.
+
+Encoding a 4K render to PNG at Pillow's default zlib level 6 takes longer
+than many of the renders themselves, while level 1 is over twice as fast for
+about 3% more bytes on grainy images. Level 6 stays the default and callers
+opt into faster levels: ``compress_level`` is the zlib level for PNG and the
+method (0-6) for WebP, ``quality`` applies to JPEG (always Huffman-optimized)
+and WebP.
+"""
+
+import io
+
+import numpy as np
+from PIL import Image
+
+# Pillow format name and media type per output format
+_FORMATS = {
+    "png": ("PNG", "image/png"),
+    "jpeg": ("JPEG", "image/jpeg"),
+    "webp": ("WEBP", "image/webp"),
+}
+
+DEFAULT_COMPRESS_LEVEL = 6
+DEFAULT_QUALITY = 95
+
+
+def normalize_format(output_format: str) -> str:
+    """Canonical format name: png, jpeg or webp (unknown formats are png)."""
+    fmt = output_format.lower()
+    if fmt == "jpg":
+        return "jpeg"
+    return fmt if fmt in _FORMATS else "png"
+
+
+def media_type(output_format: str) -> str:
+    """Content type for an output format."""
+    return _FORMATS[normalize_format(output_format)][1]
+
+
+def encoding_options(
+    output_format: str,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    quality: int = DEFAULT_QUALITY,
+) -> dict:
+    """Encoder settings that change the output of a format (for cache keys)."""
+    fmt = normalize_format(output_format)
+    if fmt == "png":
+        return {"compress_level": compress_level}
+    if fmt == "jpeg":
+        return {"quality": quality}
+    return {"compress_level": min(compress_level, 6), "quality": quality}
+
+
+def encode_image(
+    array: np.ndarray,
+    output_format: str,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    quality: int = DEFAULT_QUALITY,
+) -> bytes:
+    """
+    Encode an (H, W, 3) uint8 image.
+
+    Args:
+        array: RGB pixels
+        output_format: png, jpg/jpeg or webp
+        compress_level: zlib level 0-9 for PNG; method 0-6 for WebP
+            (higher values are capped)
+        quality: JPEG/WebP quality 1-100
+
+    Returns:
+        bytes: Encoded image
+    """
+    fmt = normalize_format(output_format)
+    image = Image.fromarray(array)
+
+    if fmt == "png":
+        options = {"compress_level": compress_level}
+    elif fmt == "jpeg":
+        options = {"quality": quality, "optimize": True}
+    else:
+        options = {"quality": quality, "method": min(compress_level, 6)}
+
+    buf = io.BytesIO()
+    image.save(buf, format=_FORMATS[fmt][0], **options)
+    return buf.getvalue()
@@ -0,0 +1,228 @@
+"""
+Multi-octave Perlin noise shared by the noise-based generators.
+
+The classic formulation hashes every pixel's cell corners through the
+permutation table and picks a gradient with a chain of ``np.where`` calls.
+Here the corner hashes are folded into a per-seed lattice of gradient
+components once, so each corner is a single gather. Column and row terms
+(cell index, offset, fade) are computed per axis for all octaves up front,
+and the image is filled in bands of rows that accumulate every octave in
+reused scratch buffers while the band is still in cache. Full fields are
+memoized by their parameters in a byte-bounded LRU, so generators that
+share a noise field (or repeated renders of one seed) build it once.
+
+Output is identical to the per-pixel formulation for the same seed.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Lattice cells per axis before the noise repeats
+_PERIOD = 256
+
+# Rows filled per band (scratch buffers are this many rows wide)
+_BAND_ROWS = 64
+
+# Byte budget of memoized full fields
+_FIELD_CACHE_BYTES = 128 * 1024 * 1024
+
+# Gradient (x, y) for each hash & 3 of the permutation table
+_GRAD_X = np.array([1.0, -1.0, -1.0, -1.0])
+_GRAD_Y = np.array([1.0, 1.0, 1.0, -1.0])
+
+_fields: OrderedDict[tuple, np.ndarray] = OrderedDict()
+_fields_size = 0
+_fields_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=16)
+def gradient_lattice(seed: int, dtype: type = np.float64) -> tuple:
+    """
+    Gradient components at every lattice corner for a seed.
+
+    Returns:
+        Tuple of read-only (gx, gy) arrays of shape (257, 257), indexed
+        [cell_y, cell_x], covering the corners of all 256 x 256 cells
+    """
+    rng = np.random.default_rng(int(seed))
+    perm = np.arange(_PERIOD)
+    rng.shuffle(perm)
+    perm = np.concatenate([perm, perm])
+
+    corners = np.arange(_PERIOD + 1)
+    hashes = perm[perm[corners][np.newaxis, :] + corners[:, np.newaxis]] & 3
+
+    gx = _GRAD_X.astype(dtype)[hashes]
+    gy = _GRAD_Y.astype(dtype)[hashes]
+    gx.flags.writeable = False
+    gy.flags.writeable = False
+    return gx, gy
+
+
+def _axis_terms(coords: np.ndarray) -> tuple:
+    """Cell index, offset, offset - 1 and faded offset along one axis."""
+    floor = np.floor(coords)
+    cell = floor.astype(np.intp) & (_PERIOD - 1)
+    offset = coords - floor
+    fade = offset * offset * offset * (offset * (offset * 6 - 15) + 10)
+    return cell, offset, offset - 1, fade
+
+
+def _corner(
+    grad_x: np.ndarray,
+    grad_y: np.ndarray,
+    cell: np.ndarray,
+    dx: np.ndarray,
+    dy: np.ndarray,
+    out: np.ndarray,
+    tmp: np.ndarray,
+) -> np.ndarray:
+    """Dot product of corner gradients with the offset to each pixel."""
+    np.take(grad_x, cell, axis=1, out=out, mode="clip")
+    out *= dx
+    np.take(grad_y, cell, axis=1, out=tmp, mode="clip")
+    tmp *= dy
+    out += tmp
+    return out
+
+
+def _fill(
+    out: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    seed: int,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+) -> float:
+    """
+    Accumulate the octaves of noise at x (columns) and y (rows) into out.
+
+    Returns:
+        float: Sum of the octave amplitudes
+    """
+    grad_x, grad_y = gradient_lattice(seed, out.dtype.type)
+
+    layers = []
+    amplitude = 1.0
+    frequency = 1.0
+    max_amplitude = 0.0
+    for _ in range(octaves):
+        layers.append(
+            (amplitude, _axis_terms(x * frequency), _axis_terms(y * frequency))
+        )
+        max_amplitude += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+
+    band = min(_BAND_ROWS, len(y))
+    scratch = np.empty((5, band, len(x)), dtype=out.dtype)
+
+    for top in range(0, len(y), band):
+        rows = slice(top, min(top + band, len(y)))
+        n = rows.stop - rows.start
+        aa, ba, ab, bb, tmp = scratch[:, :n]
+        acc = out[rows]
+
+        for amplitude, (cx, fx, fx1, u), (cy, fy, fy1, v) in layers:
+            cy = cy[rows]
+            fy, fy1 = fy[rows, np.newaxis], fy1[rows, np.newaxis]
+            gx0, gy0 = grad_x[cy], grad_y[cy]
+            gx1, gy1 = grad_x[cy + 1], grad_y[cy + 1]
+
+            # Blend along x on the upper and lower cell edges, then along y
+            _corner(gx0, gy0, cx, fx, fy, aa, tmp)
+            _corner(gx0, gy0, cx + 1, fx1, fy, ba, tmp)
+            ba -= aa
+            ba *= u
+            ba += aa
+
+            _corner(gx1, gy1, cx, fx, fy1, ab, tmp)
+            _corner(gx1, gy1, cx + 1, fx1, fy1, bb, tmp)
+            bb -= ab
+            bb *= u
+            bb += ab
+
+            bb -= ba
+            bb *= v[rows, np.newaxis]
+            bb += ba
+
+            bb *= amplitude
+            acc += bb
+
+    return max_amplitude
+
+
+def perlin_field(
+    width: int,
+    height: int,
+    scale: float = 8.0,
+    octaves: int = 4,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+    seed: int = 42,
+    rows: slice = slice(None),
+    dtype: type = np.float64,
+) -> np.ndarray:
+    """
+    Fractal Perlin noise over a width x height grid spanning (0, scale).
+
+    Args:
+        width: Columns
+        height: Rows
+        scale: Lattice cells across the image at the first octave
+        octaves: Layers of noise
+        persistence: Amplitude factor between octaves
+        lacunarity: Frequency factor between octaves
+        seed: Seed of the permutation table
+        rows: Band of rows to return
+        dtype: Float type to compute in
+
+    Returns:
+        numpy.ndarray: Noise in [0, 1], shape (rows, width); full fields
+        come from a shared cache and are read-only
+    """
+    global _fields_size
+
+    band = range(height)[rows]
+    full = band.start == 0 and band.step == 1 and len(band) == height
+    key = (
+        int(seed),
+        float(scale),
+        int(octaves),
+        float(persistence),
+        float(lacunarity),
+        (height, width),
+        np.dtype(dtype).str,
+    )
+    if full:
+        with _fields_lock:
+            field = _fields.get(key)
+            if field is not None:
+                _fields.move_to_end(key)
+                return field
+
+    x = np.linspace(0, scale, width, dtype=dtype)
+    y = np.linspace(0, scale, height, dtype=dtype)[rows]
+
+    field = np.zeros((len(y), width), dtype=dtype)
+    if octaves > 0:
+        max_amplitude = _fill(field, x, y, seed, octaves, persistence, lacunarity)
+        field /= max_amplitude
+    field += 1
+    field /= 2
+    np.clip(field, 0, 1, out=field)
+
+    if full and field.nbytes <= _FIELD_CACHE_BYTES:
+        field.flags.writeable = False
+        with _fields_lock:
+            if key not in _fields:
+                _fields[key] = field
+                _fields_size += field.nbytes
+            while _fields_size > _FIELD_CACHE_BYTES:
+                _, evicted = _fields.popitem(last=False)
+                _fields_size -= evicted.nbytes
+    return field
@@ -0,0 +1,186 @@
+"""
+Content-addressed cache of encoded renders.
+
+Renders are deterministic in their inputs (generator type, colors,
+resolution, output format and the final params, which carry the seed), so
+the encoded image bytes are keyed by a SHA-256 of those inputs in
+canonical JSON. A byte-bounded in-memory LRU sits in front of an on-disk
+store that is trimmed oldest-first when it grows past its size limit.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .encode import normalize_format
+
+# Bump when generator output changes so stale renders are not served
+RENDER_CACHE_VERSION = 4
+
+
+def _canonical(value: Any) -> Any:
+    """JSON fallback for NumPy scalars/arrays and tuples in params."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Unhashable render input: {type(value).__name__}")
+
+
+def render_key(
+    gradient_type: str,
+    colors: list[tuple[int, int, int]],
+    resolution: str,
+    output_format: str,
+    params: dict,
+    encoding: dict | None = None,
+) -> str:
+    """Canonical hash of everything that determines a render's bytes."""
+    payload = {
+        "version": RENDER_CACHE_VERSION,
+        "type": gradient_type,
+        "colors": [[int(c) for c in color] for color in colors],
+        "resolution": resolution,
+        "format": normalize_format(output_format),
+        "encoding": encoding or {},
+        "params": params,
+    }
+    blob = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=_canonical
+    )
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+class RenderCache:
+    """Encoded renders in a memory LRU backed by a size-bounded directory."""
+
+    def __init__(
+        self,
+        directory: str | Path | None,
+        memory_bytes: int = 64 * 1024 * 1024,
+        disk_bytes: int = 1024 * 1024 * 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: On-disk store (None for memory only)
+            memory_bytes: Byte budget of the in-memory LRU
+            disk_bytes: Byte budget of the on-disk store
+        """
+        self.dir = Path(directory) if directory else None
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_size = 0
+        self._disk_size = 0
+        self._lock = threading.Lock()
+
+        if self.dir is not None:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            self._disk_size = sum(p.stat().st_size for p in self._disk_entries())
+
+    def _path(self, key: str) -> Path:
+        return self.dir / f"{key}.bin"
+
+    def _disk_entries(self) -> list[Path]:
+        return list(self.dir.glob("*.bin")) if self.dir is not None else []
+
+    def get(self, key: str) -> bytes | None:
+        """Get encoded bytes for a render key, or None on a miss."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return data
+
+        data = None
+        if self.dir is not None:
+            path = self._path(key)
+            try:
+                data = path.read_bytes()
+                os.utime(path)  # Recently used survives disk eviction
+            except OSError:
+                data = None
+
+        with self._lock:
+            if data is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["disk_hits"] += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store encoded bytes in memory and on disk."""
+        with self._lock:
+            self._remember(key, data)
+
+        if self.dir is None or len(data) > self.disk_bytes:
+            return
+
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            existed = path.exists()
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            if not existed:
+                self._disk_size += len(data)
+            if self._disk_size > self.disk_bytes:
+                self._evict_disk()
+
+    def _remember(self, key: str, data: bytes) -> None:
+        """Insert into the memory LRU (lock held)."""
+        if len(data) > self.memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+        self._memory[key] = data
+        self._memory_size += len(data)
+        while self._memory_size > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until under budget (lock held)."""
+        entries = []
+        for path in self._disk_entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        self._disk_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._disk_size <= self.disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._disk_size -= size
+
+    def summary(self) -> dict:
+        """Hit/miss counters and current sizes."""
+        with self._lock:
+            return {
+                **self.stats,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_size,
+                "disk_bytes": self._disk_size,
+            }
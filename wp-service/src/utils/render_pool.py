@@ -0,0 +1,158 @@
+"""
+Worker-process pool for rendering and encoding images.
+
+Generator code still has Python-level loops, so renders on server threads
+serialize on the GIL. RenderPool runs them in separate processes instead,
+admits at most ``workers + max_queue`` renders at a time (callers beyond
+that get RenderPoolBusy with a Retry-After estimate), and bounds how long
+a request waits for its render.
+"""
+
+import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .encode import DEFAULT_COMPRESS_LEVEL, DEFAULT_QUALITY, encode_image
+
+
+def render_to_bytes(
+    generator_cls: type,
+    width: int,
+    height: int,
+    colors: list[tuple[int, int, int]],
+    params: dict,
+    output_format: str,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    quality: int = DEFAULT_QUALITY,
+) -> tuple[bytes, dict[str, float]]:
+    """
+    Render a gradient and encode it (runs inside a worker process).
+
+    Returns:
+        Tuple of the encoded bytes and the render and encode times in seconds
+    """
+    started = time.perf_counter()
+    generator = generator_cls(width, height, colors, **params)
+    array = generator.to_array()
+    rendered = time.perf_counter()
+
+    data = encode_image(array, output_format, compress_level, quality)
+    timings = {
+        "render": rendered - started,
+        "encode": time.perf_counter() - rendered,
+    }
+    return data, timings
+
+
+class RenderPoolBusy(Exception):
+    """Raised when the render queue is full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Render queue full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class RenderPool:
+    """Bounded process pool with per-request timeouts."""
+
+    def __init__(self, workers: int, max_queue: int, timeout: float):
+        """
+        Initialize the pool (worker processes start on first use).
+
+        Args:
+            workers: Worker processes; 0 renders in the calling thread
+            max_queue: Renders allowed to wait beyond the busy workers
+            timeout: Seconds a request waits for its render
+        """
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.stats = {"completed": 0, "rejected": 0, "timed_out": 0, "failed": 0}
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0  # Submitted and not finished (incl. timed out)
+        self._avg_seconds = 1.0  # Moving average of render time
+        self._avg_encode_seconds = 0.0  # Moving average of the encoding part
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the executor on first use (lock held)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def retry_after(self) -> int:
+        """Seconds until a queue slot is likely to free up."""
+        waves = max(1.0, self._pending / max(self.workers, 1))
+        return min(60, max(1, math.ceil(self._avg_seconds * waves)))
+
+    def render(self, *args) -> tuple[bytes, dict[str, float]]:
+        """
+        Render via render_to_bytes in a worker and wait for the result.
+
+        Raises:
+            RenderPoolBusy: The queue is full
+            TimeoutError: The render did not finish within the timeout
+        """
+        if self.workers <= 0:
+            return render_to_bytes(*args)
+
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self.stats["rejected"] += 1
+                raise RenderPoolBusy(self.retry_after())
+            try:
+                future = self._get_executor().submit(render_to_bytes, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory); start a fresh pool
+                self._executor = None
+                future = self._get_executor().submit(render_to_bytes, *args)
+            self._pending += 1
+
+        started = time.monotonic()
+        future.add_done_callback(lambda f: self._finished(f, started))
+
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            # The worker keeps running; its slot frees when it finishes
+            with self._lock:
+                self.stats["timed_out"] += 1
+            raise
+
+    def _finished(self, future: Future, started: float) -> None:
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled() or future.exception() is not None:
+                self.stats["failed"] += 1
+                return
+            self.stats["completed"] += 1
+            elapsed = time.monotonic() - started
+            self._avg_seconds = 0.8 * self._avg_seconds + 0.2 * elapsed
+            encode = future.result()[1]["encode"]
+            self._avg_encode_seconds = 0.8 * self._avg_encode_seconds + 0.2 * encode
+
+    def shutdown(self) -> None:
+        """Stop worker processes, dropping queued renders."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def summary(self) -> dict:
+        """Pool size, queue depth and counters."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "avg_render_seconds": round(self._avg_seconds, 3),
+                "avg_encode_seconds": round(self._avg_encode_seconds, 3),
+                **self.stats,
+            }
@@ -0,0 +1,99 @@
+"""Golden tests for the array HSV helpers and the glass holographic effect."""
+
+import colorsys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.base import BaseGenerator
+from src.generators.organic import GlassGradientGenerator
+from src.utils.color_utils import hsv_to_rgb_array, rgb_to_hsv_array
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Largest allowed difference from the per-pixel colorsys reference (0-255)
+TOLERANCE = 3e-4
+
+
+class _Generator(BaseGenerator):
+    def generate(self) -> np.ndarray:
+        return np.zeros((self.height, self.width, 3))
+
+
+def _rgb_pixels(rng: np.random.Generator, n: int = 2000) -> np.ndarray:
+    """Random RGB in 0-1 plus grays, primaries and other hue-sector edges."""
+    edges = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [1.0, 1.0, 1.0],
+            [0.5, 0.5, 0.5],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0],
+            [1.0, 1.0, 0.0],
+            [0.0, 1.0, 1.0],
+            [1.0, 0.0, 1.0],
+            [0.2, 0.2, 0.9],
+            [0.9, 0.2, 0.2],
+        ]
+    )
+    return np.concatenate([edges, rng.random((n, 3))])
+
+
+def test_rgb_to_hsv_array_matches_colorsys():
+    rgb = _rgb_pixels(np.random.default_rng(0))
+
+    expected = np.array([colorsys.rgb_to_hsv(*p) for p in rgb])
+
+    np.testing.assert_allclose(rgb_to_hsv_array(rgb), expected, rtol=0, atol=1e-12)
+
+
+def test_hsv_to_rgb_array_matches_colorsys():
+    rng = np.random.default_rng(1)
+    hsv = rng.random((2000, 3))
+    # Sector boundaries of the hue circle
+    hsv[:7, 0] = np.arange(7) / 6 - np.array([0, 0, 0, 0, 0, 0, 1e-12])
+
+    expected = np.array([colorsys.hsv_to_rgb(*p) for p in hsv])
+
+    np.testing.assert_allclose(hsv_to_rgb_array(hsv), expected, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_adjust_hsv_matches_colorsys(dtype):
+    rng = np.random.default_rng(2)
+    height, width = 40, 30
+    image = (_rgb_pixels(rng, height * width - 11) * 255).reshape(height, width, 3)
+    hue_shift = rng.uniform(-0.5, 1.5, (height, width))
+    saturation = rng.uniform(0.5, 1.5, (height, width))
+    value = rng.uniform(0.5, 1.5, (height, width))
+
+    expected = np.empty((height, width, 3))
+    for i in range(height):
+        for j in range(width):
+            h, s, v = colorsys.rgb_to_hsv(*(image[i, j] / 255.0))
+            h = (h + hue_shift[i, j]) % 1.0
+            s = min(1.0, s * saturation[i, j])
+            v = min(1.0, v * value[i, j])
+            expected[i, j] = np.array(colorsys.hsv_to_rgb(h, s, v)) * 255
+
+    generator = _Generator(width, height, [(0, 0, 0), (255, 255, 255)])
+    result = generator.adjust_hsv(
+        image.astype(dtype), hue_shift=hue_shift, saturation=saturation, value=value
+    )
+
+    assert result.dtype == dtype
+    np.testing.assert_allclose(result, expected, rtol=0, atol=TOLERANCE)
+
+
+def test_holographic_effect_matches_golden():
+    """Output of the original per-pixel colorsys implementation."""
+    golden = np.load(FIXTURES / "holographic_effect.npz")
+    gradient, expected = golden["gradient"], golden["expected"]
+    height, width = gradient.shape[:2]
+
+    generator = GlassGradientGenerator(width, height, [(255, 0, 0), (0, 0, 255)])
+    result = generator._add_holographic_effect(gradient)
+
+    np.testing.assert_allclose(result, expected, rtol=0, atol=TOLERANCE)
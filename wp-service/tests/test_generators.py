@@ -0,0 +1,45 @@
+"""Smoke tests: every generator renders at a small size with grain enabled."""
+
+import numpy as np
+import pytest
+
+from src import generators
+
+GENERATORS = [getattr(generators, name) for name in generators.__all__]
+
+COLORS = [(20, 40, 90), (200, 120, 180), (250, 220, 160)]
+
+GRAIN_TYPES = ["film", "photographic", "digital", "artistic"]
+
+
+@pytest.mark.parametrize("low_memory", [False, True])
+@pytest.mark.parametrize("grain_type", GRAIN_TYPES)
+@pytest.mark.parametrize("generator", GENERATORS, ids=lambda cls: cls.__name__)
+def test_renders_with_grain(generator, grain_type, low_memory):
+    width, height = 48, 32
+    params = {
+        "seed": 7,
+        "grain_intensity": 0.05,
+        "grain_type": grain_type,
+        "low_memory": low_memory,
+        "tile_rows": 12,
+    }
+
+    array = generator(width, height, COLORS, **params).to_array()
+
+    assert array.shape == (height, width, 3)
+    assert array.dtype == np.uint8
+
+
+@pytest.mark.parametrize("generator", GENERATORS, ids=lambda cls: cls.__name__)
+def test_renders_professional_grain_preview(generator):
+    params = {
+        "seed": 7,
+        "grain_intensity": 0.05,
+        "grain_quality": "professional",
+        "reference_width": 192,
+    }
+
+    array = generator(48, 32, COLORS, **params).to_array()
+
+    assert array.shape == (32, 48, 3)